@@ -0,0 +1,423 @@
+"""
+PCM 오디오 결합 모듈
+- 클립 오디오를 디코딩한 PCM 그대로 목록에 모았다가 마지막에 한 번만 결합
+  (AudioSegment += 는 매번 전체 버퍼를 복사 → 긴 대본에서 O(n²))
+- 문장 뒤 쉬는 시간/문장 사이 무음도 PCM으로 추가 (MP3 디코딩/재인코딩 없음)
+- 결합 결과 하나를 MP3 저장(인코딩 1회), 비주얼라이저(float32 모노), 영상 결합(WAV)에 함께 사용
+- 긴 나레이션(수 시간)은 StreamingAudioWriter로 클립이 도착하는 대로 디스크 WAV에 이어 쓰고,
+  스펙트로그램/인코딩은 구간 단위로 읽어 메모리 사용량이 길이와 무관하게 일정
+
+사용 예:
+    assembler = AudioAssembler()
+    for seg in clip_segments:
+        assembler.add(seg)
+        assembler.add_silence(150)
+    audio = assembler.build()
+    audio.export_mp3(output_path)
+    y, sr = audio.samples_mono()
+
+    with StreamingAudioWriter(wav_path) as writer:
+        sink = OrderedClipWriter(writer)
+        sink.put(index, segment)  # 완료 순서와 상관없이 클립 순서대로 기록
+    streamed = writer.result
+    S = streamed.melspectrogram(n_mels=24)
+"""
+
+import io
+import os
+import wave
+import threading
+import subprocess
+
+import numpy as np
+
+READ_CHUNK_SECONDS = 30  # 구간 읽기 단위 (초)
+MEL_BLOCK_FRAMES = 4096  # 스펙트로그램 구간 계산 단위 (STFT 프레임 수)
+
+
+def _melspectrogram_blocks(mono_chunks, sr, n_fft, hop_length, n_mels, block_frames=MEL_BLOCK_FRAMES):
+    """
+    모노 샘플 구간들로 멜 스펙트로그램을 계산합니다.
+    librosa.feature.melspectrogram(y=전체, center=True)와 같은 결과 (앞뒤 n_fft/2 무음 패딩)
+    - 한 번에 block_frames 프레임만 STFT하므로 메모리가 길이와 무관
+    """
+    import librosa
+
+    half = n_fft // 2
+    buf = np.zeros(half, dtype=np.float32)
+    blocks = []
+
+    def _take(buf, final=False):
+        if len(buf) < n_fft:
+            return buf
+        frames = (len(buf) - n_fft) // hop_length + 1
+        if not final and frames < block_frames:
+            return buf
+        segment = buf[:(frames - 1) * hop_length + n_fft]
+        blocks.append(librosa.feature.melspectrogram(
+            y=segment, sr=sr, n_fft=n_fft, hop_length=hop_length, n_mels=n_mels, center=False
+        ))
+        return buf[frames * hop_length:]
+
+    for chunk in mono_chunks:
+        buf = _take(np.concatenate([buf, chunk]))
+    buf = _take(np.concatenate([buf, np.zeros(half, dtype=np.float32)]), final=True)
+
+    if not blocks:
+        return np.zeros((n_mels, 1), dtype=np.float32)
+    return np.concatenate(blocks, axis=1)
+
+
+def _pcm_to_mono(raw, channels, sample_width):
+    """PCM bytes → float32 모노 (-1.0 ~ 1.0)"""
+    dtype = {1: np.int8, 2: np.int16, 4: np.int32}.get(sample_width, np.int16)
+    samples = np.frombuffer(raw, dtype=dtype).astype(np.float32)
+    samples /= float(2 ** (8 * sample_width - 1))
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples
+
+
+def _silence_bytes(duration_ms, frame_rate, channels, sample_width):
+    frames = int(round(frame_rate * duration_ms / 1000.0))
+    return b"\0" * (frames * channels * sample_width)
+
+
+def decode_mp3(mp3_bytes):
+    """MP3 bytes를 AudioSegment(PCM)로 디코딩합니다."""
+    from pydub import AudioSegment
+    return AudioSegment.from_mp3(io.BytesIO(mp3_bytes))
+
+
+def with_pause(segment, pause_after_ms):
+    """AudioSegment 끝에 무음을 붙입니다 (PCM에서 바로, 인코딩 없음)."""
+    if not pause_after_ms or pause_after_ms <= 0:
+        return segment
+    return segment._spawn(segment.raw_data + _silence_bytes(
+        pause_after_ms, segment.frame_rate, segment.channels, segment.sample_width
+    ))
+
+
+class AssembledAudio:
+    """결합된 PCM 오디오 (raw bytes 하나 + 형식 + 클립별 위치)"""
+
+    def __init__(self, raw, frame_rate, channels, sample_width, clip_offsets, clip_durations):
+        self.raw = raw
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.clip_offsets = clip_offsets  # 클립별 시작 위치 (초)
+        self.clip_durations = clip_durations  # 클립별 길이 (초, 뒤 쉬는 시간 포함)
+        self._mono = None
+
+    @property
+    def frame_count(self):
+        return len(self.raw) // (self.channels * self.sample_width) if self.raw else 0
+
+    @property
+    def duration(self):
+        """전체 길이 (초)"""
+        return self.frame_count / float(self.frame_rate) if self.frame_rate else 0.0
+
+    def to_segment(self):
+        """같은 PCM을 사용하는 AudioSegment"""
+        from pydub import AudioSegment
+        return AudioSegment(data=self.raw, sample_width=self.sample_width,
+                            frame_rate=self.frame_rate, channels=self.channels)
+
+    def export_mp3(self, path, bitrate='192k'):
+        """MP3로 저장합니다 (인코딩 1회, bitrate=None이면 ffmpeg 기본값)."""
+        self.to_segment().export(path, format='mp3', bitrate=bitrate)
+        return path
+
+    def write_wav(self, path):
+        """WAV로 저장합니다 (인코딩 없음 - 영상 결합/외부 도구 입력용)."""
+        with wave.open(path, 'wb') as wf:
+            wf.setnchannels(self.channels)
+            wf.setsampwidth(self.sample_width)
+            wf.setframerate(self.frame_rate)
+            wf.writeframes(self.raw)
+        return path
+
+    def samples_mono(self):
+        """
+        비주얼라이저 분석용 float32 모노 샘플
+        (librosa.load(path, sr=None, mono=True)와 같은 값 - 파일을 다시 디코딩하지 않음)
+
+        Returns:
+            tuple: (y, sr)
+        """
+        if self._mono is None:
+            self._mono = _pcm_to_mono(self.raw, self.channels, self.sample_width)
+        return self._mono, self.frame_rate
+
+    def melspectrogram(self, n_fft=2048, hop_length=512, n_mels=128):
+        """비주얼라이저용 멜 스펙트로그램 (StreamedAudio와 같은 인터페이스)"""
+        import librosa
+        y, sr = self.samples_mono()
+        return librosa.feature.melspectrogram(y=y, sr=sr, n_fft=n_fft, hop_length=hop_length, n_mels=n_mels)
+
+
+class AudioAssembler:
+    """
+    클립 오디오를 순서대로 모아 한 번에 결합합니다.
+    클립마다 형식(샘플레이트/채널/샘플 크기)이 다르면 가장 높은 값으로 맞춥니다 (AudioSegment +와 동일).
+    """
+
+    def __init__(self):
+        self._items = []  # (종류, AudioSegment 또는 None, 뒤 무음 ms)
+        self.clip_count = 0
+
+    def add(self, segment, pause_after_ms=0):
+        """디코딩된 AudioSegment를 추가합니다 (pause_after_ms는 클립 길이에 포함)."""
+        self._items.append(('audio', segment, pause_after_ms or 0))
+        self.clip_count += 1
+        return self
+
+    def add_mp3(self, mp3_bytes, pause_after_ms=0):
+        """MP3 bytes를 디코딩해서 추가하고, 디코딩한 AudioSegment를 반환합니다."""
+        segment = decode_mp3(mp3_bytes)
+        self.add(segment, pause_after_ms)
+        return segment
+
+    def add_file(self, path, pause_after_ms=0):
+        """오디오 파일을 디코딩해서 추가하고, 디코딩한 AudioSegment를 반환합니다."""
+        from pydub import AudioSegment
+        segment = AudioSegment.from_file(path)
+        self.add(segment, pause_after_ms)
+        return segment
+
+    def add_silence(self, duration_ms):
+        """클립 사이 무음을 추가합니다 (클립 길이에는 포함되지 않음)."""
+        if duration_ms and duration_ms > 0:
+            self._items.append(('silence', None, duration_ms))
+        return self
+
+    def build(self):
+        """
+        모은 오디오를 한 번에 결합합니다.
+
+        Returns:
+            AssembledAudio
+        """
+        segments = [item[1] for item in self._items if item[0] == 'audio']
+        if segments:
+            frame_rate = max(seg.frame_rate for seg in segments)
+            channels = max(seg.channels for seg in segments)
+            sample_width = max(seg.sample_width for seg in segments)
+        else:
+            frame_rate, channels, sample_width = 24000, 1, 2
+
+        parts = []
+        clip_offsets = []
+        clip_durations = []
+        frame_size = channels * sample_width
+        position = 0  # 누적 바이트
+        for kind, segment, ms in self._items:
+            start = position
+            if kind == 'audio':
+                if (segment.frame_rate, segment.channels, segment.sample_width) != (frame_rate, channels, sample_width):
+                    segment = segment.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(sample_width)
+                parts.append(segment.raw_data)
+                position += len(segment.raw_data)
+            if ms:
+                silence = _silence_bytes(ms, frame_rate, channels, sample_width)
+                parts.append(silence)
+                position += len(silence)
+            if kind == 'audio':
+                clip_offsets.append(start / frame_size / float(frame_rate))
+                clip_durations.append((position - start) / frame_size / float(frame_rate))
+
+        return AssembledAudio(b"".join(parts), frame_rate, channels, sample_width, clip_offsets, clip_durations)
+
+
+class StreamedAudio:
+    """디스크 WAV에 기록된 오디오 (구간 단위로 읽기)"""
+
+    def __init__(self, path, frame_rate, channels, sample_width, frame_count, clip_offsets, clip_durations):
+        self.path = path
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.frame_count = frame_count
+        self.clip_offsets = clip_offsets  # 클립별 시작 위치 (초)
+        self.clip_durations = clip_durations  # 클립별 길이 (초, 뒤 쉬는 시간 포함)
+        self._mel = {}  # (n_fft, hop_length, n_mels) -> 스펙트로그램 (영상 비주얼라이저/투명 EQ가 공유)
+
+    @property
+    def duration(self):
+        """전체 길이 (초)"""
+        return self.frame_count / float(self.frame_rate) if self.frame_rate else 0.0
+
+    def iter_pcm(self, chunk_seconds=READ_CHUNK_SECONDS):
+        """PCM bytes를 chunk_seconds 단위로 읽습니다."""
+        chunk_frames = max(1, int(self.frame_rate * chunk_seconds))
+        with wave.open(self.path, 'rb') as wf:
+            while True:
+                data = wf.readframes(chunk_frames)
+                if not data:
+                    break
+                yield data
+
+    def iter_mono(self, chunk_seconds=READ_CHUNK_SECONDS):
+        """float32 모노 샘플을 chunk_seconds 단위로 읽습니다."""
+        for data in self.iter_pcm(chunk_seconds):
+            yield _pcm_to_mono(data, self.channels, self.sample_width)
+
+    def melspectrogram(self, n_fft=2048, hop_length=512, n_mels=128):
+        """
+        비주얼라이저용 멜 스펙트로그램 (구간 단위 계산 - 전체 샘플을 메모리에 올리지 않음)
+        같은 설정으로 다시 요청하면 계산해 둔 결과를 반환합니다.
+        """
+        key = (n_fft, hop_length, n_mels)
+        if key not in self._mel:
+            self._mel[key] = _melspectrogram_blocks(self.iter_mono(), self.frame_rate, n_fft, hop_length, n_mels)
+        return self._mel[key]
+
+    def export_mp3(self, path, bitrate='192k'):
+        """MP3로 저장합니다 (ffmpeg가 WAV 파일을 직접 읽어 인코딩)."""
+        cmd = ['ffmpeg', '-y', '-i', self.path, '-vn', '-codec:a', 'libmp3lame']
+        if bitrate:
+            cmd += ['-b:a', bitrate]
+        result = subprocess.run(
+            cmd + [path],
+            capture_output=True,
+            text=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"MP3 인코딩 실패: {result.stderr[-300:]}")
+        return path
+
+
+class StreamingAudioWriter:
+    """
+    클립 PCM을 도착하는 대로 디스크 WAV에 이어 씁니다 (메모리에는 현재 클립만).
+    형식은 첫 클립(또는 지정한 값)으로 정하고, 다른 형식의 클립은 변환해서 기록합니다.
+    """
+
+    def __init__(self, path, frame_rate=None, channels=None, sample_width=None):
+        self.path = path
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.clip_offsets = []
+        self.clip_durations = []
+        self.result = None
+        self._frames = 0
+        self._wav = None
+
+    def _open(self, segment=None):
+        if self._wav is not None:
+            return
+        self.frame_rate = self.frame_rate or (segment.frame_rate if segment else 24000)
+        self.channels = self.channels or (segment.channels if segment else 1)
+        self.sample_width = self.sample_width or (segment.sample_width if segment else 2)
+        self._wav = wave.open(self.path, 'wb')
+        self._wav.setnchannels(self.channels)
+        self._wav.setsampwidth(self.sample_width)
+        self._wav.setframerate(self.frame_rate)
+
+    def _write(self, raw):
+        if self.result is not None:
+            raise ValueError(f"이미 닫힌 오디오 파일입니다: {self.path}")
+        self._wav.writeframes(raw)
+        self._frames += len(raw) // (self.channels * self.sample_width)
+
+    def add(self, segment, pause_after_ms=0):
+        """디코딩된 AudioSegment를 기록합니다 (pause_after_ms는 클립 길이에 포함)."""
+        self._open(segment)
+        if (segment.frame_rate, segment.channels, segment.sample_width) != (self.frame_rate, self.channels, self.sample_width):
+            segment = segment.set_frame_rate(self.frame_rate).set_channels(self.channels).set_sample_width(self.sample_width)
+        start = self._frames
+        self._write(segment.raw_data)
+        if pause_after_ms and pause_after_ms > 0:
+            self._write(_silence_bytes(pause_after_ms, self.frame_rate, self.channels, self.sample_width))
+        self.clip_offsets.append(start / float(self.frame_rate))
+        self.clip_durations.append((self._frames - start) / float(self.frame_rate))
+        return self
+
+    def add_mp3(self, mp3_bytes, pause_after_ms=0):
+        """MP3 bytes를 디코딩해서 기록합니다."""
+        return self.add(decode_mp3(mp3_bytes), pause_after_ms)
+
+    def add_file(self, path, pause_after_ms=0):
+        """오디오 파일을 디코딩해서 기록합니다."""
+        from pydub import AudioSegment
+        return self.add(AudioSegment.from_file(path), pause_after_ms)
+
+    def add_silence(self, duration_ms):
+        """클립 사이 무음을 기록합니다 (클립 길이에는 포함되지 않음)."""
+        if duration_ms and duration_ms > 0:
+            self._open()
+            self._write(_silence_bytes(duration_ms, self.frame_rate, self.channels, self.sample_width))
+        return self
+
+    def close(self):
+        """
+        파일을 닫고 결과를 반환합니다.
+
+        Returns:
+            StreamedAudio
+        """
+        if self.result is None:
+            self._open()
+            self._wav.close()
+            self.result = StreamedAudio(self.path, self.frame_rate, self.channels, self.sample_width,
+                                        self._frames, self.clip_offsets, self.clip_durations)
+        return self.result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class OrderedClipWriter:
+    """
+    동시 합성으로 순서 없이 끝나는 클립을 원래 순서대로 기록합니다 (스레드 안전).
+    앞 클립을 기다리는 동안만 메모리에 보관하고, 기록한 클립은 바로 놓아줍니다.
+    close() 뒤에 도착한 클립은 버립니다 (취소/오류 후 늦게 끝난 합성).
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+        self._pending = {}
+        self._next = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def put(self, index, segment, pause_after_ms=0):
+        with self._lock:
+            if self._closed:
+                return
+            self._pending[index] = (segment, pause_after_ms)
+            self._drain()
+
+    def skip(self, index):
+        """건너뛸 클립 (합성 실패 등) - 뒤 클립이 기다리지 않도록 표시"""
+        with self._lock:
+            if self._closed:
+                return
+            self._pending[index] = None
+            self._drain()
+
+    def close(self):
+        """이후 클립은 받지 않고 writer를 닫습니다 (writer.close() 결과 반환)."""
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+            return self.writer.close()
+
+    def _drain(self):
+        while self._next in self._pending:
+            item = self._pending.pop(self._next)
+            if item is not None:
+                self.writer.add(*item)
+            self._next += 1
+
+    @property
+    def written(self):
+        return self._next
@@ -0,0 +1,311 @@
+"""
+오디오 길이 측정 모듈
+- MP3는 프레임 헤더만 읽어 길이 계산 (디코딩/ffprobe 프로세스 없음)
+- LAME/Info 헤더의 인코더 지연·패딩을 빼서 ffmpeg 디코딩 결과(len(AudioSegment))와 같은 샘플 수
+- WAV는 RIFF 헤더의 data 크기로 계산
+- 알 수 없는 형식만 ffprobe로 측정
+
+사용 예:
+    duration = audio_duration.probe_duration('clip.mp3')      # 초
+    duration = audio_duration.probe_duration(audio_bytes)     # bytes도 가능
+"""
+
+import os
+import struct
+import subprocess
+
+# MPEG 버전 비트 → (비트레이트 표 키, 샘플레이트 표)
+_VERSION_MPEG1 = 3
+_VERSION_MPEG2 = 2
+_VERSION_MPEG25 = 0
+
+_SAMPLE_RATES = {
+    _VERSION_MPEG1: (44100, 48000, 32000),
+    _VERSION_MPEG2: (22050, 24000, 16000),
+    _VERSION_MPEG25: (11025, 12000, 8000),
+}
+
+# kbps, 인덱스 0(free)과 15(금지)는 0
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448, 0),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384, 0),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256, 0),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0),
+}
+
+_ENCODER_TAGS = (b'LAME', b'Lavf', b'Lavc')  # 지연/패딩 값이 들어 있는 인코더 태그
+
+
+def _parse_frame_header(data, pos):
+    """
+    pos 위치의 MPEG 오디오 프레임 헤더를 해석합니다.
+
+    Returns:
+        tuple: (프레임 길이, 프레임당 샘플 수, 샘플레이트, MPEG1 여부, 모노 여부) - 헤더가 아니면 None
+    """
+    if pos + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[pos], data[pos + 1], data[pos + 2], data[pos + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)  # 1=Layer I, 2=Layer II, 3=Layer III
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    if version == 1 or layer == 4 or rate_index == 3:
+        return None
+    mpeg1 = version == _VERSION_MPEG1
+    bitrate = _BITRATES[(1 if mpeg1 else 2, layer)][bitrate_index] * 1000
+    if not bitrate:
+        return None  # free format은 길이를 알 수 없음
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+
+    if layer == 1:
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+        samples = 384
+    elif layer == 2 or mpeg1:
+        frame_length = 144 * bitrate // sample_rate + padding
+        samples = 1152
+    else:
+        frame_length = 72 * bitrate // sample_rate + padding
+        samples = 576
+    return frame_length, samples, sample_rate, mpeg1, (b3 >> 6) == 3
+
+
+def _skip_id3v2(data):
+    """앞쪽 ID3v2 태그 길이 (여러 개가 이어질 수도 있음)"""
+    pos = 0
+    while data[pos:pos + 3] == b'ID3' and pos + 10 <= len(data):
+        size = 0
+        for b in data[pos + 6:pos + 10]:
+            size = (size << 7) | (b & 0x7F)
+        footer = 10 if data[pos + 5] & 0x10 else 0
+        pos += 10 + size + footer
+    return pos
+
+
+def _read_info_tag(data, pos, header):
+    """
+    첫 프레임의 Xing/Info 헤더를 읽습니다.
+
+    Returns:
+        tuple: (Info 프레임 여부, 인코더 지연+패딩 샘플 수)
+    """
+    _, _, _, mpeg1, mono = header
+    if mpeg1:
+        offset = 4 + (17 if mono else 32)
+    else:
+        offset = 4 + (9 if mono else 17)
+    p = pos + offset
+    if data[p:p + 4] not in (b'Xing', b'Info'):
+        return False, 0
+
+    flags = struct.unpack('>I', data[p + 4:p + 8])[0] if p + 8 <= len(data) else 0
+    p += 8
+    for flag, size in ((1, 4), (2, 4), (4, 100), (8, 4)):  # 프레임 수, 바이트 수, TOC, 품질
+        if flags & flag:
+            p += size
+
+    # LAME 확장: 인코더 이름(9) + 버전/VBR(1) + 저역(1) + 리플레이게인(8) + 플래그(1) + 비트레이트(1) 뒤 지연/패딩(3)
+    if data[p:p + 4] in _ENCODER_TAGS and p + 24 <= len(data):
+        v = (data[p + 21] << 16) | (data[p + 22] << 8) | data[p + 23]
+        return True, (v >> 12) + (v & 0xFFF)
+    return True, 0
+
+
+def mp3_duration(data):
+    """
+    MP3 bytes의 길이(초)를 프레임 헤더만 읽어 계산합니다.
+
+    Returns:
+        float: 길이 (MP3가 아니면 None)
+    """
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    size = len(data)
+    pos = _skip_id3v2(data)
+
+    # 첫 프레임 찾기 (다음 프레임도 헤더가 맞아야 인정 - 우연한 0xFF 방지)
+    first = None
+    limit = min(size, pos + 64 * 1024)
+    while pos < limit:
+        header = _parse_frame_header(data, pos)
+        if header:
+            following = pos + header[0]
+            if following >= size or _parse_frame_header(data, following):
+                first = header
+                break
+        pos += 1
+    if first is None:
+        return None
+
+    sample_rate = first[2]
+    is_info, trim = _read_info_tag(data, pos, first)
+    if is_info:
+        pos += first[0]  # Info 프레임은 무음 프레임이라 디코딩 결과에 포함되지 않음
+
+    total_samples = 0
+    while pos + 4 <= size:
+        header = _parse_frame_header(data, pos)
+        if header is None:
+            # 끝의 ID3v1/APE 태그 또는 깨진 구간 - 다음 프레임 헤더를 찾아 계속
+            if data[pos:pos + 3] == b'TAG' or data[pos:pos + 8] == b'APETAGEX':
+                break
+            pos += 1
+            continue
+        frame_length, samples, rate = header[0], header[1], header[2]
+        if pos + frame_length > size:
+            break  # 잘린 마지막 프레임은 디코더도 버림
+        if rate == sample_rate:
+            total_samples += samples
+        pos += frame_length
+
+    total_samples = max(0, total_samples - trim)
+    return total_samples / float(sample_rate)
+
+
+def wav_duration(data, total_size=None):
+    """
+    WAV bytes의 길이(초)를 RIFF 헤더로 계산합니다 (헤더만 있으면 됨).
+
+    Args:
+        data: WAV bytes (앞부분만 있어도 됨)
+        total_size: 전체 파일 크기 - data 크기가 비어 있는 WAV에 사용 (기본: len(data))
+
+    Returns:
+        float: 길이 (WAV가 아니면 None)
+    """
+    if data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+        return None
+    pos = 12
+    block_align = sample_rate = None
+    while pos + 8 <= len(data):
+        chunk_id = bytes(data[pos:pos + 4])
+        chunk_size = struct.unpack('<I', data[pos + 4:pos + 8])[0]
+        if chunk_id == b'fmt ':
+            _, _, sample_rate, _, block_align = struct.unpack('<HHIIH', data[pos + 8:pos + 22])
+        elif chunk_id == b'data':
+            if not block_align or not sample_rate:
+                return None
+            if chunk_size in (0, 0xFFFFFFFF):
+                # 스트리밍 중 기록되어 크기가 비어 있는 경우
+                chunk_size = (len(data) if total_size is None else total_size) - pos - 8
+            return (chunk_size // block_align) / float(sample_rate)
+        pos += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _wav_file_duration(path):
+    """WAV 파일은 앞부분 헤더만 읽어서 계산"""
+    with open(path, 'rb') as f:
+        head = f.read(64 * 1024)
+    return wav_duration(head, os.path.getsize(path))
+
+
+def ffprobe_duration(path):
+    """ffprobe로 길이(초)를 측정합니다 (알 수 없는 형식용)."""
+    try:
+        result = subprocess.run(
+            [
+                'ffprobe', '-v', 'error',
+                '-show_entries', 'format=duration',
+                '-of', 'default=noprint_wrappers=1:nokey=1',
+                path
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        )
+        return float(result.stdout.strip())
+    except Exception as e:
+        print(f"[오디오 길이] ffprobe 측정 실패: {e}")
+        return None
+
+
+def probe_duration(source):
+    """
+    오디오 길이(초)를 반환합니다. MP3/WAV는 프로세스 없이 헤더만 읽고, 그 외는 ffprobe 사용.
+
+    Args:
+        source: 파일 경로 또는 오디오 bytes
+
+    Returns:
+        float: 길이 (측정 실패 시 None)
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        duration = wav_duration(source)
+        return duration if duration is not None else mp3_duration(source)
+
+    try:
+        with open(source, 'rb') as f:
+            head = f.read(12)
+        if head[:4] == b'RIFF' and head[8:12] == b'WAVE':
+            duration = _wav_file_duration(source)
+        else:
+            with open(source, 'rb') as f:
+                duration = mp3_duration(f.read())
+    except OSError as e:
+        print(f"[오디오 길이] 파일 읽기 실패: {e}")
+        return None
+
+    if duration is None:
+        duration = ffprobe_duration(source)
+    return duration
+
+
+def benchmark(paths):
+    """
+    같은 파일들을 이 모듈 / ffprobe / pydub 디코딩으로 측정해 속도와 오차를 비교합니다.
+
+    Returns:
+        dict: 방식별 {'seconds', 'perClipMs', 'maxErrorMs'} (사용할 수 없는 방식은 제외)
+    """
+    import time
+
+    def run(measure):
+        started = time.perf_counter()
+        durations = [measure(path) for path in paths]
+        elapsed = time.perf_counter() - started
+        return elapsed, durations
+
+    def pydub_duration(path):
+        from pydub import AudioSegment
+        return len(AudioSegment.from_file(path)) / 1000.0
+
+    elapsed, reference = run(probe_duration)
+    results = {'probe': {'seconds': round(elapsed, 3), 'perClipMs': round(elapsed / max(1, len(paths)) * 1000, 3)}}
+
+    for name, measure in (('ffprobe', ffprobe_duration), ('pydub', pydub_duration)):
+        try:
+            elapsed, durations = run(measure)
+        except Exception as e:
+            print(f"[오디오 길이] {name} 측정 불가: {e}")
+            continue
+        errors = [abs(a - b) * 1000 for a, b in zip(reference, durations) if a is not None and b is not None]
+        results[name] = {
+            'seconds': round(elapsed, 3),
+            'perClipMs': round(elapsed / max(1, len(paths)) * 1000, 3),
+            'maxErrorMs': round(max(errors), 2) if errors else None
+        }
+    return results
+
+
+if __name__ == '__main__':
+    # 사용: python audio_duration.py [폴더]  (기본: TTS 캐시 폴더의 MP3 최대 300개)
+    import sys
+    if len(sys.argv) > 1:
+        folder = sys.argv[1]
+    else:
+        from tts_cache import TTS_CACHE_DIR
+        folder = TTS_CACHE_DIR
+    files = []
+    for root, _, names in os.walk(folder):
+        files.extend(os.path.join(root, name) for name in names if name.lower().endswith(('.mp3', '.wav')))
+    files = sorted(files)[:300]
+    print(f"[오디오 길이] {len(files)}개 파일 측정")
+    for name, stats in benchmark(files).items():
+        print(f"  {name:8s} {stats}")
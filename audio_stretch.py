@@ -0,0 +1,99 @@
+"""
+오디오 속도 변환 모듈 (피치 유지)
+- speakingRate를 지원하지 않는 음성(Chirp3-HD)의 postSpeed를 합성 후에 적용
+- 작업의 모든 클립을 ffmpeg 한 번에 처리 (입력 여러 개 + 클립별 atempo 필터 + 출력 여러 개)
+  → 클립마다 ffmpeg 프로세스를 띄우지 않음, 결과는 클립별 atempo와 같음
+- 결과는 WAV(PCM)로 저장 - 어차피 병합할 때 디코딩하므로 MP3 재인코딩 생략
+
+사용 예:
+    ok = audio_stretch.stretch_batch([(in_path, out_path, 0.9), ...])
+"""
+
+import os
+import shutil
+import subprocess
+
+MAX_CLIPS_PER_PROCESS = 64  # ffmpeg 1회에 넣을 클립 수 (Windows 명령줄 길이 제한 대비)
+
+
+def atempo_filter(speed):
+    """
+    속도 배율을 atempo 필터 문자열로 변환합니다.
+    atempo는 0.5 ~ 2.0 범위만 지원하므로 그 밖의 값은 여러 개를 이어 붙입니다.
+    """
+    chain = []
+    remaining = speed
+    while remaining < 0.5:
+        chain.append('atempo=0.5')
+        remaining *= 2
+    while remaining > 2.0:
+        chain.append('atempo=2.0')
+        remaining /= 2
+    chain.append(f'atempo={remaining:.4f}')
+    return ','.join(chain)
+
+
+def _run_ffmpeg(jobs):
+    """jobs 전체를 ffmpeg 한 번으로 변환합니다. 성공 여부 반환."""
+    cmd = ['ffmpeg', '-y', '-hide_banner', '-loglevel', 'error']
+    for input_path, _, _ in jobs:
+        cmd += ['-i', input_path]
+
+    graph = ';'.join(f'[{i}:a]{atempo_filter(speed)}[a{i}]' for i, (_, _, speed) in enumerate(jobs))
+    cmd += ['-filter_complex', graph]
+    for i, (_, output_path, _) in enumerate(jobs):
+        cmd += ['-map', f'[a{i}]', '-vn', output_path]
+
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=60 + 5 * len(jobs),
+            encoding='utf-8',
+            errors='replace',
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        )
+    except Exception as e:
+        print(f"[ERROR] FFmpeg 속도 변환 오류: {e}")
+        return False
+    if result.returncode != 0:
+        print(f"[ERROR] FFmpeg 속도 변환 실패: {result.stderr[-500:]}")
+        return False
+    return True
+
+
+def stretch_batch(jobs, max_per_process=MAX_CLIPS_PER_PROCESS):
+    """
+    여러 클립의 속도를 한꺼번에 변환합니다.
+
+    Args:
+        jobs: [(입력 경로, 출력 경로, 속도 배율), ...]
+        max_per_process: ffmpeg 1회에 처리할 최대 클립 수
+
+    Returns:
+        list: 클립별 성공 여부 (jobs 순서)
+    """
+    results = [False] * len(jobs)
+    pending = []
+    for i, (input_path, output_path, speed) in enumerate(jobs):
+        if speed == 1.0:
+            # 속도 변환 필요 없음 - 파일 복사
+            shutil.copy(input_path, output_path)
+            results[i] = True
+        else:
+            pending.append(i)
+
+    for start in range(0, len(pending), max_per_process):
+        batch = pending[start:start + max_per_process]
+        if _run_ffmpeg([jobs[i] for i in batch]):
+            for i in batch:
+                results[i] = True
+        elif len(batch) > 1:
+            # 한 클립이 깨져도 나머지는 변환되도록 개별 처리
+            for i in batch:
+                results[i] = _run_ffmpeg([jobs[i]])
+
+    if pending:
+        print(f"[RoyStudio] 속도 변환 완료: {sum(results[i] for i in pending)}/{len(pending)}개 "
+              f"(ffmpeg {(len(pending) + max_per_process - 1) // max_per_process}회)")
+    return results
@@ -16,10 +16,10 @@ from urllib.parse import urlparse, parse_qs
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 import config
 from data_path import TOKEN_FILE, DATA_DIR
 import account_manager
+from youtube_service_pool import service_pool, build_youtube_service
 
 # OAuth 스코프 (구독 관리 + 댓글 조회 포함)
 SCOPES = [
@@ -271,6 +271,9 @@ def exchange_code_for_token(flow, code, account_id=None):
         with open(token_path, 'w') as token:
             token.write(creds.to_json())
 
+        # 새 토큰으로 서비스 등록 (이전 토큰으로 만든 서비스 교체)
+        service_pool.put(token_path, creds, on_refresh=lambda c: _save_token_file(token_path, c))
+
         print(f"[토큰] 저장 완료")
 
         return creds
@@ -281,6 +284,12 @@ def exchange_code_for_token(flow, code, account_id=None):
         return None
 
 
+def _save_token_file(token_path, creds):
+    """갱신된 토큰을 파일에 저장합니다."""
+    with open(token_path, 'w') as token:
+        token.write(creds.to_json())
+
+
 def get_authenticated_service(account_id=None):
     """
     OAuth 인증된 YouTube API 서비스를 반환합니다.
@@ -313,32 +322,16 @@ def get_authenticated_service(account_id=None):
     if not token_path:
         return None
 
-    creds = None
-
-    # 저장된 토큰 확인
-    if os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, SCOPES)
-
-    # 토큰이 없거나 유효하지 않으면 인증 진행
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            # 토큰 갱신
-            try:
-                creds.refresh(Request())
-                # 갱신된 토큰 저장
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
-            except Exception as e:
-                print(f"토큰 갱신 실패: {e}")
-                creds = None
-
-        if not creds:
-            # 새 로그인이 필요함 - None 반환하여 UI에서 수동 로그인 처리하도록 함
-            # (UI에서 start_login → complete_login 흐름 사용)
-            return None
+    def load_credentials():
+        # 저장된 토큰 확인
+        if os.path.exists(token_path):
+            return Credentials.from_authorized_user_file(token_path, SCOPES)
+        return None
 
-    # YouTube API 서비스 생성
-    return build('youtube', 'v3', credentials=creds)
+    # 계정별 서비스 풀에서 재사용 (없으면 생성, 토큰은 백그라운드에서 미리 갱신)
+    # 토큰이 없거나 갱신할 수 없으면 None - UI에서 수동 로그인 처리
+    # (UI에서 start_login → complete_login 흐름 사용)
+    return service_pool.get(token_path, load_credentials, on_refresh=lambda c: _save_token_file(token_path, c))
 
 
 def is_configured():
@@ -459,8 +452,7 @@ def authenticate_with_account_id(account_id, profile_name=None):
         # 7. YouTube 채널 정보로 사용자 정보 가져오기
         try:
             print(f"[인증] 사용자 정보 조회 시작...")
-            from googleapiclient.discovery import build
-            youtube_service = build('youtube', 'v3', credentials=creds)
+            youtube_service = build_youtube_service(creds)
 
             # 내 채널 정보 조회
             print(f"[인증] YouTube API 호출 중...")
@@ -575,8 +567,7 @@ def authenticate(profile_name=None):
         # 7. YouTube 채널 정보로 사용자 정보 가져오기
         try:
             print(f"[인증] 사용자 정보 조회 시작...")
-            from googleapiclient.discovery import build
-            youtube_service = build('youtube', 'v3', credentials=creds)
+            youtube_service = build_youtube_service(creds)
 
             # 내 채널 정보 조회
             print(f"[인증] YouTube API 호출 중...")
@@ -647,6 +638,9 @@ def logout(account_id=None):
         if not token_path:
             token_path = TOKEN_FILE
 
+    if token_path:
+        service_pool.discard(token_path)
+
     if token_path and os.path.exists(token_path):
         os.remove(token_path)
         return True
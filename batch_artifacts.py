@@ -0,0 +1,136 @@
+"""
+배치 작업 공유 산출물 모듈
+- 대본 하나로 영상/투명 EQ/MP3를 함께 만들 때 대본 파싱, TTS 합성, 스펙트로그램, SRT를 한 번만 만들고
+  모든 출력이 재사용 (출력마다 다시 합성하면 TTS 글자 수도 출력 수만큼 청구됨)
+- 각 산출물은 처음 요청될 때 만들어짐 (켜지 않은 출력에만 필요한 산출물은 만들지 않음)
+- 만들다 실패한 산출물은 같은 오류를 다시 전달 (다른 출력에서 다시 합성하지 않음)
+
+산출물 관계:
+    대본 → clips → audio (WAV + 클립 길이 + 단어 타이밍) ─┬→ 멜 스펙트로그램 (영상 비주얼라이저, 투명 EQ)
+                                                        ├→ SRT (영상, MP3)
+                                                        └→ MP3
+
+사용 예:
+    artifacts = JobArtifacts(app, job)
+    try:
+        services._execute_single_video_job(app, job, is_batch=True, artifacts=artifacts)
+        artifacts.export_mp3(mp3_path)
+        artifacts.write_srt(srt_path)
+    finally:
+        artifacts.cleanup()
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+
+
+def narration_settings(character_voices):
+    """
+    배치 탭의 characterVoices를 영상 제작용 narration_settings 형식으로 변환합니다.
+
+    Args:
+        character_voices: {캐릭터명: {'voice', 'rate', 'pitch'}}
+    """
+    settings = {}
+    for char_name, voice_settings in character_voices.items():
+        settings[char_name] = {
+            'voice': voice_settings.get('voice', 'ko-KR-Wavenet-A'),
+            'speed': voice_settings.get('rate', 1.0),
+            'pitch': voice_settings.get('pitch', 0.0),
+            'lang': 'ko-KR',
+            'group': 'Wavenet',
+            'volumeGain': 0,
+            'pauseAfter': 0
+        }
+    return settings
+
+
+class JobArtifacts:
+    """배치 작업 하나의 공유 산출물 (처음 요청될 때 만들고 이후에는 재사용)"""
+
+    def __init__(self, app, job, is_batch=True):
+        """
+        Args:
+            app: 로그/진행률/취소 이벤트를 가진 앱 객체
+            job: 영상 제작 작업 dict ('scriptPath', 'narration_settings', 'api_key_profile')
+        """
+        self.app = app
+        self.job = job
+        self.is_batch = is_batch
+        self._lock = threading.RLock()
+        self._temp_dir = None
+        self._clips = None
+        self._audio = None  # (StreamedAudio, 클립별 단어 타이밍)
+        self._audio_error = None
+        self._srt_path = None
+        self._mp3_path = None
+
+    def _path(self, name):
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp(prefix='batch_job_')
+        return os.path.join(self._temp_dir, name)
+
+    def clips(self):
+        """대본을 파싱한 클립 리스트"""
+        with self._lock:
+            if self._clips is None:
+                import studio_utils as utils
+                self._clips = utils.parse_script_clips(utils.read_script_file(self.job['scriptPath']))
+                self.app.log_message(f"[배치] 대본 파싱 완료: {len(self._clips)}개 클립")
+            return self._clips
+
+    def audio(self):
+        """
+        전체 나레이션 (한 번만 합성)
+
+        Returns:
+            tuple: (StreamedAudio, 클립별 단어 타이밍 리스트)
+        """
+        with self._lock:
+            if self._audio is None:
+                if self._audio_error is not None:
+                    raise self._audio_error
+                import studio_services as services
+                try:
+                    clips = self.clips()
+                    if not clips:
+                        raise ValueError('파싱된 클립이 없습니다.')
+                    self._audio = services.synthesize_clips_to_wav(
+                        self.app, self.job, clips, self._path('narration.wav'), self.is_batch
+                    )
+                except Exception as e:
+                    self._audio_error = e
+                    raise
+                self.app.log_message(f"[배치] 공유 오디오 생성 완료: {self._audio[0].duration:.2f}초 ({len(clips)}개 클립)")
+            return self._audio
+
+    def write_srt(self, path):
+        """실제 클립 길이와 단어 타이밍으로 만든 SRT를 path에 저장합니다 (생성은 한 번만)."""
+        with self._lock:
+            if self._srt_path is None:
+                import studio_services as services
+                audio, clip_timings = self.audio()
+                srt_path = self._path('subtitles.srt')
+                if not services.generate_srt_from_clips(self.clips(), audio.clip_durations, srt_path,
+                                                        app=self.app, clip_timings=clip_timings):
+                    raise RuntimeError('SRT 생성 실패')
+                self._srt_path = srt_path
+            shutil.copyfile(self._srt_path, path)
+        return path
+
+    def export_mp3(self, path, bitrate='192k'):
+        """나레이션을 MP3로 저장합니다 (인코딩은 한 번만, 이후에는 복사)."""
+        with self._lock:
+            if self._mp3_path is None:
+                audio, _ = self.audio()
+                self._mp3_path = audio.export_mp3(self._path('narration.mp3'), bitrate=bitrate)
+            shutil.copyfile(self._mp3_path, path)
+        return path
+
+    def cleanup(self):
+        """임시 파일 삭제 (작업의 모든 출력이 끝난 뒤 호출)"""
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
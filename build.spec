@@ -7,7 +7,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('web', 'web')],
-    hiddenimports=['bottle_websocket'],
+    hiddenimports=['bottle_websocket', 'studio_utils', 'studio_services'],  # 지연 로딩 모듈 (lazy_loader)
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
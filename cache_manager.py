@@ -3,19 +3,28 @@
 - 구독 목록, 채널 정보 캐싱
 - 캐시 만료 확인 (24시간)
 - 계정별 캐시 분리
+- 키워드 검색 결과 캐싱 (페이지 단위, TTL)
 """
 
 import os
 import json
+import hashlib
+import threading
 from datetime import datetime, timedelta
 from data_path import CACHE_DIR, ensure_cache_dir
 
 CACHE_EXPIRY_HOURS = 24
+SEARCH_CACHE_EXPIRY_MINUTES = 180  # 키워드 검색 결과는 조회수가 빨리 변하므로 짧게
 
 # 기본 캐시 파일 경로
 _BASE_SUBSCRIPTIONS_CACHE = os.path.join(CACHE_DIR, 'subscriptions.json')
 _BASE_CHANNELS_CACHE = os.path.join(CACHE_DIR, 'channels.json')
 _BASE_VIDEOS_CACHE = os.path.join(CACHE_DIR, 'videos.json')
+_SEARCH_CACHE_DIR = os.path.join(CACHE_DIR, 'search')
+
+# 키워드 검색 캐시 (메모리 + 디스크)
+_search_cache = {}
+_search_cache_lock = threading.Lock()
 
 # 현재 프리셋 OAuth 계정 ID (main.py에서 설정)
 _current_preset_account_id = None
@@ -159,6 +168,8 @@ def clear_all_cache():
         if os.path.exists(cache_file):
             os.remove(cache_file)
 
+    clear_search_cache()
+
     print("모든 캐시 삭제 완료")
 
 
@@ -200,3 +211,105 @@ def get_cache_info():
             info[name] = {'exists': False}
 
     return info
+
+
+# 키워드 검색 결과 캐시 (search.list 1회 = 100 유닛이므로 페이지 단위로 보관)
+def _get_search_cache_key(keyword, days_within, video_type):
+    """검색 조건으로 캐시 키를 생성합니다."""
+    raw = json.dumps([keyword.strip().lower(), int(days_within), video_type], ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _get_search_cache_path(cache_key):
+    """검색 캐시 파일 경로를 반환합니다."""
+    return os.path.join(_SEARCH_CACHE_DIR, f'{cache_key}.json')
+
+
+def _is_search_entry_valid(entry):
+    """검색 캐시 항목이 유효한지 확인합니다."""
+    try:
+        cached_time = datetime.fromisoformat(entry.get('cached_at', '2000-01-01'))
+        return datetime.now() < cached_time + timedelta(minutes=SEARCH_CACHE_EXPIRY_MINUTES)
+    except Exception:
+        return False
+
+
+def load_search_results(keyword, days_within, video_type):
+    """
+    캐시된 키워드 검색 결과를 불러옵니다.
+
+    Returns:
+        dict: {'cached_at': ..., 'publishedAfter': ..., 'pages': [{'videos': [...], 'nextPageToken': ...}, ...]}
+              또는 None (캐시 없음/만료)
+    """
+    cache_key = _get_search_cache_key(keyword, days_within, video_type)
+
+    with _search_cache_lock:
+        entry = _search_cache.get(cache_key)
+
+        if entry is None:
+            cache_file = _get_search_cache_path(cache_key)
+            if os.path.exists(cache_file):
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        entry = json.load(f)
+                except Exception:
+                    entry = None
+
+        if not entry or not _is_search_entry_valid(entry):
+            _search_cache.pop(cache_key, None)
+            return None
+
+        _search_cache[cache_key] = entry
+        return entry
+
+
+def save_search_page(keyword, days_within, video_type, page_index, videos, next_page_token, published_after):
+    """
+    키워드 검색 결과 한 페이지를 캐시에 저장합니다.
+    첫 페이지(page_index=0)를 저장하면 기존 페이지는 모두 교체됩니다.
+
+    Returns:
+        dict: 갱신된 캐시 항목
+    """
+    cache_key = _get_search_cache_key(keyword, days_within, video_type)
+
+    with _search_cache_lock:
+        entry = _search_cache.get(cache_key)
+        if page_index == 0 or not entry:
+            entry = {
+                'cached_at': datetime.now().isoformat(),
+                'keyword': keyword,
+                'days_within': int(days_within),
+                'video_type': video_type,
+                'publishedAfter': published_after,
+                'pages': []
+            }
+
+        pages = entry['pages'][:page_index]
+        pages.append({'videos': videos, 'nextPageToken': next_page_token})
+        entry['pages'] = pages
+        _search_cache[cache_key] = entry
+
+        try:
+            if not os.path.exists(_SEARCH_CACHE_DIR):
+                os.makedirs(_SEARCH_CACHE_DIR)
+            with open(_get_search_cache_path(cache_key), 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"[캐시] 검색 결과 저장 실패: {e}")
+
+        return entry
+
+
+def clear_search_cache():
+    """키워드 검색 캐시를 모두 삭제합니다."""
+    with _search_cache_lock:
+        _search_cache.clear()
+        if os.path.exists(_SEARCH_CACHE_DIR):
+            for filename in os.listdir(_SEARCH_CACHE_DIR):
+                if filename.endswith('.json'):
+                    try:
+                        os.remove(os.path.join(_SEARCH_CACHE_DIR, filename))
+                    except OSError:
+                        pass
@@ -9,6 +9,7 @@ import sys
 import json
 import base64
 import hashlib
+import threading
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -96,6 +97,20 @@ def _get_or_create_salt():
         return salt
 
 
+def _get_file_signature(path):
+    """파일 변경 감지용 서명 (수정 시각, 크기)을 반환합니다. 없으면 None."""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+# 파생 키 캐시 (PBKDF2 10만 회는 호출마다 수백 ms가 걸리므로 프로세스 단위로 보관)
+_key_cache = {'signature': None, 'fernet': None}
+_key_cache_lock = threading.Lock()
+
+
 def _derive_encryption_key():
     """머신 키와 솔트로 암호화 키를 파생합니다."""
     salt = _get_or_create_salt()
@@ -111,11 +126,23 @@ def _derive_encryption_key():
     return key
 
 
+def _get_fernet():
+    """캐시된 Fernet 객체를 반환합니다. 솔트 파일이 바뀌면 키를 다시 파생합니다."""
+    with _key_cache_lock:
+        signature = (_get_file_signature(CREDENTIALS_SALT_FILE), _get_machine_key())
+        if _key_cache['fernet'] is None or _key_cache['signature'] != signature:
+            key = _derive_encryption_key()
+            # 솔트가 새로 생성된 경우 생성 후 서명으로 기록
+            signature = (_get_file_signature(CREDENTIALS_SALT_FILE), signature[1])
+            _key_cache['fernet'] = Fernet(key)
+            _key_cache['signature'] = signature
+        return _key_cache['fernet']
+
+
 def encrypt_credentials(data_dict):
     """자격증명 데이터를 암호화합니다."""
     try:
-        key = _derive_encryption_key()
-        fernet = Fernet(key)
+        fernet = _get_fernet()
         encrypted = fernet.encrypt(json.dumps(data_dict).encode())
         return encrypted
     except Exception as e:
@@ -126,8 +153,7 @@ def encrypt_credentials(data_dict):
 def decrypt_credentials(encrypted_data):
     """암호화된 자격증명 데이터를 복호화합니다."""
     try:
-        key = _derive_encryption_key()
-        fernet = Fernet(key)
+        fernet = _get_fernet()
         decrypted = fernet.decrypt(encrypted_data)
         return json.loads(decrypted.decode())
     except Exception as e:
@@ -135,6 +161,52 @@ def decrypt_credentials(encrypted_data):
         return None
 
 
+# 복호화 결과 캐시: {파일 경로: (파일 서명, 복호화된 JSON 문자열)}
+# 파일이 디스크에서 바뀌면 서명이 달라지므로 다시 읽습니다.
+_decrypted_cache = {}
+_decrypted_cache_lock = threading.Lock()
+
+
+def _load_encrypted_file(path):
+    """
+    암호화된 자격증명 파일을 읽어 복호화합니다 (메모리 캐시 사용).
+    호출자가 결과를 수정해도 캐시에 영향이 없도록 매번 새 dict를 반환합니다.
+    """
+    signature = _get_file_signature(path)
+    if signature is None:
+        return None
+
+    with _decrypted_cache_lock:
+        cached = _decrypted_cache.get(path)
+        if cached and cached[0] == signature:
+            return json.loads(cached[1])
+
+    with open(path, 'rb') as f:
+        encrypted_data = f.read()
+    data = decrypt_credentials(encrypted_data)
+
+    if data is not None:
+        with _decrypted_cache_lock:
+            _decrypted_cache[path] = (signature, json.dumps(data))
+    return data
+
+
+def _write_encrypted_file(path, encrypted):
+    """암호화된 자격증명을 파일로 저장하고 캐시를 무효화합니다."""
+    with open(path, 'wb') as f:
+        f.write(encrypted)
+    invalidate_credentials_cache(path)
+
+
+def invalidate_credentials_cache(path=None):
+    """복호화 캐시를 비웁니다 (path가 없으면 전체)."""
+    with _decrypted_cache_lock:
+        if path is None:
+            _decrypted_cache.clear()
+        else:
+            _decrypted_cache.pop(path, None)
+
+
 # ===== OAuth 파일 관리 (AppData 저장) =====
 
 def get_oauth_json_dir():
@@ -187,8 +259,7 @@ def migrate_legacy_credentials():
                 if not os.path.exists(encrypted_path):
                     encrypted = encrypt_credentials(oauth_data)
                     if encrypted:
-                        with open(encrypted_path, 'wb') as f:
-                            f.write(encrypted)
+                        _write_encrypted_file(encrypted_path, encrypted)
                         result['migrated'] += 1
                         print(f"마이그레이션 완료: {filename}")
 
@@ -204,8 +275,7 @@ def migrate_legacy_credentials():
                     if not os.path.exists(encrypted_token_path):
                         encrypted_token = encrypt_credentials(token_data)
                         if encrypted_token:
-                            with open(encrypted_token_path, 'wb') as f:
-                                f.write(encrypted_token)
+                            _write_encrypted_file(encrypted_token_path, encrypted_token)
                             print(f"토큰 마이그레이션 완료: {token_filename}")
 
             except Exception as e:
@@ -312,9 +382,7 @@ def load_oauth_credentials(name_part):
     encrypted_path = os.path.join(CREDENTIALS_DIR, f'{name_part}_OAuth.enc')
     if os.path.exists(encrypted_path):
         try:
-            with open(encrypted_path, 'rb') as f:
-                encrypted_data = f.read()
-            return decrypt_credentials(encrypted_data)
+            return _load_encrypted_file(encrypted_path)
         except Exception as e:
             print(f"암호화된 OAuth 로드 실패: {e}")
 
@@ -328,10 +396,9 @@ def load_oauth_credentials(name_part):
 
                 if file_email_id == email_id:
                     try:
-                        with open(os.path.join(CREDENTIALS_DIR, filename), 'rb') as f:
-                            encrypted_data = f.read()
+                        data = _load_encrypted_file(os.path.join(CREDENTIALS_DIR, filename))
                         print(f"이메일 ID '{email_id}'로 파일 찾음: {filename}")
-                        return decrypt_credentials(encrypted_data)
+                        return data
                     except Exception as e:
                         print(f"암호화된 OAuth 로드 실패: {e}")
 
@@ -387,9 +454,7 @@ def load_token_credentials(name_part):
     encrypted_path = os.path.join(CREDENTIALS_DIR, f'{name_part}_token.enc')
     if os.path.exists(encrypted_path):
         try:
-            with open(encrypted_path, 'rb') as f:
-                encrypted_data = f.read()
-            return decrypt_credentials(encrypted_data)
+            return _load_encrypted_file(encrypted_path)
         except Exception as e:
             print(f"암호화된 토큰 로드 실패: {e}")
 
@@ -403,10 +468,9 @@ def load_token_credentials(name_part):
 
                 if file_email_id == email_id:
                     try:
-                        with open(os.path.join(CREDENTIALS_DIR, filename), 'rb') as f:
-                            encrypted_data = f.read()
+                        data = _load_encrypted_file(os.path.join(CREDENTIALS_DIR, filename))
                         print(f"이메일 ID '{email_id}'로 토큰 파일 찾음: {filename}")
-                        return decrypt_credentials(encrypted_data)
+                        return data
                     except Exception as e:
                         print(f"암호화된 토큰 로드 실패: {e}")
 
@@ -453,8 +517,7 @@ def save_token_credentials(name_part, token_data):
         encrypted = encrypt_credentials(token_dict)
         if encrypted:
             encrypted_path = os.path.join(CREDENTIALS_DIR, f'{name_part}_token.enc')
-            with open(encrypted_path, 'wb') as f:
-                f.write(encrypted)
+            _write_encrypted_file(encrypted_path, encrypted)
             return True
     except Exception as e:
         print(f"토큰 저장 실패: {e}")
@@ -468,6 +531,7 @@ def delete_token_credentials(name_part):
     encrypted_path = os.path.join(CREDENTIALS_DIR, f'{name_part}_token.enc')
     if os.path.exists(encrypted_path):
         os.remove(encrypted_path)
+    invalidate_credentials_cache(encrypted_path)
 
     # 레거시 토큰 삭제
     legacy_path = os.path.join(get_legacy_json_dir(), f'{name_part}_token.json')
@@ -610,16 +674,14 @@ def import_credentials_from_file(import_path, password):
                 encrypted_oauth = encrypt_credentials(entry['oauth'])
                 if encrypted_oauth:
                     oauth_path = os.path.join(CREDENTIALS_DIR, f'{name_part}_OAuth.enc')
-                    with open(oauth_path, 'wb') as f:
-                        f.write(encrypted_oauth)
+                    _write_encrypted_file(oauth_path, encrypted_oauth)
 
             # 토큰 저장
             if entry.get('token'):
                 encrypted_token = encrypt_credentials(entry['token'])
                 if encrypted_token:
                     token_path = os.path.join(CREDENTIALS_DIR, f'{name_part}_token.enc')
-                    with open(token_path, 'wb') as f:
-                        f.write(encrypted_token)
+                    _write_encrypted_file(token_path, encrypted_token)
 
             imported_count += 1
 
@@ -0,0 +1,161 @@
+"""
+디스크 LRU 캐시 저장소
+- 폴더 하나에 파일을 저장하고 전체 용량을 추적 (처음 필요할 때 한 번만 폴더를 훑음)
+- 최대 용량을 넘으면 마지막 사용 시각(mtime)이 오래된 파일부터 삭제
+- 읽을 때 mtime을 갱신해 최근 사용으로 표시, 쓰기는 임시 파일에 쓴 뒤 교체
+- TTS 음성 캐시(tts_cache)와 썸네일 캐시(thumbnail_cache)가 함께 사용
+
+사용 예:
+    store = DiskLRU(cache_dir, 300 * 1024 * 1024, label='썸네일 캐시')
+    data = store.read(path)
+    if data is None:
+        store.write(path, download())
+"""
+
+import os
+import threading
+
+
+def write_atomic(path, data):
+    """파일을 임시 파일에 쓴 뒤 교체합니다 (쓰는 도중 다른 스레드가 반쯤 쓴 파일을 읽지 않도록)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    encoding = None if isinstance(data, bytes) else 'utf-8'
+    with open(tmp_path, mode, encoding=encoding) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class DiskLRU:
+    """용량 제한이 있는 디스크 캐시 폴더 (스레드 안전)"""
+
+    def __init__(self, directory, max_bytes, trim_ratio=0.8, suffix=None, companion_suffixes=(), label='캐시'):
+        """
+        Args:
+            directory: 캐시 폴더
+            max_bytes: 최대 용량 (넘으면 정리)
+            trim_ratio: 정리 시 최대 용량의 이 비율까지 줄임
+            suffix: 이 확장자의 파일만 용량/정리 대상 (None이면 전체)
+            companion_suffixes: 정리할 때 함께 지울 같은 이름의 부속 파일 확장자 (예: 타이밍 .json)
+            label: 로그 머리말
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.trim_ratio = trim_ratio
+        self.suffix = suffix
+        self.companion_suffixes = tuple(companion_suffixes)
+        self.label = label
+        self.evictions = 0
+        self._size = None  # None이면 아직 계산 전
+        self._lock = threading.Lock()
+
+    def _scan(self):
+        """캐시 파일 목록을 (경로, 크기, 마지막 사용 시각)으로 반환합니다."""
+        files = []
+        if not os.path.exists(self.directory):
+            return files
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if self.suffix and not name.endswith(self.suffix):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                    files.append((path, st.st_size, st.st_mtime))
+                except OSError:
+                    continue
+        return files
+
+    def _remove(self, path):
+        os.remove(path)
+        stem = path[:-len(self.suffix)] if self.suffix else path
+        for companion in self.companion_suffixes:
+            try:
+                os.remove(stem + companion)
+            except OSError:
+                pass
+
+    def size(self):
+        """현재 캐시 용량 (bytes)"""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._scan())
+            return self._size
+
+    def _add_size(self, delta):
+        """캐시 용량을 갱신하고, 최대 용량을 넘으면 오래된 파일부터 정리합니다."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._scan())
+            else:
+                self._size += delta
+
+            if self._size <= self.max_bytes:
+                return
+
+            # LRU 정리: 마지막 사용 시각(mtime)이 오래된 순
+            files = sorted(self._scan(), key=lambda f: f[2])
+            total = sum(size for _, size, _ in files)
+            target = self.max_bytes * self.trim_ratio
+            removed = 0
+            for path, size, _ in files:
+                if total <= target:
+                    break
+                try:
+                    self._remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self._size = total
+            self.evictions += removed
+            print(f"[{self.label}] {removed}개 파일 정리 (현재 {total // (1024 * 1024)}MB)")
+
+    def read(self, path):
+        """캐시 파일 내용을 반환합니다 (없으면 None). 읽은 파일은 최근 사용으로 표시합니다."""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return data
+
+    def write(self, path, data):
+        """
+        파일을 캐시에 저장합니다 (임시 파일에 쓴 뒤 교체).
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            write_atomic(path, data)
+        except OSError as e:
+            print(f"[{self.label}] 저장 실패: {e}")
+            return False
+        self._add_size(len(data) - old_size)
+        return True
+
+    def clear(self):
+        """
+        캐시 파일을 모두 삭제합니다.
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        removed = 0
+        with self._lock:
+            for path, _, _ in self._scan():
+                try:
+                    self._remove(path)
+                except OSError:
+                    continue
+                removed += 1
+            self._size = 0
+            self.evictions = 0
+        return removed
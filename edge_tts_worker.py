@@ -0,0 +1,145 @@
+"""
+Edge TTS 작업 스레드 모듈
+- 이벤트 루프 하나를 가진 상주 스레드가 모든 Edge TTS 요청을 처리 (호출마다 asyncio.run 생성 안 함)
+- 동시 websocket 세션 수 제한 (세마포어)
+- 동기 호출자에게는 concurrent.futures.Future 반환 (여러 문장을 한꺼번에 요청 가능)
+- 수신한 오디오 조각은 리스트에 모았다가 마지막에 한 번만 결합
+- WordBoundary 이벤트로 단어 타이밍도 함께 반환 (자막용)
+
+사용 예:
+    future = edge_worker.submit("안녕하세요", "ko-KR-SunHiNeural", rate=1.2)
+    audio_bytes, words = future.result()
+"""
+
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+MAX_CONCURRENT_SESSIONS = 4  # 동시에 열 websocket 세션 수
+REQUEST_TIMEOUT = 120  # 요청 1건 최대 대기 시간 (초)
+TICKS_PER_SECOND = 10_000_000  # WordBoundary offset/duration 단위 (100ns)
+
+
+def _rate_string(rate):
+    """속도 배율을 Edge TTS 퍼센트 문자열로 변환 (1.0 = +0%, 1.5 = +50%, 0.5 = -50%)"""
+    rate_percent = int((rate - 1.0) * 100)
+    return f"+{rate_percent}%" if rate_percent >= 0 else f"{rate_percent}%"
+
+
+def _pitch_string(pitch):
+    """피치를 Hz 문자열로 변환"""
+    pitch_hz = int(pitch)
+    return f"+{pitch_hz}Hz" if pitch_hz >= 0 else f"{pitch_hz}Hz"
+
+
+class EdgeTTSWorker:
+    """상주 이벤트 루프에서 Edge TTS 합성을 동시에 처리하는 작업자"""
+
+    def __init__(self, max_sessions=MAX_CONCURRENT_SESSIONS):
+        self.max_sessions = max_sessions
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.active = 0
+
+    def _ensure_loop(self):
+        if self._loop is not None:
+            return self._loop
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run():
+                    asyncio.set_event_loop(loop)
+                    self._semaphore = asyncio.Semaphore(self.max_sessions)
+                    ready.set()
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_run, name='edge-tts', daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+        return self._loop
+
+    async def _synthesize(self, text, voice_name, rate, pitch):
+        import edge_tts
+
+        async with self._semaphore:
+            self.active += 1
+            try:
+                try:
+                    # edge-tts 7.x는 기본값이 문장 단위이므로 단어 단위 요청
+                    communicate = edge_tts.Communicate(text, voice_name, rate=_rate_string(rate),
+                                                       pitch=_pitch_string(pitch), boundary='WordBoundary')
+                except TypeError:
+                    # 이전 버전은 boundary 인자 없이 항상 WordBoundary 전송
+                    communicate = edge_tts.Communicate(text, voice_name, rate=_rate_string(rate), pitch=_pitch_string(pitch))
+                chunks = []
+                words = []
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        chunks.append(chunk["data"])
+                    elif chunk["type"] == "WordBoundary":
+                        start = chunk["offset"] / TICKS_PER_SECOND
+                        words.append({
+                            'text': chunk.get("text", ""),
+                            'start': round(start, 3),
+                            'end': round(start + chunk.get("duration", 0) / TICKS_PER_SECOND, 3)
+                        })
+            finally:
+                self.active -= 1
+
+        audio_data = b"".join(chunks)
+        if not audio_data:
+            raise RuntimeError(f"Edge TTS에서 오디오를 받지 못했습니다. 음성: {voice_name}")
+        return audio_data, words
+
+    def submit(self, text, voice_name, rate=1.0, pitch=0.0):
+        """
+        합성 요청을 등록하고 즉시 Future를 반환합니다.
+
+        Returns:
+            concurrent.futures.Future: 결과는 (MP3 bytes, 단어 타이밍 리스트)
+        """
+        loop = self._ensure_loop()
+        self.submitted += 1
+        future = asyncio.run_coroutine_threadsafe(
+            self._synthesize(text.strip(), voice_name.strip(), rate, pitch), loop
+        )
+        future.add_done_callback(self._on_done)
+        return future
+
+    def synthesize(self, text, voice_name, rate=1.0, pitch=0.0, timeout=REQUEST_TIMEOUT):
+        """합성 결과 (MP3 bytes, 단어 타이밍 리스트)를 기다려 반환합니다 (동기 호출용)."""
+        future = self.submit(text, voice_name, rate, pitch)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise RuntimeError(f"Edge TTS 응답 시간 초과 ({timeout}초)")
+
+    def _on_done(self, future):
+        if future.cancelled() or future.exception() is not None:
+            self.failed += 1
+        else:
+            self.completed += 1
+
+    def get_stats(self):
+        """요청/완료/실패 수와 현재 진행 중인 세션 수"""
+        return {
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'active': self.active,
+            'maxSessions': self.max_sessions,
+            'running': self._thread is not None and self._thread.is_alive()
+        }
+
+
+# 전역 인스턴스
+edge_worker = EdgeTTSWorker()
@@ -0,0 +1,217 @@
+"""
+하드웨어 인코더 지원 정보 레지스트리
+- ffmpeg -encoders 목록과 실제 테스트 인코딩 결과를 디스크에 저장
+- ffmpeg 경로/버전/수정 시각이 바뀐 경우에만 다시 검사 (시작 시, 작업마다 반복 실행 방지)
+- studio_backend, studio_services의 모든 인코딩 경로가 공유
+"""
+
+import os
+import json
+import shutil
+import subprocess
+import threading
+from data_path import DATA_DIR
+
+ENCODER_CACHE_FILE = os.path.join(DATA_DIR, 'encoder_capabilities.json')
+ENCODER_CACHE_VERSION = 1
+PROBE_TIMEOUT = 10  # 검사 명령 1회 제한 시간 (초)
+
+# 검사할 H.264 인코더 (코덱, 표시 이름)
+H264_ENCODERS = (
+    ('h264_nvenc', 'NVIDIA GPU'),
+    ('h264_qsv', 'Intel GPU (Quick Sync)'),
+    ('h264_amf', 'AMD GPU'),
+    ('libx264', 'CPU (소프트웨어)'),
+)
+HARDWARE_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_amf')
+
+# 콘솔 창 숨김 (Windows)
+SUBPROCESS_STARTUP_INFO = None
+SUBPROCESS_CREATION_FLAGS = 0
+if os.name == 'nt':
+    SUBPROCESS_STARTUP_INFO = subprocess.STARTUPINFO()
+    SUBPROCESS_STARTUP_INFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    SUBPROCESS_STARTUP_INFO.wShowWindow = subprocess.SW_HIDE
+    SUBPROCESS_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW
+
+_lock = threading.Lock()
+_capabilities = {}  # ffmpeg 경로 -> 검사 결과
+_disk_loaded = False
+
+
+def get_ffmpeg_path():
+    """사용할 ffmpeg 실행 파일 경로를 반환합니다 (studio_utils와 같은 탐색 순서)."""
+    explicit = r"C:\ProgramData\chocolatey\bin\ffmpeg.exe"
+    if os.path.exists(explicit):
+        return explicit
+    return shutil.which('ffmpeg')
+
+
+def _run(args):
+    return subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        timeout=PROBE_TIMEOUT,
+        startupinfo=SUBPROCESS_STARTUP_INFO,
+        creationflags=SUBPROCESS_CREATION_FLAGS
+    )
+
+
+def _file_signature(path):
+    """ffmpeg 파일의 (수정 시각, 크기) - 버전 확인 없이 변경 여부 판단용"""
+    try:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def _read_version(ffmpeg_path):
+    """ffmpeg -version 첫 줄을 반환합니다."""
+    try:
+        result = _run([ffmpeg_path, '-hide_banner', '-version'])
+        lines = (result.stdout or '').splitlines()
+        return lines[0].strip() if lines else ''
+    except Exception:
+        return ''
+
+
+def _test_encoder(ffmpeg_path, codec):
+    """인코더가 실제로 작동하는지 1프레임 인코딩으로 확인합니다 (하드웨어가 없으면 실패)."""
+    try:
+        result = _run([
+            ffmpeg_path, '-y', '-hide_banner', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', 'color=black:s=64x64:d=0.1',
+            '-c:v', codec,
+            '-frames:v', '1',
+            '-f', 'null', '-'
+        ])
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def _probe(ffmpeg_path, signature, version):
+    """인코더 목록과 실제 동작 여부를 검사합니다."""
+    print(f"[인코더] ffmpeg 인코더 검사 중... ({ffmpeg_path})")
+    encoders = {}
+    try:
+        output = _run([ffmpeg_path, '-hide_banner', '-encoders']).stdout or ''
+    except Exception as e:
+        print(f"[인코더] 인코더 목록 확인 실패: {e}")
+        output = ''
+
+    for codec, _ in H264_ENCODERS:
+        listed = codec in output
+        if codec in HARDWARE_ENCODERS:
+            working = listed and _test_encoder(ffmpeg_path, codec)
+        else:
+            working = listed
+        encoders[codec] = {'listed': listed, 'working': working}
+
+    print(f"[인코더] 검사 완료: {', '.join(c for c, info in encoders.items() if info['working']) or '없음'}")
+    return {
+        'signature': signature,
+        'version': version,
+        'encoders': encoders
+    }
+
+
+def _load_disk_cache():
+    global _disk_loaded
+    if _disk_loaded:
+        return
+    _disk_loaded = True
+    try:
+        if os.path.exists(ENCODER_CACHE_FILE):
+            with open(ENCODER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == ENCODER_CACHE_VERSION:
+                _capabilities.update(data.get('ffmpeg', {}))
+    except Exception as e:
+        print(f"[인코더] 캐시 로드 실패: {e}")
+
+
+def _save_disk_cache():
+    try:
+        tmp_path = ENCODER_CACHE_FILE + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': ENCODER_CACHE_VERSION, 'ffmpeg': _capabilities}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, ENCODER_CACHE_FILE)
+    except Exception as e:
+        print(f"[인코더] 캐시 저장 실패: {e}")
+
+
+def get_capabilities(ffmpeg_path=None, force=False):
+    """
+    ffmpeg의 인코더 지원 정보를 반환합니다.
+    저장된 결과의 경로/수정 시각/크기가 같으면 그대로 쓰고, 다르면 버전을 확인해
+    버전까지 바뀐 경우에만 다시 검사합니다.
+
+    Returns:
+        dict: {'path': str, 'version': str, 'encoders': {codec: {'listed': bool, 'working': bool}}}
+              ffmpeg를 찾지 못하면 encoders가 비어 있음
+    """
+    ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
+    if not ffmpeg_path:
+        return {'path': None, 'version': '', 'encoders': {}}
+
+    key = os.path.normcase(os.path.abspath(ffmpeg_path))
+    with _lock:
+        _load_disk_cache()
+        entry = _capabilities.get(key)
+        signature = _file_signature(ffmpeg_path)
+
+        if not force and entry and signature is not None and entry.get('signature') == signature:
+            return dict(entry, path=ffmpeg_path)
+
+        version = _read_version(ffmpeg_path)
+        if not force and entry and version and entry.get('version') == version:
+            # 파일만 다시 복사된 경우 (같은 빌드) - 서명만 갱신
+            entry['signature'] = signature
+        else:
+            entry = _probe(ffmpeg_path, signature, version)
+        _capabilities[key] = entry
+        _save_disk_cache()
+        return dict(entry, path=ffmpeg_path)
+
+
+def is_encoder_available(codec, ffmpeg_path=None):
+    """인코더가 실제로 작동하는지 여부 (검사 결과 재사용)"""
+    info = get_capabilities(ffmpeg_path)['encoders'].get(codec)
+    return bool(info and info['working'])
+
+
+def pick_encoder(priority, ffmpeg_path=None, fallback='libx264'):
+    """priority 순서대로 작동하는 첫 인코더를 반환합니다 (없으면 fallback)."""
+    encoders = get_capabilities(ffmpeg_path)['encoders']
+    for codec in priority:
+        info = encoders.get(codec)
+        if info and info['working']:
+            return codec
+    return fallback
+
+
+def get_encoder_list(ffmpeg_path=None):
+    """
+    ffmpeg 목록에 있는 인코더를 우선순위 순으로 반환합니다.
+
+    Returns:
+        list: [{'codec': str, 'name': str, 'available': bool}, ...]
+    """
+    encoders = get_capabilities(ffmpeg_path)['encoders']
+    return [
+        {'codec': codec, 'name': name, 'available': encoders[codec]['working']}
+        for codec, name in H264_ENCODERS
+        if codec in encoders and encoders[codec]['listed']
+    ]
+
+
+def invalidate():
+    """저장된 검사 결과를 모두 지웁니다 (다음 요청 시 다시 검사)."""
+    with _lock:
+        _capabilities.clear()
+        _save_disk_cache()
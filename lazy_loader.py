@@ -0,0 +1,285 @@
+"""
+지연 로딩 모듈
+- 무거운 스튜디오 모듈(librosa, matplotlib, moviepy 등)을 첫 사용 시점에 import
+- 창이 뜬 뒤 백그라운드에서 미리 로드(워밍업)하여 첫 사용 지연 최소화
+- 시작 시 모듈별 import 시간 측정/보고 및 시작 시간 예산 확인
+
+사용 예:
+    services = LazyModule('studio_services')   # 아직 import 하지 않음
+    services.synthesize_tts_bytes(...)          # 첫 속성 접근 시 import
+
+시작 시간 회귀 검사 (새 인터프리터에서 main을 import해 측정, 예산 초과 시 종료 코드 1):
+    python lazy_loader.py [예산(초)]
+"""
+
+import builtins
+import importlib
+import os
+import sys
+import threading
+import time
+
+STARTUP_BUDGET_SECONDS = 3.0  # 창이 뜨기 전까지 허용하는 시작 시간 (초)
+WARM_UP_DELAY_SECONDS = 3.0  # 창이 뜬 뒤 워밍업 시작까지 대기 시간 (초)
+REPORT_TOP_N = 15  # 시작 보고에 표시할 모듈 수
+
+# 시작 시 import 되면 안 되는 무거운 모듈 (회귀 검사용)
+DEFERRED_MODULES = (
+    'studio_services', 'librosa', 'matplotlib', 'moviepy', 'google.cloud.texttospeech', 'whisper'
+)
+
+_lock = threading.RLock()
+_load_errors = {}  # 모듈 이름 -> 오류 메시지
+_import_times = {}  # 모듈 이름 -> import 시간 (초)
+
+_startup_started = None
+_original_import = None
+_import_depth = threading.local()
+
+
+def load_module(name):
+    """
+    모듈을 import 하고 걸린 시간을 기록합니다 (이미 로드됐으면 그대로 반환).
+
+    Returns:
+        module 또는 None (import 실패 시)
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        if name in _load_errors:
+            return None
+
+        started = time.perf_counter()
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            _load_errors[name] = str(e)
+            print(f"[지연 로딩] {name} 로드 실패: {e}")
+            return None
+
+        elapsed = time.perf_counter() - started
+        _import_times[name] = elapsed
+        print(f"[지연 로딩] {name} 로드 ({elapsed:.2f}초)")
+        return module
+
+
+def get_load_error(name):
+    """모듈 로드 실패 메시지를 반환합니다 (실패하지 않았으면 None)."""
+    return _load_errors.get(name)
+
+
+class LazyModule:
+    """첫 속성 접근 시 실제 모듈을 import 하는 대리 객체"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def load(self):
+        """실제 모듈을 import 하여 반환합니다 (실패 시 None)."""
+        if self._module is None:
+            self._module = load_module(self._name)
+        return self._module
+
+    @property
+    def is_loaded(self):
+        """이미 import 되었는지 여부 (import를 유발하지 않음)"""
+        return self._module is not None or self._name in sys.modules
+
+    def __getattr__(self, attr):
+        module = self.load()
+        if module is None:
+            raise ImportError(f"{self._name} 모듈을 로드할 수 없습니다: {_load_errors.get(self._name)}")
+        return getattr(module, attr)
+
+    def __repr__(self):
+        state = 'loaded' if self.is_loaded else 'deferred'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def warm_up(names, delay=WARM_UP_DELAY_SECONDS):
+    """
+    백그라운드 스레드에서 모듈을 미리 로드합니다 (창이 뜬 뒤 호출).
+    워밍업 도중 엔드포인트가 같은 모듈을 사용하면 import 잠금으로 완료까지 대기합니다.
+    """
+    def _run():
+        if delay:
+            time.sleep(delay)
+        started = time.perf_counter()
+        for name in names:
+            load_module(name)
+        print(f"[지연 로딩] 워밍업 완료 ({time.perf_counter() - started:.2f}초)")
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread
+
+
+# ========== 시작 시간 측정 ==========
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """최상위 import만 누적 시간으로 기록하는 __import__ 래퍼"""
+    depth = getattr(_import_depth, 'value', 0)
+    if depth or level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    _import_depth.value = 1
+    started = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _import_depth.value = 0
+        elapsed = time.perf_counter() - started
+        with _lock:
+            _import_times[name] = _import_times.get(name, 0) + elapsed
+
+
+def start_startup_timing():
+    """시작 시간 측정을 시작합니다 (main.py 최상단에서 호출)."""
+    global _startup_started, _original_import
+    _startup_started = time.perf_counter()
+    if _original_import is None:
+        _original_import = builtins.__import__
+        builtins.__import__ = _timed_import
+
+
+def _stop_import_timing():
+    global _original_import
+    if _original_import is not None:
+        builtins.__import__ = _original_import
+        _original_import = None
+
+
+def get_import_report(top_n=None):
+    """
+    모듈별 import 시간 목록을 반환합니다 (오래 걸린 순).
+
+    Returns:
+        list: [{'module': str, 'seconds': float}, ...]
+    """
+    with _lock:
+        items = sorted(_import_times.items(), key=lambda item: item[1], reverse=True)
+    if top_n:
+        items = items[:top_n]
+    return [{'module': name, 'seconds': round(seconds, 4)} for name, seconds in items]
+
+
+def finish_startup(budget=STARTUP_BUDGET_SECONDS):
+    """
+    시작 시간 측정을 마치고 보고를 출력합니다 (eel.start 직전에 호출).
+
+    Returns:
+        dict: {'elapsed': float, 'budget': float, 'withinBudget': bool, 'modules': [...], 'deferred': [...]}
+    """
+    _stop_import_timing()
+    if _startup_started is None:
+        return None
+
+    elapsed = time.perf_counter() - _startup_started
+    modules = get_import_report(REPORT_TOP_N)
+    loaded_heavy = [name for name in DEFERRED_MODULES if name in sys.modules]
+
+    print(f"[시작 보고] 시작 시간 {elapsed:.2f}초 (예산 {budget:.1f}초)")
+    for item in modules:
+        print(f"  {item['seconds']:8.3f}초  {item['module']}")
+    if elapsed > budget:
+        print(f"[시작 보고] ⚠️ 시작 시간 예산 초과 ({elapsed:.2f}초 > {budget:.1f}초)")
+    if loaded_heavy:
+        print(f"[시작 보고] ⚠️ 시작 시 무거운 모듈이 로드됨: {', '.join(loaded_heavy)}")
+
+    return {
+        'elapsed': round(elapsed, 3),
+        'budget': budget,
+        'withinBudget': elapsed <= budget,
+        'modules': modules,
+        'deferred': [name for name in DEFERRED_MODULES if name not in sys.modules]
+    }
+
+
+def _parse_importtime(stderr, target):
+    """python -X importtime 출력에서 target이 직접 import한 모듈별 누적 시간(초)을 추출합니다."""
+    # 하위 모듈이 상위 모듈보다 먼저 출력되므로, 깊이 1 항목을 모아 두었다가 target 줄에서 확정
+    pending = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        seconds = int(parts[1]) / 1_000_000
+        if depth == 1:
+            pending[name.strip()] = seconds
+        elif depth == 0:
+            if name.strip() == target:
+                return pending
+            pending = {}
+    return {}
+
+
+def check_startup_budget(budget=STARTUP_BUDGET_SECONDS, target='main'):
+    """
+    새 인터프리터에서 target 모듈을 import 하여 콜드 스타트 시간을 측정합니다.
+
+    Returns:
+        dict: {'success': bool, 'elapsed': float, 'budget': float, 'modules': [...], 'heavyLoaded': [...]}
+    """
+    import subprocess
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    script = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        f"import {target}\n"
+        "print('ELAPSED', time.perf_counter() - t)\n"
+        f"print('LOADED', ','.join(n for n in {DEFERRED_MODULES!r} if n in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=root, capture_output=True, text=True, encoding='utf-8', errors='replace'
+    )
+    if result.returncode != 0:
+        return {'success': False, 'error': result.stderr.strip().splitlines()[-1:] or ['import 실패']}
+
+    elapsed = None
+    heavy_loaded = []
+    for line in result.stdout.splitlines():
+        if line.startswith('ELAPSED '):
+            elapsed = float(line.split()[1])
+        elif line.startswith('LOADED '):
+            heavy_loaded = [name for name in line[len('LOADED '):].split(',') if name]
+
+    times = _parse_importtime(result.stderr, target)
+    modules = sorted(times.items(), key=lambda item: item[1], reverse=True)[:REPORT_TOP_N]
+
+    return {
+        'success': elapsed is not None and elapsed <= budget and not heavy_loaded,
+        'elapsed': elapsed,
+        'budget': budget,
+        'modules': [{'module': name, 'seconds': round(seconds, 4)} for name, seconds in modules],
+        'heavyLoaded': heavy_loaded
+    }
+
+
+if __name__ == '__main__':
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else STARTUP_BUDGET_SECONDS
+    report = check_startup_budget(budget)
+    if 'error' in report:
+        print(f"[시작 검사] main import 실패: {report['error']}")
+        sys.exit(1)
+
+    print(f"[시작 검사] 콜드 스타트 {report['elapsed']:.2f}초 (예산 {budget:.1f}초)")
+    for item in report['modules']:
+        print(f"  {item['seconds']:8.3f}초  {item['module']}")
+    if report['heavyLoaded']:
+        print(f"[시작 검사] 실패: 시작 시 로드되면 안 되는 모듈 - {', '.join(report['heavyLoaded'])}")
+    elif not report['success']:
+        print("[시작 검사] 실패: 시작 시간 예산 초과")
+    sys.exit(0 if report['success'] else 1)
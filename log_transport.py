@@ -0,0 +1,188 @@
+"""
+로그 전송 모듈
+- print/log_message가 UI 응답을 기다리지 않도록 로그를 메모리 버퍼에 넣기만 하고 즉시 반환
+- 백그라운드 스레드가 일정 주기로 모아서(배치) 프론트엔드로 전송 (초당 전송 횟수 제한)
+- 레벨 필터 (UI에는 INFO 이상만 보내는 식), 선택적 파일 기록 (크기 기준 교체)
+
+사용 예:
+    transport = LogTransport()
+    transport.add_channel('backend', lambda entries: eel.receiveBackendLogBatch(entries))
+    transport.publish('backend', '메시지', 'INFO')
+"""
+
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARN': 30, 'ERROR': 40}
+
+FLUSH_INTERVAL = 0.25  # 전송 주기 (초) - 초당 최대 4회 전송
+MAX_BATCH_SIZE = 200  # 한 번에 보낼 최대 로그 수
+MAX_PENDING = 5000  # 전송 대기 최대 수 (넘으면 오래된 것부터 버림)
+HISTORY_SIZE = 2000  # get_backend_logs용 최근 로그 보관 수
+
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024  # 로그 파일 교체 크기
+LOG_FILE_BACKUP_COUNT = 3  # 보관할 이전 로그 파일 수
+
+
+def level_value(level):
+    return LOG_LEVELS.get(str(level).upper(), LOG_LEVELS['INFO'])
+
+
+class _Channel:
+    def __init__(self, sender, min_level):
+        self.sender = sender
+        self.min_level = level_value(min_level)
+        self.pending = deque(maxlen=MAX_PENDING)  # append/popleft는 스레드 안전 (잠금 불필요)
+        self.published = 0
+        self.sent = 0
+
+
+class LogTransport:
+    """배치 로그 전송기 (발행은 버퍼 추가만, 전송은 백그라운드 스레드)"""
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL, max_batch=MAX_BATCH_SIZE, history_size=HISTORY_SIZE):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.history = deque(maxlen=history_size)  # (seq, 시각, 레벨, 메시지)
+        self._channels = {}
+        self._seq = itertools.count(1)
+        self._file_handler = None
+        self._file_min_level = LOG_LEVELS['DEBUG']
+        self._file_queue = deque(maxlen=MAX_PENDING)
+        self._flusher = None
+        self._flusher_lock = threading.Lock()
+
+    def add_channel(self, name, sender, min_level='INFO'):
+        """
+        전송 채널을 등록합니다.
+
+        Args:
+            name: 채널 이름
+            sender: 배치 전송 함수 (entries 리스트를 받음, 각 항목은 (메시지, 레벨))
+            min_level: 이 레벨 이상만 전송
+        """
+        self._channels[name] = _Channel(sender, min_level)
+
+    def set_min_level(self, name, min_level):
+        """채널의 최소 전송 레벨을 변경합니다."""
+        channel = self._channels.get(name)
+        if channel:
+            channel.min_level = level_value(min_level)
+
+    def publish(self, channel_name, message, level='INFO', keep_history=True):
+        """
+        로그를 발행합니다 (버퍼에 추가만 하고 즉시 반환).
+
+        Args:
+            channel_name: add_channel로 등록한 채널 이름
+            message: 로그 메시지
+            level: DEBUG/INFO/WARN/ERROR
+            keep_history: 최근 로그 목록(get_history)에 남길지 여부
+        """
+        level = str(level).upper()
+        if keep_history:
+            entry = (next(self._seq), time.time(), level, message)
+            self.history.append(entry)
+            if self._file_handler is not None and level_value(level) >= self._file_min_level:
+                self._file_queue.append(entry)
+
+        channel = self._channels.get(channel_name)
+        if channel is not None and level_value(level) >= channel.min_level:
+            channel.pending.append((message, level))
+            channel.published += 1
+            self._ensure_flusher()
+
+    def get_history(self):
+        """최근 로그를 '[시:분:초] [레벨] 메시지' 형식 리스트로 반환합니다."""
+        return [
+            f"[{datetime.fromtimestamp(ts).strftime('%H:%M:%S')}] [{level}] {message}"
+            for _, ts, level, message in list(self.history)
+        ]
+
+    def clear_history(self):
+        self.history.clear()
+
+    def enable_file_sink(self, path, min_level='DEBUG', max_bytes=LOG_FILE_MAX_BYTES,
+                         backup_count=LOG_FILE_BACKUP_COUNT):
+        """로그 파일 기록을 켭니다 (크기가 max_bytes를 넘으면 .1, .2 ... 로 교체)."""
+        from logging.handlers import RotatingFileHandler
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.disable_file_sink()
+        self._file_min_level = level_value(min_level)
+        self._file_handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+        )
+        self._ensure_flusher()
+
+    def disable_file_sink(self):
+        """로그 파일 기록을 끕니다."""
+        handler, self._file_handler = self._file_handler, None
+        if handler is not None:
+            try:
+                handler.close()
+            except Exception:
+                pass
+
+    @property
+    def file_sink_path(self):
+        return self._file_handler.baseFilename if self._file_handler is not None else None
+
+    def get_stats(self):
+        """채널별 발행/전송 수, 대기 수"""
+        return {
+            name: {'published': ch.published, 'sent': ch.sent, 'pending': len(ch.pending)}
+            for name, ch in self._channels.items()
+        }
+
+    def flush(self):
+        """대기 중인 로그를 지금 전송합니다 (종료 직전 등)."""
+        self._flush_once(drain=True)
+
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+        with self._flusher_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self._flush_once()
+
+    def _flush_once(self, drain=False):
+        for channel in list(self._channels.values()):
+            while channel.pending:
+                batch = []
+                while channel.pending and len(batch) < self.max_batch:
+                    batch.append(channel.pending.popleft())
+                try:
+                    channel.sender(batch)
+                    channel.sent += len(batch)
+                except Exception:
+                    pass  # 프론트엔드 연결 안됨
+                if not drain:
+                    break  # 주기당 채널별 1배치 (전송 빈도 제한)
+
+        self._write_file()
+
+    def _write_file(self):
+        handler = self._file_handler
+        if handler is None:
+            self._file_queue.clear()
+            return
+
+        import logging
+        try:
+            while self._file_queue:
+                _, ts, level, message = self._file_queue.popleft()
+                stamp = datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+                record = logging.makeLogRecord({'msg': f"[{stamp}] [{level}] {message}"})
+                handler.emit(record)
+        except Exception:
+            pass
@@ -3,6 +3,10 @@ YouTube 구독 채널 필터 검색 프로그램
 - Eel 기반 데스크톱 앱
 """
 
+# 시작 시간 측정 (모듈별 import 시간 보고) - 다른 import보다 먼저
+import lazy_loader
+lazy_loader.start_startup_timing()
+
 import eel
 import os
 import sys
@@ -27,9 +31,14 @@ from auth import (
     get_auth_url_with_localhost, start_auth_server, open_auth_browser, find_free_port as find_auth_port
 )
 import account_manager
-from youtube_api import get_subscriptions, get_channels_batch, get_videos_batch, get_channel_uploads, get_popular_videos, search_youtube_videos, get_filtered_comments
+from youtube_service_pool import service_pool, build_youtube_service
+from youtube_api import get_subscriptions, get_channels_batch, get_videos_batch, get_channel_uploads, get_popular_videos, search_youtube_videos_page, get_filtered_comments
 from rss_fetcher import fetch_all_channels
 import cache_manager
+import search_results
+import tracing
+from progress_hub import progress_hub
+import title_index
 import config
 from data_path import (
     CONFIG_FILE, EXPORT_FILE, DATA_DIR, CHANNEL_FILE, CREDENTIALS_DIR,
@@ -53,7 +62,7 @@ account_manager.migrate_single_token()
 # 레거시 자격증명 마이그레이션 (json 폴더 -> AppData)
 migrate_legacy_credentials()
 
-# RoyStudio 백엔드 모듈 로드
+# RoyStudio 백엔드 모듈 로드 (엔드포인트만 등록, 무거운 모듈은 첫 사용/워밍업 시 로드)
 import studio_backend
 
 # 채널 관리 모듈 로드
@@ -69,6 +78,52 @@ else:
     eel.init('web')
 
 
+# 로컬 썸네일 캐시 엔드포인트 (Eel과 같은 bottle 앱에서 서비스)
+import bottle
+import thumbnail_cache
+
+
+@bottle.route('/thumb')
+def serve_cached_thumbnail():
+    """
+    썸네일을 한 번만 받아 디스크에 캐시하고, 그리드 표시 크기로 줄여서 반환합니다.
+    예: /thumb?w=240&url=https://i.ytimg.com/vi/VIDEO_ID/mqdefault.jpg
+    """
+    url = bottle.request.query.getunicode('url', '')
+    try:
+        width = int(bottle.request.query.get('w', 240))
+    except ValueError:
+        width = 240
+
+    if not thumbnail_cache.is_allowed_thumbnail_url(url):
+        return bottle.HTTPResponse(status=400)
+
+    import hashlib
+    etag = '"' + hashlib.sha1(f"{url}#{width}".encode('utf-8')).hexdigest() + '"'
+    cache_headers = {
+        'Cache-Control': 'public, max-age=604800, immutable',
+        'ETag': etag
+    }
+    if bottle.request.headers.get('If-None-Match') == etag:
+        return bottle.HTTPResponse(status=304, headers=cache_headers)
+
+    # 다운로드/리사이즈는 블로킹 작업이므로 gevent 스레드풀에서 실행 (UI 웹소켓 지연 방지)
+    try:
+        import gevent
+        data, content_type = gevent.get_hub().threadpool.apply(
+            thumbnail_cache.get_thumbnail_variant, (url, width)
+        )
+    except ImportError:
+        data, content_type = thumbnail_cache.get_thumbnail_variant(url, width)
+
+    if data is None:
+        # 실패 시 원본 주소로 넘김
+        return bottle.redirect(url)
+
+    cache_headers['Content-Type'] = content_type
+    return bottle.HTTPResponse(body=data, status=200, headers=cache_headers)
+
+
 @eel.expose
 def get_config_status():
     """
@@ -186,7 +241,6 @@ def login(client_id, client_secret):
 
     try:
         from google_auth_oauthlib.flow import InstalledAppFlow
-        from googleapiclient.discovery import build
 
         # OAuth 설정
         config.set_current_credentials('', client_id, client_secret)
@@ -218,7 +272,7 @@ def login(client_id, client_secret):
         )
 
         # YouTube 서비스 생성
-        youtube_service = build('youtube', 'v3', credentials=creds)
+        youtube_service = build_youtube_service(creds)
 
         print("[로그인] 로그인 성공!")
         return {'success': True}
@@ -277,19 +331,15 @@ def login_with_preset_oauth(name_part, auto_login=False):
             if token_data:
                 try:
                     from google.oauth2.credentials import Credentials
-                    from google.auth.transport.requests import Request
-                    from googleapiclient.discovery import build
-
-                    creds = Credentials.from_authorized_user_info(token_data)
 
-                    # 토큰 만료 시 갱신
-                    if creds and creds.expired and creds.refresh_token:
-                        creds.refresh(Request())
-                        # 갱신된 토큰 저장 (암호화)
-                        save_token_credentials(name_part, creds.to_json())
+                    # 계정별 서비스 풀에서 재사용 (만료 시 갱신 후 암호화 저장, 이후 백그라운드 선갱신)
+                    youtube_service = service_pool.get(
+                        f'preset:{name_part}',
+                        lambda: Credentials.from_authorized_user_info(token_data),
+                        on_refresh=lambda c: save_token_credentials(name_part, c.to_json())
+                    )
 
-                    if creds and creds.valid:
-                        youtube_service = build('youtube', 'v3', credentials=creds)
+                    if youtube_service:
                         return {
                             'success': True,
                             'autoLogin': True,
@@ -344,7 +394,6 @@ def create_token_for_account(name_part):
 
     try:
         from google_auth_oauthlib.flow import InstalledAppFlow
-        from googleapiclient.discovery import build
 
         # OAuth 자격증명 로드
         oauth_data = load_oauth_credentials(name_part)
@@ -386,8 +435,11 @@ def create_token_for_account(name_part):
             # 캐시 매니저 설정
             cache_manager.set_current_preset_account(name_part)
 
-            # YouTube 서비스 생성
-            youtube_service = build('youtube', 'v3', credentials=creds)
+            # YouTube 서비스 생성 (이전 토큰으로 만든 서비스 교체)
+            youtube_service = service_pool.put(
+                f'preset:{name_part}', creds,
+                on_refresh=lambda c: save_token_credentials(name_part, c.to_json())
+            )
 
             return {
                 'success': True,
@@ -418,6 +470,7 @@ def delete_account_token(name_part):
     try:
         from data_path import delete_token_credentials
         delete_token_credentials(name_part)
+        service_pool.discard(f'preset:{name_part}')
         return {'success': True, 'message': f'{name_part} 토큰이 삭제되었습니다.'}
     except Exception as e:
         return {'success': False, 'error': str(e)}
@@ -791,8 +844,7 @@ def start_login_with_browser():
                 print(f"토큰 저장 실패 (무시됨): {e}")
 
         # YouTube 서비스 생성
-        from googleapiclient.discovery import build
-        youtube_service = build('youtube', 'v3', credentials=creds)
+        youtube_service = build_youtube_service(creds)
 
         print("로그인 성공!")
         return {'success': True}
@@ -823,8 +875,7 @@ def complete_login(auth_code):
             return {'success': False, 'error': '인증 코드가 올바르지 않습니다.\n다시 시도해주세요.'}
 
         # YouTube 서비스 생성
-        from googleapiclient.discovery import build
-        youtube_service = build('youtube', 'v3', credentials=creds)
+        youtube_service = build_youtube_service(creds)
 
         return {'success': True}
     except Exception as e:
@@ -1149,7 +1200,7 @@ def search_popular_videos(region_code='KR', category='0'):
 
         print(f"인기 동영상 검색 시작... (국가: {region_code}, 카테고리: {category})")
 
-        eel.update_progress("인기 동영상 조회 중...", 30)()
+        progress_hub.publish('update_progress', "인기 동영상 조회 중...", 30)
 
         all_videos = []
 
@@ -1170,7 +1221,7 @@ def search_popular_videos(region_code='KR', category='0'):
                 print(f"카테고리 {category} 조회 실패, 전체 조회로 대체: {e}")
                 all_videos = get_popular_videos(youtube_service, region_code=region_code, max_results=50)
 
-        eel.update_progress("완료!", 100)()
+        progress_hub.publish('update_progress', "완료!", 100, final=True)
 
         # 조회수 내림차순 정렬
         all_videos.sort(key=lambda x: x.get('viewCount', 0), reverse=True)
@@ -1195,9 +1246,11 @@ def search_popular_videos(region_code='KR', category='0'):
 
 
 @eel.expose
-def search_youtube_global(keyword, days_within=7, video_type='long'):
+def search_youtube_global(keyword, days_within=7, video_type='long', load_more=False):
     """
     YouTube 전체에서 키워드로 영상을 검색합니다.
+    같은 조건(키워드, 기간, 타입)의 결과는 캐시에서 반환하고,
+    load_more=True이면 nextPageToken으로 다음 페이지만 추가 조회합니다.
     """
     global youtube_service
 
@@ -1208,26 +1261,61 @@ def search_youtube_global(keyword, days_within=7, video_type='long'):
     days_within = int(days_within)
 
     try:
-        # OAuth 서비스 사용
-        if not youtube_service:
-            youtube_service = get_authenticated_service()
+        cached = cache_manager.load_search_results(keyword, days_within, video_type)
+        from_cache = bool(cached) and not load_more
 
-        if not youtube_service:
-            return {'success': False, 'error': '로그인이 필요합니다.'}
+        if cached and load_more and not cached['pages'][-1].get('nextPageToken'):
+            # 더 가져올 페이지가 없음
+            from_cache = True
 
-        print(f"YouTube 전체 검색: '{keyword}' (기간: {days_within}일, 타입: {video_type})")
-        eel.update_progress("YouTube 검색 중...", 30)()
+        if not from_cache:
+            # OAuth 서비스 사용
+            if not youtube_service:
+                youtube_service = get_authenticated_service()
 
-        # YouTube 검색 API 호출
-        videos = search_youtube_videos(
-            youtube_service,
-            query=keyword,
-            days_within=days_within,
-            video_type=video_type,
-            max_results=50
-        )
+            if not youtube_service:
+                return {'success': False, 'error': '로그인이 필요합니다.'}
+
+            if cached and load_more:
+                page_index = len(cached['pages'])
+                page_token = cached['pages'][-1]['nextPageToken']
+                published_after = cached.get('publishedAfter')
+            else:
+                page_index = 0
+                page_token = None
+                published_after = None
+
+            print(f"YouTube 전체 검색: '{keyword}' (기간: {days_within}일, 타입: {video_type}, 페이지: {page_index + 1})")
+            progress_hub.publish('update_progress', "YouTube 검색 중...", 30)
+
+            # YouTube 검색 API 호출
+            page = search_youtube_videos_page(
+                youtube_service,
+                query=keyword,
+                days_within=days_within,
+                video_type=video_type,
+                max_results=50,
+                page_token=page_token,
+                published_after=published_after
+            )
 
-        eel.update_progress("완료!", 100)()
+            cached = cache_manager.save_search_page(
+                keyword, days_within, video_type, page_index,
+                page['videos'], page['nextPageToken'], page['publishedAfter']
+            )
+
+            progress_hub.publish('update_progress', "완료!", 100, final=True)
+        else:
+            print(f"YouTube 전체 검색: '{keyword}' 캐시 사용 ({len(cached['pages'])}페이지)")
+
+        # 페이지 합치기 (페이지 간 중복 제거)
+        videos = []
+        seen_ids = set()
+        for cached_page in cached['pages']:
+            for video in cached_page['videos']:
+                if video['videoId'] not in seen_ids:
+                    seen_ids.add(video['videoId'])
+                    videos.append(video)
 
         # 조회수 내림차순 정렬
         videos.sort(key=lambda x: x.get('viewCount', 0), reverse=True)
@@ -1240,7 +1328,10 @@ def search_youtube_global(keyword, days_within=7, video_type='long'):
             'stats': {
                 'total': len(videos),
                 'filtered': len(videos),
-                'keyword': keyword
+                'keyword': keyword,
+                'pages': len(cached['pages']),
+                'hasMore': bool(cached['pages'][-1].get('nextPageToken')),
+                'fromCache': from_cache
             }
         }
 
@@ -1261,6 +1352,7 @@ def cancel_search():
 
 
 @eel.expose
+@tracing.traced_job('search_videos')
 def search_videos(filter_config):
     """
     조건에 맞는 영상을 검색합니다.
@@ -1319,7 +1411,8 @@ def search_videos(filter_config):
         else:
             # 1단계: 채널 구독자 수 조회
             print("1단계: 채널 정보 조회 중...")
-            eel.update_progress("채널 정보 조회 중...", 10)()
+            progress_hub.publish('update_progress', "채널 정보 조회 중...", 10)
+            tracing.stage('channels')
             channel_info = get_channels_batch(youtube_service, channel_ids)
 
         # 취소 확인
@@ -1328,16 +1421,18 @@ def search_videos(filter_config):
 
         # 2단계: RSS로 최신 영상 수집 (채널당 최대 15개)
         print("2단계: RSS 피드 수집 중...")
-        eel.update_progress("RSS 피드 수집 중...", 20)()
+        progress_hub.publish('update_progress', "RSS 피드 수집 중...", 20)
+        tracing.stage('rss')
 
         def rss_progress(current, total):
             percent = 20 + int((current / total) * 30)
-            eel.update_progress(f"RSS 수집: {current}/{total}", percent)()
+            progress_hub.publish('update_progress', f"RSS 수집: {current}/{total}", percent)
             # RSS 수집 중에도 취소 확인
             return not search_cancelled
 
         all_videos = fetch_all_channels(channel_ids, days_within, rss_progress)
         rss_video_count = len(all_videos)
+        tracing.count('rss_videos', rss_video_count)
         print(f"RSS에서 {rss_video_count}개 영상 수집됨")
 
         # 취소 확인
@@ -1349,7 +1444,8 @@ def search_videos(filter_config):
         # RSS 전용 모드에서는 건너뜀
         if not rss_only_mode and days_within > 7:  # 7일 초과 기간일 때만 하이브리드 적용
             print("2.5단계: API로 추가 영상 조회 중...")
-            eel.update_progress("API로 추가 조회 중...", 55)()
+            progress_hub.publish('update_progress', "API로 추가 조회 중...", 55)
+            tracing.stage('api_uploads')
 
             # RSS에서 채널별 영상 수 계산
             channel_video_counts = {}
@@ -1376,7 +1472,7 @@ def search_videos(filter_config):
 
                     # 진행률 업데이트
                     percent = 55 + int((i / len(channels_need_api)) * 15)
-                    eel.update_progress(f"API 조회: {i+1}/{len(channels_need_api)}", percent)()
+                    progress_hub.publish('update_progress', f"API 조회: {i+1}/{len(channels_need_api)}", percent)
 
                     # playlistItems API로 추가 영상 조회 (최대 50개, 기간 내)
                     api_videos = get_channel_uploads(
@@ -1397,6 +1493,21 @@ def search_videos(filter_config):
 
         print(f"총 {len(all_videos)}개 영상 수집됨 (RSS: {rss_video_count}, API: {len(all_videos) - rss_video_count})")
 
+        # 수집한 영상 제목을 역색인에 증분 추가 (저장은 저장 스레드가 모아서 처리)
+        tracing.stage('title_index')
+        title_index.add_videos(all_videos)
+
+        # 키워드검색: 제목 매칭은 역색인으로 한 번에 계산
+        # ('|' = OR, ',' = AND, includeHistory면 기간 밖의 과거 수집 영상도 포함)
+        keyword_matched_ids = None
+        if filter_type == 'keyword-search' and keyword:
+            keyword_matched_ids = title_index.search(keyword, channel_ids=channel_ids)
+            if filter_config.get('includeHistory'):
+                collected_ids = {v['videoId'] for v in all_videos}
+                history_videos = title_index.get_videos(keyword_matched_ids - collected_ids)
+                all_videos.extend(history_videos)
+                print(f"  - 제목 색인에서 과거 영상 {len(history_videos)}개 추가됨")
+
         # 취소 확인
         if search_cancelled:
             return {'success': False, 'error': '검색이 중단되었습니다.', 'cancelled': True}
@@ -1411,7 +1522,8 @@ def search_videos(filter_config):
         # 3단계: 영상 상세 정보 조회
         # RSS 모드에서도 롱폼/쇼츠 구분을 위해 영상 길이 정보는 조회함
         print("3단계: 영상 정보 조회 중...")
-        eel.update_progress("영상 정보 조회 중...", 75)()
+        progress_hub.publish('update_progress', "영상 정보 조회 중...", 75)
+        tracing.stage('video_details')
         video_ids = [v['videoId'] for v in all_videos]
         video_info = get_videos_batch(youtube_service, video_ids)
 
@@ -1421,7 +1533,8 @@ def search_videos(filter_config):
 
         # 4단계: 필터링
         print("4단계: 필터 적용 중...")
-        eel.update_progress("필터 적용 중...", 90)()
+        progress_hub.publish('update_progress', "필터 적용 중...", 90)
+        tracing.stage('filter')
 
         filtered_videos = []
 
@@ -1478,8 +1591,8 @@ def search_videos(filter_config):
                     continue
 
             elif filter_type == 'keyword-search':
-                # 키워드검색: 제목에 키워드 포함 & 조회수 이상
-                if keyword and keyword.lower() not in video['title'].lower():
+                # 키워드검색: 제목에 키워드 포함 (역색인 결과) & 조회수 이상
+                if keyword_matched_ids is not None and video_id not in keyword_matched_ids:
                     continue
                 if view_count < min_views:
                     continue
@@ -1522,17 +1635,36 @@ def search_videos(filter_config):
         else:
             filtered_videos.sort(key=lambda x: x['viewCount'], reverse=True)
 
-        eel.update_progress("완료!", 100)()
+        progress_hub.publish('update_progress', "완료!", 100, final=True)
         print(f"필터링 결과: {len(filtered_videos)}개 (RSS 모드: {rss_only_mode})")
+        tracing.count('filtered_videos', len(filtered_videos))
+
+        stats = {
+            'total': len(all_videos),
+            'filtered': len(filtered_videos),
+            'rssMode': rss_only_mode
+        }
+        result_id = search_results.store_results(filtered_videos, stats)
+
+        # windowSize가 있으면 첫 구간만 전송 (나머지는 get_search_results_window로 조회)
+        window_size = filter_config.get('windowSize')
+        if window_size:
+            sort_key = 'date' if rss_only_mode else {'mutation': 'ratio'}.get(filter_type, 'views')
+            window = search_results.get_results_window(result_id, 0, window_size, sort_key)
+            return {
+                'success': True,
+                'resultId': result_id,
+                'windowed': True,
+                'sortKey': sort_key,
+                'videos': window['videos'],
+                'stats': stats
+            }
 
         return {
             'success': True,
+            'resultId': result_id,
             'videos': filtered_videos,
-            'stats': {
-                'total': len(all_videos),
-                'filtered': len(filtered_videos),
-                'rssMode': rss_only_mode
-            }
+            'stats': stats
         }
 
     except Exception as e:
@@ -1540,6 +1672,28 @@ def search_videos(filter_config):
         return {'success': False, 'error': str(e)}
 
 
+@eel.expose
+def get_search_results_window(result_id, offset=0, limit=50, sort_key='views', descending=None,
+                              filter_text='', exclude_ids=None):
+    """
+    search_videos 결과 중 화면에 보이는 구간만 반환합니다.
+    정렬/결과 내 검색/완료 제외는 백엔드에서 처리하므로 브라우저는 전체 목록을 가질 필요가 없습니다.
+
+    Returns:
+        dict: {'success': True, 'videos': [...], 'offset': int, 'total': int, 'count': int, 'stats': {...}}
+    """
+    return search_results.get_results_window(
+        result_id, offset, limit, sort_key, descending, filter_text, exclude_ids
+    )
+
+
+@eel.expose
+def release_search_results(result_id):
+    """더 이상 쓰지 않는 검색 결과를 백엔드에서 삭제합니다."""
+    search_results.release_results(result_id)
+    return {'success': True}
+
+
 @eel.expose
 def clear_cache():
     """모든 캐시를 삭제합니다."""
@@ -1680,7 +1834,7 @@ def import_subscriptions():
 
             # 진행률 업데이트
             percent = int((i / total) * 100)
-            eel.update_progress(f"구독 중: {channel_title} ({i+1}/{total})", percent)()
+            progress_hub.publish('update_progress', f"구독 중: {channel_title} ({i+1}/{total})", percent)
 
             # 이미 구독 중이면 건너뛰기
             if channel_id in current_subs:
@@ -1714,7 +1868,7 @@ def import_subscriptions():
                 fail_count += 1
                 print(f"구독 실패 ({channel_title}): {e}")
 
-        eel.update_progress("완료!", 100)()
+        progress_hub.publish('update_progress', "완료!", 100, final=True)
 
         return {
             'success': True,
@@ -1794,7 +1948,7 @@ def unsubscribe_channels_batch(channel_ids):
         for i, channel_id in enumerate(channel_ids):
             # 진행률 업데이트
             percent = int((i / total) * 100)
-            eel.update_progress(f"구독 취소 중: {i+1}/{total}", percent)()
+            progress_hub.publish('update_progress', f"구독 취소 중: {i+1}/{total}", percent)
 
             try:
                 # 구독 ID 찾기
@@ -1830,7 +1984,7 @@ def unsubscribe_channels_batch(channel_ids):
         # 캐시 업데이트
         cache_manager.save_subscriptions(subscriptions)
 
-        eel.update_progress("완료!", 100)()
+        progress_hub.publish('update_progress', "완료!", 100, final=True)
 
         return {
             'success': True,
@@ -2107,7 +2261,7 @@ def resolve_channel_urls(urls):
 
         def progress_callback(current, total_count, url, result):
             percent = int((current / total_count) * 50)
-            eel.update_progress(f"채널 조회: {current}/{total_count}", percent)()
+            progress_hub.publish('update_progress', f"채널 조회: {current}/{total_count}", percent)
 
         resolved = resolve_channel_ids_batch(youtube_service, urls, progress_callback)
 
@@ -2151,7 +2305,7 @@ def subscribe_channels_from_urls(channel_ids):
         import time
 
         # 현재 구독 중인 채널 ID 목록 가져오기 (할당량 절약을 위해)
-        eel.update_progress("구독 목록 확인 중...", 0)()
+        progress_hub.publish('update_progress', "구독 목록 확인 중...", 0)
         existing_channel_ids = set()
 
         # 이미 로드된 구독 목록이 있으면 사용
@@ -2186,7 +2340,7 @@ def subscribe_channels_from_urls(channel_ids):
         print(f"총 {len(channel_ids)}개 중 {already_subscribed}개 이미 구독, {len(new_channel_ids)}개 새로 구독 예정")
 
         if not new_channel_ids:
-            eel.update_progress("완료!", 100)()
+            progress_hub.publish('update_progress', "완료!", 100, final=True)
             return {
                 'success': True,
                 'total': len(channel_ids),
@@ -2202,7 +2356,7 @@ def subscribe_channels_from_urls(channel_ids):
 
         for i, channel_id in enumerate(new_channel_ids):
             percent = int(((i + 1) / total) * 100)
-            eel.update_progress(f"구독 중: {i+1}/{total} (건너뜀: {already_subscribed})", percent)()
+            progress_hub.publish('update_progress', f"구독 중: {i+1}/{total} (건너뜀: {already_subscribed})", percent)
 
             try:
                 youtube_service.subscriptions().insert(
@@ -2230,7 +2384,7 @@ def subscribe_channels_from_urls(channel_ids):
             # API 속도 제한 방지
             time.sleep(0.3)
 
-        eel.update_progress("완료!", 100)()
+        progress_hub.publish('update_progress', "완료!", 100, final=True)
 
         return {
             'success': True,
@@ -2444,8 +2598,7 @@ def login_account(account_id):
             return {'success': False, 'error': '토큰 교환에 실패했습니다.'}
 
         # YouTube 서비스 생성
-        from googleapiclient.discovery import build
-        youtube_service = build('youtube', 'v3', credentials=creds)
+        youtube_service = build_youtube_service(creds)
 
         # 채널 정보 조회하여 계정 정보 업데이트
         try:
@@ -2840,6 +2993,50 @@ def get_video_comments_filtered(video_id, keywords=None, max_count=20):
         return {'success': False, 'error': str(e), 'comments': []}
 
 
+@eel.expose
+def get_startup_report():
+    """시작 시간 보고 (모듈별 import 시간, 지연 로딩 상태)"""
+    return {
+        'success': True,
+        'startup': startup_report,
+        'modules': lazy_loader.get_import_report(lazy_loader.REPORT_TOP_N),
+        'studioLoaded': all(name in sys.modules for name in studio_backend.STUDIO_LAZY_MODULES)
+    }
+
+
+startup_report = None
+
+
+@eel.expose
+def get_trace_jobs():
+    """추적된 작업 목록과 작업별 단계 요약 (검색, 영상 제작 등)"""
+    jobs = tracing.list_jobs()
+    for job in jobs:
+        job['summary'] = tracing.get_job_summary(job['id'])
+    return {'success': True, 'jobs': jobs}
+
+
+@eel.expose
+def export_trace(job_id=None):
+    """추적 기록을 Chrome trace/Perfetto JSON으로 저장 (DATA_DIR/traces)"""
+    from datetime import datetime
+    try:
+        filename = f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        path = os.path.join(DATA_DIR, 'traces', filename)
+        count = tracing.export_chrome_trace(path, job_id)
+        print(f"[추적] {count}개 이벤트 저장: {path}")
+        return {'success': True, 'path': path, 'events': count}
+    except Exception as e:
+        print(f"[추적] 저장 실패: {e}")
+        return {'success': False, 'error': str(e)}
+
+
+@eel.expose
+def get_progress_state(key=None):
+    """작업별 최신 진행 상태 조회 (진행률 이벤트를 놓친 경우 등)"""
+    return {'success': True, 'state': progress_hub.get_state(key) if key else progress_hub.get_state()}
+
+
 def on_close(page, sockets):
     """브라우저 창이 닫히면 프로그램 종료 (토큰은 유지 - 토큰생성기로 미리 만들어둔 토큰 보존)"""
     print("\n[종료] 브라우저 창이 닫혔습니다. 프로그램을 종료합니다...")
@@ -3133,7 +3330,7 @@ def start_media_processing(file_list, output_folder, options):
 
             out_dir = os.path.dirname(filepath) if same_folder else output_folder
 
-            eel.update_media_progress(i, total, filename, 'processing', '처리 중...')()
+            progress_hub.publish('update_media_progress', i, total, filename, 'processing', '처리 중...', key=('media', i))
 
             audio_path = filepath
 
@@ -3146,30 +3343,30 @@ def start_media_processing(file_list, output_folder, options):
                     mp3_path = os.path.join(out_dir, f'{name_only}_{counter}.mp3')
                     counter += 1
 
-                eel.update_media_progress(i, total, filename, 'processing', 'MP3 추출 중... 0%')()
+                progress_hub.publish('update_media_progress', i, total, filename, 'processing', 'MP3 추출 중... 0%', key=('media', i))
 
                 # 진행률 콜백 함수
                 def on_extract_progress(percent):
                     try:
-                        eel.update_media_progress(i, total, filename, 'processing', f'MP3 추출 중... {percent}%')()
+                        progress_hub.publish('update_media_progress', i, total, filename, 'processing', f'MP3 추출 중... {percent}%', key=('media', i))
                     except:
                         pass
 
                 success, error = extract_audio_from_video(filepath, mp3_path, bitrate, on_extract_progress)
                 if not success:
-                    eel.update_media_progress(i, total, filename, 'error', f'MP3 실패')()
+                    progress_hub.publish('update_media_progress', i, total, filename, 'error', f'MP3 실패', key=('media', i), final=True)
                     continue
 
                 audio_path = mp3_path
 
             # 텍스트 변환
             if transcribe:
-                eel.update_media_progress(i, total, filename, 'processing', '텍스트 변환 중...')()
+                progress_hub.publish('update_media_progress', i, total, filename, 'processing', '텍스트 변환 중...', key=('media', i))
 
                 result, error = transcribe_audio_file(audio_path, language)
                 if result is None:
                     print(f"[Whisper 에러] {filename}: {error}")
-                    eel.update_media_progress(i, total, filename, 'error', f'변환 실패: {error}')()
+                    progress_hub.publish('update_media_progress', i, total, filename, 'error', f'변환 실패: {error}', key=('media', i), final=True)
                     continue
 
                 ext_map = {'txt': '.txt', 'txt_timestamp': '_timestamp.txt', 'srt': '.srt', 'json': '.json'}
@@ -3185,7 +3382,7 @@ def start_media_processing(file_list, output_folder, options):
 
                 save_transcription_result(result, txt_path, out_fmt)
 
-            eel.update_media_progress(i, total, filename, 'done', '완료!')()
+            progress_hub.publish('update_media_progress', i, total, filename, 'done', '완료!', key=('media', i), final=True)
 
         eel.media_processing_complete()()
 
@@ -4292,11 +4489,8 @@ def export_thumbnails_to_pdf(thumbnail_urls):
     try:
         from reportlab.lib.pagesizes import A4
         from reportlab.pdfgen import canvas
-        from reportlab.lib.units import mm
-        from PIL import Image
-        import requests
+        from reportlab.lib.utils import ImageReader
         from io import BytesIO
-        import tempfile
         import datetime
 
         if not thumbnail_urls or len(thumbnail_urls) == 0:
@@ -4352,35 +4546,28 @@ def export_thumbnails_to_pdf(thumbnail_urls):
                                  page_height - 20, page_text)
 
         print(f"[PDF] 썸네일 {len(thumbnail_urls)}개를 PDF로 생성 중...")
-        total_thumbs = len(thumbnail_urls)
 
-        for i, url in enumerate(thumbnail_urls):
-            try:
-                # 진행률 업데이트 (다운로드 단계)
-                progress_percent = int((i / total_thumbs) * 100)
+        # 썸네일 병렬 다운로드 (디스크 캐시 우선)
+        def download_progress(done, total):
+            # 진행률 업데이트 (다운로드 단계, 10개 단위로 전송)
+            if done % 10 == 0 or done == total:
                 try:
-                    eel.updatePdfProgress(f'썸네일 다운로드 중... ({i+1}/{total_thumbs})', progress_percent)
+                    eel.updatePdfProgress(f'썸네일 다운로드 중... ({done}/{total})', int(done / total * 90))
                 except:
                     pass
 
-                # 썸네일 다운로드
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-                img = Image.open(BytesIO(response.content))
+        images = thumbnail_cache.fetch_thumbnails(thumbnail_urls, progress_callback=download_progress)
 
-                # 임시 파일로 저장 (reportlab는 PIL 객체를 직접 사용 못함)
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as tmp_file:
-                    img.save(tmp_file.name, 'JPEG')
-                    tmp_path = tmp_file.name
+        for i, image_data in enumerate(images):
+            try:
+                if image_data is None:
+                    raise ValueError('다운로드 실패')
 
-                # PDF에 이미지 추가
-                c.drawImage(tmp_path, current_x, current_y,
+                # PDF에 이미지 추가 (임시 파일 없이 메모리에서 바로 전달)
+                c.drawImage(ImageReader(BytesIO(image_data)), current_x, current_y,
                            width=thumb_width, height=thumb_height,
                            preserveAspectRatio=True, mask='auto')
 
-                # 임시 파일 삭제
-                os.unlink(tmp_path)
-
                 # 다음 위치 계산
                 current_x += thumb_width + thumb_spacing
                 thumb_count += 1
@@ -4697,6 +4884,10 @@ if __name__ == '__main__':
     port = find_free_port(8000)
     print(f"포트 {port}에서 실행합니다...")
 
+    # 시작 보고 후, 창이 뜨고 나면 스튜디오 모듈을 백그라운드에서 미리 로드
+    startup_report = lazy_loader.finish_startup()
+    lazy_loader.warm_up(studio_backend.STUDIO_LAZY_MODULES)
+
     try:
         # Chrome만 사용 - 전체화면으로 시작
         import ctypes
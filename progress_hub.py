@@ -0,0 +1,127 @@
+"""
+진행률 전달 모듈
+- 작업 스레드는 진행률을 기록만 하고 바로 반환 (UI 응답을 기다리지 않음)
+- 같은 작업(키)의 진행률은 마지막 값만 남기고(병합), 백그라운드 스레드가 일정 주기로 전달
+- 작업별 최신 진행 상태 조회 가능 (get_state)
+
+사용 예:
+    progress_hub.publish('update_progress', "RSS 수집: 3/10", 35)
+    progress_hub.publish('update_progress', "완료!", 100, final=True)   # 마지막 값은 즉시 전달
+    progress_hub.publish('update_media_progress', i, total, name, 'done', '완료!', key=('media', i), final=True)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import eel
+
+FORWARD_INTERVAL = 0.1  # 전달 주기 (초) - 작업별 초당 최대 10회
+
+
+class ProgressHub:
+    """작업별 최신 진행률을 모아 일정 주기로 프론트엔드에 전달"""
+
+    def __init__(self, interval=FORWARD_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()  # key -> (함수 이름, args)
+        self._state = {}  # key -> 최신 상태
+        self._send_lock = threading.Lock()  # 이전 값이 최종 값보다 늦게 전달되지 않도록
+        self._forwarder = None
+        self.published = 0
+        self.forwarded = 0
+
+    def publish(self, function_name, *args, key=None, final=False):
+        """
+        진행률을 기록합니다.
+
+        Args:
+            function_name: 호출할 프론트엔드(eel.expose) 함수 이름
+            *args: 함수 인자
+            key: 병합 단위 (기본값: 함수 이름) - 파일별 진행률처럼 따로 보여야 하면 별도 키
+            final: True면 대기 중인 값을 버리고 즉시 전달 (완료/오류 등 마지막 상태)
+        """
+        key = key if key is not None else function_name
+        state = {
+            'function': function_name,
+            'args': list(args),
+            'final': final,
+            'updatedAt': time.time()
+        }
+
+        if not final:
+            with self._lock:
+                self.published += 1
+                self._state[key] = state
+                self._pending[key] = (function_name, args)
+            self._ensure_forwarder()
+            return
+
+        with self._send_lock:
+            with self._lock:
+                self.published += 1
+                self._state[key] = state
+                self._pending.pop(key, None)
+            self._send(function_name, args)
+
+    def get_state(self, key=None):
+        """
+        최신 진행 상태를 반환합니다.
+
+        Returns:
+            key 지정 시: {'function', 'args', 'final', 'updatedAt'} 또는 None
+            미지정 시: {str(key): 상태, ...}
+        """
+        with self._lock:
+            if key is not None:
+                state = self._state.get(key)
+                if state is None:
+                    # 프론트엔드에서는 튜플 키를 문자열로 조회
+                    state = next((v for k, v in self._state.items() if str(k) == key), None)
+                return dict(state) if state else None
+            return {str(k): dict(v) for k, v in self._state.items()}
+
+    def clear(self, key=None):
+        """저장된 상태를 지웁니다 (key 미지정 시 전체)."""
+        with self._lock:
+            if key is None:
+                self._state.clear()
+                self._pending.clear()
+            else:
+                self._state.pop(key, None)
+                self._pending.pop(key, None)
+
+    def flush(self):
+        """대기 중인 진행률을 지금 전달합니다."""
+        with self._send_lock:
+            with self._lock:
+                pending = list(self._pending.values())
+                self._pending.clear()
+            for function_name, args in pending:
+                self._send(function_name, args)
+
+    def _send(self, function_name, args):
+        try:
+            # 반환값을 기다리지 않는 호출 (끝에 () 없음)
+            getattr(eel, function_name)(*args)
+            self.forwarded += 1
+        except Exception:
+            pass  # 프론트엔드 연결 안됨
+
+    def _ensure_forwarder(self):
+        if self._forwarder is not None:
+            return
+        with self._lock:
+            if self._forwarder is None:
+                self._forwarder = threading.Thread(target=self._forward_loop, daemon=True)
+                self._forwarder.start()
+
+    def _forward_loop(self):
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+
+# 전역 인스턴스
+progress_hub = ProgressHub()
@@ -7,7 +7,9 @@
 import os
 import tempfile
 from google.cloud import texttospeech
-from pydub import AudioSegment
+import tts_client_pool
+import audio_duration
+import audio_assembly
 import datetime
 
 
@@ -27,7 +29,7 @@ def generate_quick_tts(text, voice_name):
         }
     """
     try:
-        client = texttospeech.TextToSpeechClient()
+        client = tts_client_pool.get_client()  # 기본 인증 클라이언트 재사용
 
         synthesis_input = texttospeech.SynthesisInput(text=text)
 
@@ -51,9 +53,8 @@ def generate_quick_tts(text, voice_name):
         temp_file.write(response.audio_content)
         temp_file.close()
 
-        # 오디오 길이 계산
-        audio = AudioSegment.from_mp3(temp_file.name)
-        duration = len(audio) / 1000.0  # 밀리초를 초로 변환
+        # 오디오 길이 계산 (프레임 헤더만 읽음 - 디코딩 없음)
+        duration = audio_duration.probe_duration(response.audio_content)
 
         return {
             'success': True,
@@ -81,11 +82,11 @@ def combine_audio_files_only(audio_segments, output_path):
         dict: {'success': bool, 'mp3_path': str}
     """
     try:
-        combined = AudioSegment.empty()
+        # PCM으로 모았다가 한 번에 결합
+        assembler = audio_assembly.AudioAssembler()
 
         for segment in audio_segments:
-            audio = AudioSegment.from_mp3(segment['file'])
-            combined += audio
+            assembler.add_file(segment['file'])
 
             # 임시 파일 삭제
             try:
@@ -94,7 +95,7 @@ def combine_audio_files_only(audio_segments, output_path):
                 pass
 
         # MP3로 저장
-        combined.export(output_path, format='mp3')
+        assembler.build().export_mp3(output_path, bitrate=None)
 
         return {
             'success': True,
@@ -132,11 +133,11 @@ def combine_audio_and_generate_srt(audio_segments, base_path):
     """
     try:
         # MP3 결합
-        combined = AudioSegment.empty()
+        # PCM으로 모았다가 한 번에 결합
+        assembler = audio_assembly.AudioAssembler()
 
         for segment in audio_segments:
-            audio = AudioSegment.from_mp3(segment['file'])
-            combined += audio
+            assembler.add_file(segment['file'])
 
             # 임시 파일 삭제
             try:
@@ -145,7 +146,7 @@ def combine_audio_and_generate_srt(audio_segments, base_path):
                 pass
 
         mp3_path = base_path + '.mp3'
-        combined.export(mp3_path, format='mp3')
+        assembler.build().export_mp3(mp3_path, bitrate=None)
 
         # SRT 생성
         srt_path = base_path + '.srt'
@@ -0,0 +1,144 @@
+"""
+검색 결과 보관 모듈
+- search_videos 결과를 백엔드에 보관하고 구간(윈도우) 단위로 반환
+- 정렬 키별 정렬 순서를 캐싱하여 재정렬 시 전체 목록을 다시 보내지 않음
+- 결과 내 텍스트 검색, 완료 영상 제외
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+
+MAX_RESULT_SETS = 10  # 보관할 최대 결과 세트 수 (오래된 것부터 삭제)
+
+# 정렬 키: (정렬 기준 함수, 기본 내림차순 여부)
+SORT_KEYS = {
+    'views': (lambda v: v.get('viewCount', 0), True),
+    'date': (lambda v: v.get('publishedAt', ''), True),
+    'ratio': (lambda v: v.get('ratio', 0), True),
+    'subscribers': (lambda v: v.get('subscriberCount', 0), True),
+    'likes': (lambda v: v.get('likeCount', 0), True),
+    'duration': (lambda v: v.get('duration', 0), True),
+    'title': (lambda v: v.get('title', ''), False),
+}
+
+_result_sets = OrderedDict()
+_lock = threading.Lock()
+
+
+class _ResultSet:
+    """검색 결과 한 세트와 정렬/필터 캐시"""
+
+    def __init__(self, videos, stats):
+        self.videos = videos
+        self.stats = stats
+        self._sorted = {}  # (sort_key, descending) -> 인덱스 리스트
+        self._filtered = None  # (sort_key, descending, filter_text, exclude_ids) -> 인덱스 리스트
+        self._lowered = None  # 텍스트 검색용 소문자 제목/채널명
+
+    def sorted_indices(self, sort_key, descending):
+        key = (sort_key, descending)
+        if key not in self._sorted:
+            key_func = SORT_KEYS[sort_key][0]
+            self._sorted[key] = sorted(
+                range(len(self.videos)),
+                key=lambda i: key_func(self.videos[i]),
+                reverse=descending
+            )
+        return self._sorted[key]
+
+    def view(self, sort_key, descending, filter_text, exclude_ids):
+        """정렬 + 필터 적용된 인덱스 리스트 (마지막 조건 결과를 캐싱)"""
+        cache_key = (sort_key, descending, filter_text, exclude_ids)
+        if self._filtered and self._filtered[0] == cache_key:
+            return self._filtered[1]
+
+        indices = self.sorted_indices(sort_key, descending)
+
+        if filter_text:
+            if self._lowered is None:
+                self._lowered = [
+                    (v.get('title', '').lower(), v.get('channelTitle', '').lower())
+                    for v in self.videos
+                ]
+            indices = [
+                i for i in indices
+                if filter_text in self._lowered[i][0] or filter_text in self._lowered[i][1]
+            ]
+
+        if exclude_ids:
+            indices = [i for i in indices if self.videos[i]['videoId'] not in exclude_ids]
+
+        self._filtered = (cache_key, indices)
+        return indices
+
+
+def store_results(videos, stats=None):
+    """
+    검색 결과를 보관하고 결과 ID를 반환합니다.
+
+    Args:
+        videos: 영상 리스트
+        stats: 검색 통계 (get_results_window 응답에 함께 반환)
+
+    Returns:
+        str: 결과 ID
+    """
+    result_id = uuid.uuid4().hex
+    with _lock:
+        _result_sets[result_id] = _ResultSet(videos, stats or {})
+        while len(_result_sets) > MAX_RESULT_SETS:
+            _result_sets.popitem(last=False)
+    return result_id
+
+
+def get_results_window(result_id, offset=0, limit=50, sort_key='views', descending=None,
+                       filter_text='', exclude_ids=None):
+    """
+    보관된 검색 결과의 일부 구간을 반환합니다.
+
+    Args:
+        result_id: store_results가 반환한 ID
+        offset: 시작 위치
+        limit: 개수 (None이면 끝까지)
+        sort_key: SORT_KEYS 중 하나 (알 수 없는 값이면 'views')
+        descending: 내림차순 여부 (None이면 정렬 키 기본값)
+        filter_text: 제목/채널명 검색어
+        exclude_ids: 제외할 영상 ID 리스트 (완료 숨기기)
+
+    Returns:
+        dict: {'success': True, 'videos': [...], 'offset': int, 'total': int, 'count': int, 'stats': {...}}
+              또는 {'success': False, 'error': str}
+    """
+    if sort_key not in SORT_KEYS:
+        sort_key = 'views'
+    if descending is None:
+        descending = SORT_KEYS[sort_key][1]
+    filter_text = (filter_text or '').strip().lower()
+    exclude_ids = frozenset(exclude_ids or ())
+
+    with _lock:
+        result_set = _result_sets.get(result_id)
+        if result_set is None:
+            return {'success': False, 'error': '검색 결과가 만료되었습니다. 다시 검색하세요.'}
+        _result_sets.move_to_end(result_id)
+
+        indices = result_set.view(sort_key, bool(descending), filter_text, exclude_ids)
+        offset = max(0, int(offset or 0))
+        end = len(indices) if limit is None else offset + max(0, int(limit))
+        window = [result_set.videos[i] for i in indices[offset:end]]
+
+        return {
+            'success': True,
+            'videos': window,
+            'offset': offset,
+            'total': len(result_set.videos),
+            'count': len(indices),
+            'stats': result_set.stats
+        }
+
+
+def release_results(result_id):
+    """보관된 검색 결과를 삭제합니다."""
+    with _lock:
+        _result_sets.pop(result_id, None)
@@ -17,21 +17,42 @@ from collections import deque
 from data_path import DATA_DIR
 
 # ========== 백엔드 로그 수집기 ==========
+# 로그는 버퍼에 넣기만 하고, 프론트엔드 전송은 log_transport의 백그라운드 스레드가 배치로 처리
+# (렌더링 루프 등에서 print/log_message가 UI 응답을 기다리지 않도록)
+from log_transport import LogTransport
+from progress_hub import progress_hub
+import tts_engine
+
+log_transport = LogTransport()
+log_transport.add_channel(
+    'backend',
+    lambda entries: eel.receiveBackendLogBatch([[message, _frontend_log_type(level)] for message, level in entries]),
+    min_level='INFO'
+)
+log_transport.add_channel(
+    'studio',
+    lambda entries: eel.studioLogBatchFromPython([message for message, _ in entries]),
+    min_level='DEBUG'
+)
+
+BACKEND_LOG_FILE = os.path.join(DATA_DIR, 'logs', 'backend.log')
+
+
+def _frontend_log_type(level):
+    return "error" if level == "ERROR" else ("warning" if level == "WARN" else "info")
+
+
 class BackendLogCollector:
-    def __init__(self, max_logs=2000):
-        self.logs = deque(maxlen=max_logs)
-        self._original_print = print
+    """최근 백엔드 로그 (log_transport의 기록 버퍼 사용)"""
 
     def add(self, message, log_type="INFO"):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] [{log_type}] {message}"
-        self.logs.append(log_entry)
+        log_transport.publish('backend', message, log_type)
 
     def get_logs(self):
-        return list(self.logs)
+        return log_transport.get_history()
 
     def clear(self):
-        self.logs.clear()
+        log_transport.clear_history()
 
 # 전역 로그 수집기 인스턴스
 backend_log_collector = BackendLogCollector()
@@ -49,17 +70,10 @@ def print(*args, **kwargs):
     elif "[DEBUG]" in message:
         log_type = "DEBUG"
 
-    backend_log_collector.add(message, log_type)
     _original_print(*args, **kwargs)
 
-    # 프론트엔드로 모든 로그 전송
-    try:
-        # [RoyStudio] 접두사 제거
-        clean_message = message.replace("[RoyStudio] ", "")
-        frontend_type = "error" if log_type == "ERROR" else ("warning" if log_type == "WARN" else "info")
-        eel.receiveBackendLog(clean_message, frontend_type)()
-    except Exception:
-        pass  # 프론트엔드 연결 안됨
+    # 프론트엔드 전송은 배치로 (여기서는 버퍼에 추가만, [RoyStudio] 접두사 제거)
+    log_transport.publish('backend', message.replace("[RoyStudio] ", ""), log_type)
 
 @eel.expose
 def get_backend_logs():
@@ -75,62 +89,52 @@ def clear_backend_logs():
     backend_log_collector.clear()
     return {'success': True}
 
+@eel.expose
+def set_backend_log_options(ui_level=None, file_logging=None):
+    """
+    백엔드 로그 전송 옵션 설정
+
+    Args:
+        ui_level: 프론트엔드로 보낼 최소 레벨 (DEBUG/INFO/WARN/ERROR)
+        file_logging: True면 DATA_DIR/logs/backend.log에 기록 (크기 기준 교체)
+    """
+    if ui_level:
+        log_transport.set_min_level('backend', ui_level)
+    if file_logging is True and not log_transport.file_sink_path:
+        log_transport.enable_file_sink(BACKEND_LOG_FILE)
+    elif file_logging is False:
+        log_transport.disable_file_sink()
+    return {
+        'success': True,
+        'logFile': log_transport.file_sink_path,
+        'stats': log_transport.get_stats()
+    }
+
 print("[RoyStudio] 백엔드 로그 수집기 초기화 완료")
 
 # ========== 하드웨어 인코더 자동 감지 ==========
 import subprocess
+import encoder_registry
 
-# 사용 가능한 인코더 캐시 (프로그램 시작 시 한 번만 감지)
+# 사용 가능한 인코더 캐시 (검사 결과는 encoder_registry가 ffmpeg 빌드별로 디스크에 저장)
 _available_encoders = None
 _best_encoder = None
 
 def detect_available_encoders():
-    """FFmpeg에서 사용 가능한 H.264 인코더 감지"""
+    """FFmpeg에서 사용 가능한 H.264 인코더 감지 (ffmpeg가 바뀐 경우에만 실제 검사)"""
     global _available_encoders, _best_encoder
 
     if _available_encoders is not None:
         return _available_encoders
 
-    # 우선순위 순서 (빠른 순)
-    encoder_priority = [
-        ('h264_nvenc', 'NVIDIA GPU'),
-        ('h264_qsv', 'Intel GPU (Quick Sync)'),
-        ('h264_amf', 'AMD GPU'),
-        ('libx264', 'CPU (소프트웨어)')
-    ]
-
-    _available_encoders = []
-
     try:
-        # FFmpeg 인코더 목록 가져오기
-        result = subprocess.run(
-            ['ffmpeg', '-encoders'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        output = result.stdout + result.stderr
-
-        for codec, name in encoder_priority:
-            if codec in output:
-                # 실제로 작동하는지 테스트 (NVENC, QSV 등은 하드웨어가 없으면 실패)
-                if codec != 'libx264':
-                    if test_encoder(codec):
-                        _available_encoders.append({'codec': codec, 'name': name, 'available': True})
-                    else:
-                        _available_encoders.append({'codec': codec, 'name': name, 'available': False})
-                else:
-                    # libx264는 항상 사용 가능
-                    _available_encoders.append({'codec': codec, 'name': name, 'available': True})
+        encoders = encoder_registry.get_encoder_list()
+        if not encoders:
+            encoders = [{'codec': 'libx264', 'name': 'CPU (소프트웨어)', 'available': True}]
 
         # 최적 인코더 선택 (사용 가능한 것 중 우선순위 가장 높은 것)
-        for enc in _available_encoders:
-            if enc['available']:
-                _best_encoder = enc['codec']
-                break
-
-        if not _best_encoder:
-            _best_encoder = 'libx264'  # 폴백
+        _best_encoder = next((enc['codec'] for enc in encoders if enc['available']), 'libx264')
+        _available_encoders = encoders
 
         print(f"[RoyStudio] 감지된 인코더: {_available_encoders}")
         print(f"[RoyStudio] 최적 인코더 선택: {_best_encoder}")
@@ -143,22 +147,8 @@ def detect_available_encoders():
     return _available_encoders
 
 def test_encoder(codec):
-    """인코더가 실제로 작동하는지 테스트"""
-    try:
-        # 1초짜리 테스트 인코딩 시도
-        result = subprocess.run(
-            [
-                'ffmpeg', '-y',
-                '-f', 'lavfi', '-i', 'color=black:s=64x64:d=0.1',
-                '-c:v', codec,
-                '-f', 'null', '-'
-            ],
-            capture_output=True,
-            timeout=10
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+    """인코더가 실제로 작동하는지 테스트 (저장된 검사 결과 사용)"""
+    return encoder_registry.is_encoder_available(codec)
 
 def get_best_encoder():
     """최적의 인코더 반환"""
@@ -185,86 +175,17 @@ def apply_audio_speed_ffmpeg(input_path, output_path, speed):
 
     Returns:
         bool: 성공 여부
-    """
-    if speed == 1.0:
-        # 속도 변환 필요 없음 - 파일 복사
-        import shutil
-        shutil.copy(input_path, output_path)
-        return True
-
-    try:
-        # atempo 필터는 0.5 ~ 2.0 범위만 지원
-        # 그 외 범위는 체인으로 연결해야 함
-        if speed < 0.5:
-            # 예: 0.25 = 0.5 * 0.5
-            atempo_chain = []
-            remaining = speed
-            while remaining < 0.5:
-                atempo_chain.append('atempo=0.5')
-                remaining *= 2
-            atempo_chain.append(f'atempo={remaining:.4f}')
-            atempo_filter = ','.join(atempo_chain)
-        elif speed > 2.0:
-            # 예: 4.0 = 2.0 * 2.0
-            atempo_chain = []
-            remaining = speed
-            while remaining > 2.0:
-                atempo_chain.append('atempo=2.0')
-                remaining /= 2
-            atempo_chain.append(f'atempo={remaining:.4f}')
-            atempo_filter = ','.join(atempo_chain)
-        else:
-            atempo_filter = f'atempo={speed:.4f}'
-
-        cmd = [
-            'ffmpeg', '-y',
-            '-hide_banner', '-loglevel', 'error',
-            '-i', input_path,
-            '-filter:a', atempo_filter,
-            '-vn',  # 비디오 스트림 제외
-            output_path
-        ]
-
-        print(f"[RoyStudio] FFmpeg 속도 변환: {speed}x ({atempo_filter})")
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            timeout=60,
-            encoding='utf-8',
-            errors='replace'
-        )
-
-        if result.returncode == 0:
-            print(f"[RoyStudio] 속도 변환 완료: {output_path}")
-            return True
-        else:
-            print(f"[ERROR] FFmpeg 속도 변환 실패: {result.stderr}")
-            return False
-
-    except Exception as e:
-        print(f"[ERROR] FFmpeg 속도 변환 오류: {e}")
-        return False
+    여러 클립을 변환할 때는 audio_stretch.stretch_batch 사용 (ffmpeg 한 번에 처리)
+    """
+    import audio_stretch
+    return audio_stretch.stretch_batch([(input_path, output_path, speed)])[0]
 
 
 def get_audio_duration(file_path):
-    """오디오 파일의 재생 시간(초) 반환"""
-    try:
-        result = subprocess.run(
-            [
-                'ffprobe', '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                file_path
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return float(result.stdout.strip())
-    except Exception as e:
-        print(f"[ERROR] 오디오 길이 확인 실패: {e}")
-        return None
+    """오디오 파일의 재생 시간(초) 반환 (MP3/WAV는 헤더만 읽음, 그 외 형식만 ffprobe)"""
+    import audio_duration
+    return audio_duration.probe_duration(file_path)
 
 
 def format_srt_time(seconds):
@@ -297,24 +218,35 @@ def _init_encoder_detection():
 threading.Thread(target=_init_encoder_detection, daemon=True).start()
 
 # RoyStudio 핵심 모듈 import
+# studio_utils/studio_services는 librosa, matplotlib, moviepy 등을 끌어오므로
+# 스튜디오 기능을 처음 사용할 때(또는 창이 뜬 뒤 워밍업 시) 로드
+import lazy_loader
 try:
     import studio_config as config
-    import studio_utils as utils
-    import studio_services as services
-    # studio_blackscreen은 Tkinter UI 기반이므로 직접 사용하지 않음
-    # 검은 화면 생성은 studio_backend 내에서 직접 구현
-    STUDIO_MODULES_LOADED = True
-    print("[RoyStudio] 핵심 모듈 로드 성공")
+    STUDIO_CONFIG_LOADED = True
 except ImportError as e:
-    STUDIO_MODULES_LOADED = False
-    print(f"[RoyStudio] 핵심 모듈 로드 실패: {e}")
+    STUDIO_CONFIG_LOADED = False
+    print(f"[RoyStudio] 설정 모듈 로드 실패: {e}")
+utils = lazy_loader.LazyModule('studio_utils')
+services = lazy_loader.LazyModule('studio_services')
+# studio_blackscreen은 Tkinter UI 기반이므로 직접 사용하지 않음
+# 검은 화면 생성은 studio_backend 내에서 직접 구현
+
+STUDIO_LAZY_MODULES = ('studio_utils', 'studio_services')
+
+
+def studio_modules_loaded():
+    """핵심 모듈을 (필요하면 지금) 로드하고 성공 여부를 반환합니다."""
+    if not STUDIO_CONFIG_LOADED:
+        return False
+    return utils.load() is not None and services.load() is not None
 
 # 전역 변수
 studio_cancel_event = threading.Event()
 studio_processing_thread = None
 
 # 데이터 파일 경로 (studio_config에서 가져오기)
-if STUDIO_MODULES_LOADED:
+if STUDIO_CONFIG_LOADED:
     STUDIO_DATA_DIR = os.path.join(os.path.expanduser('~'), '.audiovis_tts_app_data')
     STUDIO_PROFILES_FILE = config.PROFILES_FILE
     STUDIO_PRESETS_FILE = config.GLOBAL_PRESETS_FILE
@@ -339,9 +271,7 @@ os.makedirs(STUDIO_DATA_DIR, exist_ok=True)
 
 
 def studio_load_json_file(filepath):
-    """JSON 파일 로드"""
-    if STUDIO_MODULES_LOADED:
-        return utils.load_json_file(filepath)
+    """JSON 파일 로드 (페이지 로드 시 호출되므로 무거운 스튜디오 모듈을 import 하지 않음)"""
     try:
         if os.path.exists(filepath):
             with open(filepath, 'r', encoding='utf-8') as f:
@@ -352,15 +282,11 @@ def studio_load_json_file(filepath):
 
 
 def studio_save_json_file(filepath, data):
-    """JSON 파일 저장"""
-    if STUDIO_MODULES_LOADED:
-        try:
-            utils.save_json_file(filepath, data)
-            return True
-        except Exception as e:
-            print(f"[RoyStudio] JSON 저장 오류: {e}")
-            return False
+    """JSON 파일 저장 (무거운 스튜디오 모듈을 import 하지 않음)"""
     try:
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         return True
@@ -443,7 +369,7 @@ def studio_validate_api_key(api_key):
             return {'valid': False, 'error': 'API 키가 너무 짧습니다.'}
 
         # 실제 Google Cloud TTS API 호출로 검증
-        if STUDIO_MODULES_LOADED:
+        if studio_modules_loaded():
             is_valid, message = services.validate_api_key(api_key)
             return {'valid': is_valid, 'message': message}
 
@@ -860,43 +786,14 @@ class BlackscreenProgressLogger:
 
 
 def _get_gpu_codec():
-    """사용 가능한 GPU 인코더 확인 (실제 테스트로 검증)"""
-    import subprocess
-    import tempfile
-
-    # 테스트할 GPU 코덱 목록 (우선순위순)
-    gpu_codecs = [
-        ('h264_nvenc', 'p4'),       # NVIDIA
-        ('h264_amf', 'balanced'),   # AMD
-        ('h264_qsv', 'medium'),     # Intel Quick Sync
-    ]
-
-    for codec, preset in gpu_codecs:
-        try:
-            # 실제로 1프레임 인코딩 테스트
-            with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as tmp:
-                tmp_path = tmp.name
-
-            result = subprocess.run([
-                'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
-                '-f', 'lavfi', '-i', 'color=black:s=64x64:d=0.1',
-                '-c:v', codec, '-preset', preset,
-                '-frames:v', '1',
-                tmp_path
-            ], capture_output=True, timeout=10)
-
-            # 테스트 파일 삭제
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-
-            if result.returncode == 0:
-                print(f"[RoyStudio] GPU 코덱 사용 가능: {codec}")
-                return codec
-        except Exception as e:
-            continue
-
-    print("[RoyStudio] GPU 코덱 사용 불가, CPU 인코더 사용")
-    return 'libx264'  # CPU 인코더 (기본)
+    """사용 가능한 GPU 인코더 확인 (encoder_registry의 실제 테스트 결과 사용)"""
+    # 우선순위: NVIDIA, AMD, Intel Quick Sync
+    codec = encoder_registry.pick_encoder(('h264_nvenc', 'h264_amf', 'h264_qsv'))
+    if codec == 'libx264':
+        print("[RoyStudio] GPU 코덱 사용 불가, CPU 인코더 사용")
+    else:
+        print(f"[RoyStudio] GPU 코덱 사용 가능: {codec}")
+    return codec
 
 
 def _get_position_coords(position, width, height, timer_size):
@@ -1322,7 +1219,7 @@ def studio_test_voice(text, voice_name, profile_name, rate=1.0, pitch=0.0):
     """음성 미리듣기"""
     print(f"[RoyStudio] 음성 테스트: {voice_name}, 프로필: {profile_name}")
 
-    if not STUDIO_MODULES_LOADED:
+    if not studio_modules_loaded():
         return {'success': False, 'error': '핵심 모듈이 로드되지 않았습니다.'}
 
     try:
@@ -1362,7 +1259,7 @@ def studio_test_voice(text, voice_name, profile_name, rate=1.0, pitch=0.0):
 @eel.expose
 def studio_synthesize_tts(profile_name, text, voice_name, rate=1.0, pitch=0.0):
     """TTS 음성 합성 (바이트 반환 - base64 인코딩)"""
-    if not STUDIO_MODULES_LOADED:
+    if not studio_modules_loaded():
         return {'success': False, 'error': '핵심 모듈이 로드되지 않았습니다.'}
 
     try:
@@ -1389,7 +1286,7 @@ def studio_synthesize_tts(profile_name, text, voice_name, rate=1.0, pitch=0.0):
 @eel.expose
 def studio_preview_character_voice(character_data):
     """캐릭터 음성 미리듣기"""
-    if not STUDIO_MODULES_LOADED:
+    if not studio_modules_loaded():
         return {'success': False, 'error': '핵심 모듈이 로드되지 않았습니다.'}
 
     try:
@@ -1430,7 +1327,7 @@ def studio_preview_character_voice(character_data):
 @eel.expose
 def studio_preview_sentence(sentence_data, character_data):
     """문장 미리듣기"""
-    if not STUDIO_MODULES_LOADED:
+    if not studio_modules_loaded():
         return {'success': False, 'error': '핵심 모듈이 로드되지 않았습니다.'}
 
     try:
@@ -2206,20 +2103,20 @@ def load_script_for_studio(file_path):
 
 @eel.expose
 def calculate_timecode_and_generate_mp3(generate_data):
-    """타임코드 계산 및 MP3 생성 (Whisper 기반)
+    """타임코드 계산 및 MP3 생성
 
-    1. 각 문장의 TTS 생성 (자연스러운 음성)
+    1. 각 문장의 TTS 생성 (엔진이 알려주는 단어 타이밍 함께 수집)
     2. 모든 음성을 합쳐서 최종 MP3 생성
-    3. Whisper로 MP3 분석 → word-level timestamps 추출
-    4. 글자 수 제한으로 자막 클립 재분할
-    5. Word timestamps와 자막 클립 매칭 → SRT 생성
+    3. 문장별 타임코드 = 합친 위치 + 말소리 구간 (첫 단어 시작 ~ 마지막 단어 끝)
+    4. SRT 생성 (합성한 음성은 Whisper로 다시 분석하지 않음)
     """
     try:
         import tempfile
         import shutil
-        from pydub import AudioSegment
+        import audio_duration
 
         print("[RoyStudio] 타임코드 계산 및 MP3 생성 시작...")
+        studio_cancel_event.clear()  # 새 작업 시작 (studio_cancel_production으로 중지)
 
         sentences = generate_data.get('sentences', [])
         characters = generate_data.get('characters', [])  # 캐릭터 정보
@@ -2236,14 +2133,13 @@ def calculate_timecode_and_generate_mp3(generate_data):
         print(f"[RoyStudio] 임시 디렉토리: {temp_dir}")
 
         try:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            import time
-
             SILENCE_DURATION_SEC = 0.15  # 문장 사이 침묵 시간 (초)
-            MAX_CONCURRENT_TTS = 1  # 동시 TTS 생성 수 (1개씩 순차 처리)
 
-            # 1단계: 각 문장 TTS 생성 (병렬 처리)
-            print(f"[RoyStudio] 1단계: {len(sentences)}개 문장 TTS 생성 중... (동시 {MAX_CONCURRENT_TTS}개)")
+            # 1단계: 각 문장 TTS 생성 (병렬 처리 - 엔진/키별 동시 요청 수는 tts_engine에서 제한)
+            print(f"[RoyStudio] 1단계: {len(sentences)}개 문장 TTS 생성 중... (최대 동시 {tts_engine.MAX_WORKERS}개)")
+            actual_profile = studio_get_profiles()[0] if studio_get_profiles() else 'Google'
+            clip_words = {}  # 문장 인덱스 -> 단어 타이밍 (클립 시작 기준)
+            post_speeds = {}  # 문장 인덱스 -> 후처리 속도 (Chirp3-HD)
 
             # TTS 생성 작업 정의
             def generate_single_tts(idx, sentence):
@@ -2271,18 +2167,18 @@ def calculate_timecode_and_generate_mp3(generate_data):
                 is_chirp3_hd = 'Chirp3-HD' in voice
 
                 try:
-                    # TTS 생성
-                    # 실제 프로필 이름 사용 (미리듣기와 동일하게)
-                    actual_profile = studio_get_profiles()[0] if studio_get_profiles() else 'Google'
+                    # TTS 생성 (실제 프로필 이름 사용 - 미리듣기와 동일하게)
                     print(f"[RoyStudio] 클립 {idx+1} TTS 요청 중... ({voice}, {len(clip_text)}자, 프로필: {actual_profile})")
                     
+                    words = []
                     if is_chirp3_hd:
                         audio_bytes = services.synthesize_tts_bytes(
                             profile_name=actual_profile,
                             text=clip_text,
                             api_voice=voice,
                             rate=1.0,
-                            pitch=0.0
+                            pitch=0.0,
+                            word_timings=words
                         )
                     else:
                         audio_bytes = services.synthesize_tts_bytes(
@@ -2290,7 +2186,8 @@ def calculate_timecode_and_generate_mp3(generate_data):
                             text=clip_text,
                             api_voice=voice,
                             rate=speed,
-                            pitch=pitch
+                            pitch=pitch,
+                            word_timings=words
                         )
 
                     print(f"[RoyStudio] 클립 {idx+1} TTS 응답 받음 ({len(audio_bytes) if audio_bytes else 0} bytes)")
@@ -2301,34 +2198,28 @@ def calculate_timecode_and_generate_mp3(generate_data):
                         with open(temp_audio_path, 'wb') as f:
                             f.write(audio_bytes)
 
-                        # Chirp3-HD 후처리 속도 변환
+                        # Chirp3-HD 후처리 속도 변환은 모든 클립 합성 후 한 번에 처리
                         if is_chirp3_hd and post_speed != 1.0:
-                            temp_audio_processed = os.path.join(temp_dir, f'clip_{idx}_speed.mp3')
-                            if apply_audio_speed_ffmpeg(temp_audio_path, temp_audio_processed, post_speed):
-                                temp_audio_path = temp_audio_processed
+                            post_speeds[idx] = post_speed
+                        clip_words[idx] = words
 
-                        # AudioSegment로 로드
-                        audio_segment = AudioSegment.from_mp3(temp_audio_path)
-                        clip_duration = len(audio_segment) / 1000.0
+                        # 길이는 헤더만 읽어 계산 (디코딩은 병합할 때 한 번만)
+                        clip_duration = audio_duration.probe_duration(temp_audio_path)
 
-                        return idx, audio_segment, clip_duration
+                        return idx, temp_audio_path, clip_duration
                     else:
                         return idx, None, 0
+                except tts_engine.SynthesisCancelled:
+                    raise
                 except Exception as e:
+                    if studio_cancel_event.is_set():
+                        raise tts_engine.SynthesisCancelled()
                     print(f"[RoyStudio] TTS 생성 오류 (클립 {idx}): {e}")
                     return idx, None, 0
 
-            # 순차 TTS 생성 (ThreadPoolExecutor 제거 - 속도 테스트)
-            audio_results = {}
-            completed_count = 0
-            total_count = len(sentences)
-
-            for idx, sentence in enumerate(sentences):
-                idx, audio_segment, duration = generate_single_tts(idx, sentence)
-                completed_count += 1
-
-                if audio_segment:
-                    audio_results[idx] = audio_segment
+            def on_clip_done(idx, result, completed_count, total_count):
+                _, clip_path, duration = result
+                if clip_path:
                     print(f"[RoyStudio] [{completed_count}/{total_count}] 클립 {idx+1} 완료 ({duration:.2f}초)")
                 else:
                     print(f"[RoyStudio] [{completed_count}/{total_count}] 클립 {idx+1} 실패")
@@ -2336,58 +2227,85 @@ def calculate_timecode_and_generate_mp3(generate_data):
                 # 진행률 업데이트 (프론트엔드로 전송)
                 progress = int((completed_count / total_count) * 50)  # TTS 생성은 전체의 50%
                 try:
-                    eel.updateProgress(progress, f'TTS 생성 중... ({completed_count}/{total_count})')
+                    progress_hub.publish('updateProgress', progress, f'TTS 생성 중... ({completed_count}/{total_count})')
                 except:
                     pass  # eel 호출 실패 무시
 
-            # 순서대로 정렬하여 audio_segments 생성
-            audio_segments = []
-            for idx in range(len(sentences)):
-                if idx in audio_results:
-                    audio_segments.append(audio_results[idx])
+            def voice_group(idx, sentence):
+                character = character_map.get(sentence.get('character', '나레이션'))
+                voice = character.get('voice', 'ko-KR-Wavenet-A') if character else 'ko-KR-Wavenet-A'
+                return tts_engine.engine_group(services.is_edge_tts_voice(voice), actual_profile)
 
-            if len(audio_segments) == 0:
+            # 동시 TTS 생성 (결과는 문장 순서대로)
+            try:
+                tts_results = tts_engine.synthesize_ordered(
+                    sentences, generate_single_tts,
+                    group_of=voice_group,
+                    cancel_event=studio_cancel_event,
+                    on_clip_done=on_clip_done
+                )
+            except tts_engine.SynthesisCancelled:
+                print("[RoyStudio] TTS 생성 중지됨")
+                return {'success': False, 'error': '사용자에 의해 중지되었습니다.', 'cancelled': True}
+
+            tts_succeeded = [(idx, clip_path) for idx, clip_path, _ in tts_results if clip_path]
+
+            # Chirp3-HD 후처리 속도 변환 (클립마다 ffmpeg를 띄우지 않고 한 번에)
+            stretch_targets = [(n, idx, clip_path) for n, (idx, clip_path) in enumerate(tts_succeeded) if idx in post_speeds]
+            if stretch_targets:
+                import audio_stretch
+                print(f"[RoyStudio] 후처리 속도 변환: {len(stretch_targets)}개 클립")
+                stretch_jobs = [(clip_path, os.path.join(temp_dir, f'clip_{idx}_speed.wav'), post_speeds[idx])
+                                for _, idx, clip_path in stretch_targets]
+                stretched = audio_stretch.stretch_batch(stretch_jobs)
+                for (n, idx, _), (_, stretched_path, speed), ok in zip(stretch_targets, stretch_jobs, stretched):
+                    if not ok:
+                        continue
+                    tts_succeeded[n] = (idx, stretched_path)
+                    for word in clip_words.get(idx) or []:  # 속도 변환만큼 단어 시간도 조정
+                        word['start'] /= speed
+                        if word.get('end') is not None:
+                            word['end'] /= speed
+
+            if len(tts_succeeded) == 0:
                 return {'success': False, 'error': 'TTS 생성 실패: 생성된 음성이 없습니다.'}
 
-            print(f"[RoyStudio] TTS 생성 완료: {len(audio_segments)}개 성공")
+            print(f"[RoyStudio] TTS 생성 완료: {len(tts_succeeded)}개 성공")
 
             # 진행률 업데이트
             try:
-                eel.updateProgress(55, '음성 파일 병합 중...')
+                progress_hub.publish('updateProgress', 55, '음성 파일 병합 중...')
             except:
                 pass
 
             # 2단계: 모든 음성 합치기 + 정확한 타임코드 계산
-            print(f"[RoyStudio] 2단계: {len(audio_segments)}개 음성 파일 병합 중...")
+            print(f"[RoyStudio] 2단계: {len(tts_succeeded)}개 음성 파일 병합 중...")
 
-            if not audio_segments:
+            if not tts_succeeded:
                 return {'success': False, 'error': '생성된 음성이 없습니다.'}
 
             # 문장 사이 침묵(무음) 시간 (밀리초)
             SILENCE_DURATION_MS = 150
-            silence = AudioSegment.silent(duration=SILENCE_DURATION_MS)
-
-            # 음성 파일 병합 + 각 문장의 실제 타임코드 계산
-            final_audio = audio_segments[0]
-            sentence_timecodes = []  # 각 문장의 (시작, 끝) 시간
-
-            current_time = 0.0
-            first_duration = len(audio_segments[0]) / 1000.0
-            sentence_timecodes.append((current_time, first_duration))
-            current_time = first_duration
-
-            for audio in audio_segments[1:]:
-                final_audio += silence
-                current_time += SILENCE_DURATION_MS / 1000.0  # 침묵 시간 추가
 
-                final_audio += audio
-                audio_duration = len(audio) / 1000.0
-                sentence_timecodes.append((current_time, current_time + audio_duration))
-                current_time += audio_duration
+            # 음성 파일 병합 (PCM으로 모았다가 한 번에 결합) + 각 문장의 실제 타임코드 계산
+            import tts_timing
+            import audio_assembly
+            assembler = audio_assembly.AudioAssembler()
+            for n, (idx, clip_path) in enumerate(tts_succeeded):
+                if n:
+                    assembler.add_silence(SILENCE_DURATION_MS)
+                assembler.add_file(clip_path)
+            final_audio = assembler.build()
 
-            # 최종 MP3 저장
-            final_audio.export(output_path, format='mp3', bitrate='192k')
-            total_duration = len(final_audio) / 1000.0
+            sentence_timecodes = []  # 각 문장의 (시작, 끝) 시간
+            for (idx, _), clip_start, clip_duration in zip(tts_succeeded, final_audio.clip_offsets, final_audio.clip_durations):
+                # 단어 타이밍이 있으면 실제 말소리 구간, 없으면 클립 전체 길이
+                speech_start, speech_end = tts_timing.speech_span(clip_words.get(idx), clip_duration)
+                sentence_timecodes.append((clip_start + speech_start, clip_start + speech_end))
+
+            # 최종 MP3 저장 (인코딩 1회)
+            final_audio.export_mp3(output_path, bitrate='192k')
+            total_duration = final_audio.duration
             print(f"[RoyStudio] MP3 생성 완료: {output_path} ({total_duration:.2f}초)")
 
             # 원본 문장에 실제 타임코드 적용
@@ -2400,7 +2318,7 @@ def calculate_timecode_and_generate_mp3(generate_data):
 
             # 진행률 업데이트
             try:
-                eel.updateProgress(80, '자막 생성 중...')
+                progress_hub.publish('updateProgress', 80, '자막 생성 중...')
             except:
                 pass
 
@@ -2447,7 +2365,7 @@ def calculate_timecode_and_generate_mp3(generate_data):
 
             # 진행률 업데이트 - 완료
             try:
-                eel.updateProgress(100, '완료!')
+                progress_hub.publish('updateProgress', 100, '완료!', final=True)
             except:
                 pass
 
@@ -2523,6 +2441,7 @@ def select_mp3_file():
 @eel.expose
 def convert_mp3_to_srt(mp3_path):
     """MP3 파일을 Whisper로 분석하여 SRT 자막 파일 생성
+    (외부 오디오용 - 스튜디오에서 합성한 음성은 TTS 단어 타이밍으로 자막을 만듦)
 
     Args:
         mp3_path: MP3 파일 경로
@@ -2538,7 +2457,7 @@ def convert_mp3_to_srt(mp3_path):
 
         # 진행률 업데이트
         try:
-            eel.updateProgress(10, 'Whisper 모델 로딩 중...')
+            progress_hub.publish('updateProgress', 10, 'Whisper 모델 로딩 중...')
         except:
             pass
 
@@ -2548,7 +2467,7 @@ def convert_mp3_to_srt(mp3_path):
         whisper_model = whisper.load_model("tiny")  # tiny 모델 (타임코드 추출용)
 
         try:
-            eel.updateProgress(30, 'MP3 음성 인식 중...')
+            progress_hub.publish('updateProgress', 30, 'MP3 음성 인식 중...')
         except:
             pass
 
@@ -2567,7 +2486,7 @@ def convert_mp3_to_srt(mp3_path):
             return {'success': False, 'error': '음성을 인식할 수 없습니다.'}
 
         try:
-            eel.updateProgress(70, '자막 클립 생성 중...')
+            progress_hub.publish('updateProgress', 70, '자막 클립 생성 중...')
         except:
             pass
 
@@ -2612,7 +2531,7 @@ def convert_mp3_to_srt(mp3_path):
         print(f"[RoyStudio] {len(subtitle_clips)}개 자막 클립 생성됨")
 
         try:
-            eel.updateProgress(90, 'SRT 파일 저장 중...')
+            progress_hub.publish('updateProgress', 90, 'SRT 파일 저장 중...')
         except:
             pass
 
@@ -2633,7 +2552,7 @@ def convert_mp3_to_srt(mp3_path):
         total_duration = segments[-1].get('end', 0) if segments else 0
 
         try:
-            eel.updateProgress(100, '완료!')
+            progress_hub.publish('updateProgress', 100, '완료!', final=True)
         except:
             pass
 
@@ -2919,23 +2838,18 @@ class StudioApp:
         self.batch_process_tab = DummyTab()
 
     def log_message(self, message):
-        """로그 메시지 전송"""
-        try:
-            eel.studioLogFromPython(message)
-        except:
-            print(f"[RoyStudio] {message}")
+        """로그 메시지 전송 (배치 전송 버퍼에 추가만 하고 즉시 반환)"""
+        _original_print(f"[RoyStudio] {message}")
+        log_transport.publish('studio', message)
 
     def update_progress(self, message, progress, is_batch=False):
-        """진행률 업데이트"""
-        try:
-            eel.studioUpdateProgressFromPython(progress, message)
-        except:
-            print(f"[RoyStudio] Progress: {progress}% - {message}")
+        """진행률 업데이트 (progress_hub에 기록만 하고 즉시 반환, 전달은 병합하여 주기적으로)"""
+        progress_hub.publish('studioUpdateProgressFromPython', progress, message)
 
 
 def _execute_video_production_thread(job_data, output_folder):
     """영상 제작 스레드"""
-    if not STUDIO_MODULES_LOADED:
+    if not studio_modules_loaded():
         eel.studioProductionComplete({'success': False, 'error': '핵심 모듈이 로드되지 않았습니다.'})
         return
 
@@ -3145,13 +3059,14 @@ def studio_start_batch_production(jobs_data, output_folder):
 
     print(f"[RoyStudio] 배치 영상 제작 시작: {len(jobs_data)}개 작업")
 
-    if not STUDIO_MODULES_LOADED:
+    if not studio_modules_loaded():
         return {'success': False, 'error': '핵심 모듈이 로드되지 않았습니다.'}
 
     try:
         studio_cancel_event.clear()
 
         def batch_thread():
+            import batch_artifacts
             app = StudioApp()
             results = []
             errors = []
@@ -3163,6 +3078,7 @@ def studio_start_batch_production(jobs_data, output_folder):
 
                 app.log_message(f"작업 {i+1}/{len(jobs_data)}: {job_data.get('fileName', 'unknown')}")
 
+                artifacts = None
                 try:
                     # 출력 폴더는 job_data에서 직접 가져옴 (각 파일마다 다를 수 있음)
                     output_folder_path = job_data.get('outputFolder', output_folder)
@@ -3174,17 +3090,7 @@ def studio_start_batch_production(jobs_data, output_folder):
 
                     # characterVoices를 narration_settings 형식으로 변환
                     character_voices = job_data.get('characterVoices', {})
-                    narration_settings = {}
-                    for char_name, voice_settings in character_voices.items():
-                        narration_settings[char_name] = {
-                            'voice': voice_settings.get('voice', 'ko-KR-Wavenet-A'),
-                            'speed': voice_settings.get('rate', 1.0),
-                            'pitch': voice_settings.get('pitch', 0.0),
-                            'lang': 'ko-KR',
-                            'group': 'Wavenet',
-                            'volumeGain': 0,
-                            'pauseAfter': 0
-                        }
+                    narration_settings = batch_artifacts.narration_settings(character_voices)
 
                     # eq_settings 변환 (영상 탭과 동일한 방식)
                     raw_eq = job_data.get('eqSettings') or {}
@@ -3251,9 +3157,12 @@ def studio_start_batch_production(jobs_data, output_folder):
                         'api_key_profile': 'default',  # 배치 작업은 기본 API 키 사용
                     }
 
+                    # 출력 종류(영상/투명 EQ/MP3)가 여러 개여도 대본 파싱·TTS 합성·스펙트로그램·SRT는 한 번만
+                    artifacts = batch_artifacts.JobArtifacts(app, job)
+
                     # 일반 영상 제작
                     if job_data.get('outputVideo', False):
-                        result = services._execute_single_video_job(app, job, is_batch=True)
+                        result = services._execute_single_video_job(app, job, is_batch=True, artifacts=artifacts)
 
                         if result and isinstance(result, dict) and result.get('success'):
                             results.append(result)
@@ -3266,23 +3175,10 @@ def studio_start_batch_production(jobs_data, output_folder):
                             errors.append({'job': job_data, 'error': error_msg})
 
                     # 투명EQ 생성 (영상탭과 동일)
-                    if job_data.get('outputTransparentEQ', False):
+                    if job_data.get('outputTransparentEQ', False) and not studio_cancel_event.is_set():
                         try:
                             app.log_message(f"[배치] 투명 EQ 생성 중: {file_name}")
 
-                            # clips 데이터 생성 (영상탭과 동일 형식)
-                            clips_for_eq = []
-                            for char_name, voice_settings in character_voices.items():
-                                # 실제 대본에서 해당 캐릭터의 대사를 파싱해야 하지만,
-                                # 간단하게 캐릭터별 음성 설정만 전달
-                                clips_for_eq.append({
-                                    'character': char_name,
-                                    'text': '',  # 대본 파싱은 studio_create_transparent_eq에서 처리
-                                    'voice': voice_settings.get('voice', 'ko-KR-Wavenet-A'),
-                                    'rate': voice_settings.get('rate', 1.0),
-                                    'pitch': voice_settings.get('pitch', 0.0)
-                                })
-
                             eq_file_name = f'EQ_{file_name}'
                             eq_job_data = {
                                 'scriptPath': job_data.get('scriptPath', ''),
@@ -3292,7 +3188,7 @@ def studio_start_batch_production(jobs_data, output_folder):
                                 'resolution': resolution
                             }
 
-                            eq_result = studio_create_transparent_eq_batch(eq_job_data, output_folder_path, app)
+                            eq_result = studio_create_transparent_eq_batch(eq_job_data, output_folder_path, app, artifacts=artifacts)
 
                             if eq_result.get('success'):
                                 app.log_message(f"[배치] 투명 EQ 생성 완료: {eq_result.get('output_path', '')}")
@@ -3309,121 +3205,39 @@ def studio_start_batch_production(jobs_data, output_folder):
                         except Exception as eq_error:
                             app.log_message(f"[배치] 투명 EQ 생성 중 오류: {eq_error}")
 
-                    # MP3 생성 (SRT 자막도 함께 생성)
-                    if job_data.get('outputMp3', False):
+                    # MP3 생성 (SRT 자막도 함께 생성 - 실제 클립 길이와 단어 타이밍 사용)
+                    if job_data.get('outputMp3', False) and not studio_cancel_event.is_set():
                         try:
                             app.log_message(f"[배치] MP3 생성 중: {file_name}")
                             mp3_file_name = f'MP3_{file_name}'
-
-                            # 대본 읽기 및 클립 데이터 생성 (영상 제작과 동일한 방식으로 파싱)
-                            script_text = utils.read_script_file(job_data.get('scriptPath', ''))
-                            if script_text:
-                                # 대본 파싱: [캐릭터명] 패턴으로 파싱
-                                clips_for_mp3 = []
-                                current_character = '나레이션'
-                                current_lines = []
-
-                                for line in script_text.split('\n'):
-                                    line = line.strip()
-                                    if not line:
-                                        continue
-
-                                    # [캐릭터명] 패턴 체크
-                                    import re
-                                    char_match = re.match(r'^\[([^\]]+)\]\s*(.*)', line)
-                                    if char_match:
-                                        # 이전 캐릭터의 대사가 있으면 clips에 추가
-                                        if current_lines:
-                                            text = ' '.join(current_lines)
-                                            # 캐릭터별 음성 설정 가져오기
-                                            voice_settings = character_voices.get(current_character, {})
-                                            clips_for_mp3.append({
-                                                'text': text,
-                                                'character': current_character,
-                                                'voice': voice_settings.get('voice', 'ko-KR-Wavenet-A'),
-                                                'rate': voice_settings.get('rate', 1.0),
-                                                'pitch': voice_settings.get('pitch', 0)
-                                            })
-                                            current_lines = []
-
-                                        # 새 캐릭터 시작
-                                        current_character = char_match.group(1).strip()
-                                        remaining_text = char_match.group(2).strip()
-                                        if remaining_text:
-                                            current_lines.append(remaining_text)
-                                    else:
-                                        # 캐릭터 지정이 없는 라인은 현재 캐릭터에 추가
-                                        current_lines.append(line)
-
-                                # 마지막 캐릭터의 대사 추가
-                                if current_lines:
-                                    text = ' '.join(current_lines)
-                                    voice_settings = character_voices.get(current_character, {})
-                                    clips_for_mp3.append({
-                                        'text': text,
-                                        'character': current_character,
-                                        'voice': voice_settings.get('voice', 'ko-KR-Wavenet-A'),
-                                        'rate': voice_settings.get('rate', 1.0),
-                                        'pitch': voice_settings.get('pitch', 0)
-                                    })
-
-                                app.log_message(f"[배치] 대본 파싱 완료: {len(clips_for_mp3)}개 클립")
-
-                                # studio_generate_tts_and_merge 호출
-                                mp3_result = studio_generate_tts_and_merge(clips_for_mp3, output_folder_path, mp3_file_name)
-
-                                if mp3_result.get('success'):
-                                    app.log_message(f"[배치] MP3 생성 완료: {mp3_result.get('filename', '')}")
-
-                                    # SRT 자막 파일 생성
-                                    try:
-                                        srt_content = ''
-                                        current_time = 0.0
-
-                                        # 각 클립의 길이를 추정 (실제로는 audio_segments에서 가져와야 하지만 간단하게 추정)
-                                        for idx, clip in enumerate(clips_for_mp3):
-                                            text = clip.get('text', '')
-                                            # 대략적인 길이 추정: 한글 1글자당 0.3초
-                                            estimated_duration = max(len(text) * 0.3, 1.0)
-
-                                            start_time = current_time
-                                            end_time = current_time + estimated_duration
-
-                                            # 두 줄 포맷 적용
-                                            formatted_text = format_subtitle_two_lines(text)
-                                            srt_content += f"{idx + 1}\n"
-                                            srt_content += f"{format_srt_time(start_time)} --> {format_srt_time(end_time)}\n"
-                                            srt_content += f"{formatted_text}\n\n"
-
-                                            current_time = end_time
-
-                                        # SRT 파일 저장
-                                        srt_file_name = f'{mp3_file_name}.srt'
-                                        srt_path = os.path.join(output_folder_path, srt_file_name)
-                                        with open(srt_path, 'w', encoding='utf-8-sig') as f:
-                                            f.write(srt_content)
-
-                                        app.log_message(f"[배치] SRT 자막 파일 생성 완료: {srt_path}")
-                                    except Exception as srt_error:
-                                        app.log_message(f"[배치] SRT 생성 중 오류: {srt_error}")
-
-                                    # MP3 생성 성공을 results에 추가
-                                    mp3_path = os.path.join(output_folder_path, f'{mp3_file_name}.mp3')
-                                    results.append({
-                                        'success': True,
-                                        'output_path': mp3_path,
-                                        'file_name': file_name,
-                                        'type': 'mp3'
-                                    })
-                                else:
-                                    app.log_message(f"[배치] MP3 생성 실패: {mp3_result.get('error', '알 수 없는 오류')}")
-                            else:
-                                app.log_message(f"[배치] MP3 생성 실패: 대본을 읽을 수 없음")
+                            mp3_path = os.path.join(output_folder_path, f'{mp3_file_name}.mp3')
+
+                            artifacts.export_mp3(mp3_path, bitrate='192k')
+                            app.log_message(f"[배치] MP3 생성 완료: {mp3_file_name}.mp3")
+
+                            # SRT 자막 파일 생성 (영상 출력과 같은 자막)
+                            try:
+                                srt_path = os.path.join(output_folder_path, f'{mp3_file_name}.srt')
+                                artifacts.write_srt(srt_path)
+                                app.log_message(f"[배치] SRT 자막 파일 생성 완료: {srt_path}")
+                            except Exception as srt_error:
+                                app.log_message(f"[배치] SRT 생성 중 오류: {srt_error}")
+
+                            # MP3 생성 성공을 results에 추가
+                            results.append({
+                                'success': True,
+                                'output_path': mp3_path,
+                                'file_name': file_name,
+                                'type': 'mp3'
+                            })
                         except Exception as mp3_error:
                             app.log_message(f"[배치] MP3 생성 중 오류: {mp3_error}")
 
                 except Exception as e:
                     errors.append({'job': job_data, 'error': str(e)})
+                finally:
+                    if artifacts is not None:
+                        artifacts.cleanup()
 
                 # 진행률 업데이트
                 progress = ((i + 1) / len(jobs_data)) * 100
@@ -3450,7 +3264,7 @@ def studio_start_batch_production(jobs_data, output_folder):
 @eel.expose
 def studio_get_default_settings(profile_name):
     """프로필의 기본 설정 반환"""
-    if STUDIO_MODULES_LOADED:
+    if studio_modules_loaded():
         defaults = utils.load_defaults()
         return defaults.get(profile_name, {})
     return {}
@@ -3459,7 +3273,7 @@ def studio_get_default_settings(profile_name):
 @eel.expose
 def studio_save_default_settings(profile_name, settings):
     """프로필의 기본 설정 저장"""
-    if STUDIO_MODULES_LOADED:
+    if studio_modules_loaded():
         defaults = utils.load_defaults()
         defaults[profile_name] = settings
         utils.save_defaults(defaults)
@@ -3470,7 +3284,7 @@ def studio_save_default_settings(profile_name, settings):
 @eel.expose
 def studio_get_voice_profiles():
     """음성 프로필 목록 반환"""
-    if STUDIO_MODULES_LOADED:
+    if studio_modules_loaded():
         profiles_file = config.VOICE_PROFILES_FILE
         return utils.load_json_file(profiles_file)
     return {}
@@ -3478,8 +3292,19 @@ def studio_get_voice_profiles():
 
 @eel.expose
 def studio_is_modules_loaded():
-    """핵심 모듈 로드 상태 확인"""
-    return {'loaded': STUDIO_MODULES_LOADED}
+    """
+    핵심 모듈 로드 상태 확인 (로드를 유발하지 않음 - 로드는 워밍업 스레드나 첫 스튜디오 작업에서)
+
+    Returns:
+        dict: {'loaded': 모두 로드됨, 'failed': 로드 실패한 모듈 이름 리스트}
+    """
+    failed = [name for name in STUDIO_LAZY_MODULES if lazy_loader.get_load_error(name)]
+    if not STUDIO_CONFIG_LOADED:
+        failed.insert(0, 'studio_config')
+    return {
+        'loaded': STUDIO_CONFIG_LOADED and utils.is_loaded and services.is_loaded,
+        'failed': failed
+    }
 
 
 # ========== 자막 탭 API ==========
@@ -3487,7 +3312,7 @@ def studio_is_modules_loaded():
 @eel.expose
 def studio_generate_subtitle_mp3(profile_name, text, voice_name, rate, pitch, output_folder, index):
     """자막용 개별 MP3 생성"""
-    if not STUDIO_MODULES_LOADED:
+    if not studio_modules_loaded():
         return {'success': False, 'error': '핵심 모듈이 로드되지 않았습니다.'}
 
     try:
@@ -3510,10 +3335,9 @@ def studio_generate_subtitle_mp3(profile_name, text, voice_name, rate, pitch, ou
         with open(mp3_path, 'wb') as f:
             f.write(audio_bytes)
 
-        # 오디오 길이 계산
-        from pydub import AudioSegment
-        audio = AudioSegment.from_mp3(mp3_path)
-        duration = len(audio) / 1000.0  # 밀리초 -> 초
+        # 오디오 길이 계산 (프레임 헤더만 읽음 - 디코딩 없음)
+        import audio_duration
+        duration = audio_duration.probe_duration(audio_bytes)
 
         return {
             'success': True,
@@ -3557,7 +3381,7 @@ def studio_save_srt_file(output_folder, file_name, srt_content):
 @eel.expose
 def studio_render_subtitle_video(subtitles, bg_image, output_folder):
     """자막이 포함된 영상 렌더링"""
-    if not STUDIO_MODULES_LOADED:
+    if not studio_modules_loaded():
         return {'success': False, 'error': '핵심 모듈이 로드되지 않았습니다.'}
 
     try:
@@ -3619,6 +3443,51 @@ def studio_render_subtitle_video(subtitles, bg_image, output_folder):
         return {'success': False, 'error': str(e)}
 
 
+# ========== TTS 음성 캐시 ==========
+
+@eel.expose
+def studio_get_tts_cache_stats():
+    """TTS 음성 캐시 통계 조회 (적중률, 절약한 글자 수, 용량)"""
+    try:
+        import tts_cache
+        return {'success': True, 'stats': tts_cache.get_stats()}
+    except Exception as e:
+        traceback.print_exc()
+        return {'success': False, 'error': str(e)}
+
+
+@eel.expose
+def studio_clear_tts_cache():
+    """TTS 음성 캐시 전체 삭제"""
+    try:
+        import tts_cache
+        removed = tts_cache.clear()
+        return {'success': True, 'removed': removed}
+    except Exception as e:
+        traceback.print_exc()
+        return {'success': False, 'error': str(e)}
+
+
+@eel.expose
+def studio_get_tts_connection_stats():
+    """TTS HTTP 세션/클라이언트 재사용 통계, Edge TTS 작업 스레드 상태 조회"""
+    try:
+        import tts_client_pool
+        from edge_tts_worker import edge_worker
+        return {'success': True, 'stats': tts_client_pool.get_stats(), 'edge': edge_worker.get_stats()}
+    except Exception as e:
+        traceback.print_exc()
+        return {'success': False, 'error': str(e)}
+
+
+@eel.expose
+def studio_set_tts_cache_enabled(enabled):
+    """TTS 음성 캐시 사용 여부 설정"""
+    import tts_cache
+    tts_cache.set_enabled(enabled)
+    return {'success': True, 'enabled': tts_cache.is_enabled()}
+
+
 # ========== TTS API 키 관리 ==========
 
 try:
@@ -3730,6 +3599,19 @@ def studio_get_tts_usage_summary():
         return {'success': False, 'error': str(e), 'summary': []}
 
 
+@eel.expose
+def studio_get_tts_key_scheduler_stats():
+    """키별 진행 중 요청/예약 글자 수/429 횟수 조회 (동시 합성 분산 상태)"""
+    if not TTS_QUOTA_LOADED:
+        return {'success': False, 'error': 'TTS Quota Manager가 로드되지 않았습니다.', 'keys': []}
+
+    try:
+        return {'success': True, 'keys': quota.get_scheduler_stats()}
+    except Exception as e:
+        traceback.print_exc()
+        return {'success': False, 'error': str(e), 'keys': []}
+
+
 @eel.expose
 def studio_get_available_tts_key(voice_name, char_count=0):
     """사용 가능한 TTS API 키 자동 선택"""
@@ -3766,7 +3648,8 @@ def studio_validate_tts_api_key(api_key):
         url = f"https://texttospeech.googleapis.com/v1/voices?key={api_key}"
         print(f"[TTS Validate] 요청 URL: {url[:50]}...")
 
-        response = requests.get(url, timeout=30)
+        import tts_client_pool
+        response = tts_client_pool.request('get', api_key, url, timeout=30)
         print(f"[TTS Validate] 응답 코드: {response.status_code}")
 
         if response.status_code == 200:
@@ -3803,28 +3686,28 @@ def studio_validate_tts_api_key(api_key):
 def studio_merge_mp3_files(mp3_paths, output_path):
     """여러 MP3 파일을 하나로 합치기"""
     try:
-        from pydub import AudioSegment
-
         if not mp3_paths:
             return {'success': False, 'error': 'MP3 파일 목록이 비어있습니다.'}
 
-        # 첫 번째 파일로 시작
-        combined = AudioSegment.empty()
+        import audio_assembly
+
+        # PCM으로 모았다가 한 번에 결합
+        assembler = audio_assembly.AudioAssembler()
 
         for mp3_path in mp3_paths:
             if os.path.exists(mp3_path):
-                audio = AudioSegment.from_mp3(mp3_path)
-                combined += audio
+                assembler.add_file(mp3_path)
             else:
                 print(f"[RoyStudio] MP3 파일 없음: {mp3_path}")
 
-        if len(combined) == 0:
+        combined = assembler.build()
+        if combined.frame_count == 0:
             return {'success': False, 'error': '합칠 수 있는 MP3 파일이 없습니다.'}
 
         # 합쳐진 파일 저장
-        combined.export(output_path, format='mp3', bitrate='192k')
+        combined.export_mp3(output_path, bitrate='192k')
 
-        duration = len(combined) / 1000.0  # 밀리초 -> 초
+        duration = combined.duration
 
         return {
             'success': True,
@@ -3839,8 +3722,13 @@ def studio_merge_mp3_files(mp3_paths, output_path):
 
 
 @eel.expose
-def studio_generate_transparent_eq_video(audio_path, output_path, settings):
-    """투명 배경 EQ 영상 생성 (WebM 형식)"""
+def studio_generate_transparent_eq_video(audio_path, output_path, settings, audio=None):
+    """
+    투명 배경 EQ 영상 생성 (WebM 형식)
+
+    audio: audio_assembly 결과 (AssembledAudio/StreamedAudio) - 주면 audio_path를 다시 디코딩하지 않고
+           구간별로 나눠 스펙트로그램 계산
+    """
     try:
         import subprocess
         import tempfile
@@ -3849,7 +3737,7 @@ def studio_generate_transparent_eq_video(audio_path, output_path, settings):
         import wave
         import struct
 
-        if not os.path.exists(audio_path):
+        if audio is None and not os.path.exists(audio_path):
             return {'success': False, 'error': '오디오 파일이 존재하지 않습니다.'}
 
         # 설정 파싱
@@ -3886,14 +3774,17 @@ def studio_generate_transparent_eq_video(audio_path, output_path, settings):
         # 오디오 분석을 위한 librosa 사용
         import librosa
 
-        # 오디오 로드 및 분석
-        y, sr = librosa.load(audio_path, sr=None, mono=True)
-        duration = librosa.get_duration(y=y, sr=sr)
-        total_frames = int(duration * fps)
-
-        # 멜 스펙트로그램 계산
+        # 오디오 로드 및 멜 스펙트로그램 계산
         hop_length = 512
-        S = librosa.feature.melspectrogram(y=y, sr=sr, n_fft=2048, hop_length=hop_length, n_mels=bar_count)
+        if audio is not None:
+            sr = audio.frame_rate
+            duration = audio.duration
+            S = audio.melspectrogram(n_fft=2048, hop_length=hop_length, n_mels=bar_count)
+        else:
+            y, sr = librosa.load(audio_path, sr=None, mono=True)
+            duration = librosa.get_duration(y=y, sr=sr)
+            S = librosa.feature.melspectrogram(y=y, sr=sr, n_fft=2048, hop_length=hop_length, n_mels=bar_count)
+        total_frames = int(duration * fps)
 
         # dB 스케일로 변환
         max_val = np.max(S)
@@ -4090,7 +3981,6 @@ def studio_generate_transparent_eq_video(audio_path, output_path, settings):
 def studio_generate_tts_and_merge(clips_data, output_folder, custom_filename=None):
     """여러 클립의 TTS를 생성하고 하나의 MP3로 합치기 (병렬 처리)"""
     try:
-        from pydub import AudioSegment
         import tempfile
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -4156,11 +4046,12 @@ def studio_generate_tts_and_merge(clips_data, output_folder, custom_filename=Non
         if not temp_files:
             return {'success': False, 'error': '생성된 TTS가 없습니다.'}
 
-        # MP3 파일 합치기
-        combined = AudioSegment.empty()
+        # MP3 파일 합치기 (PCM으로 모았다가 한 번에 결합)
+        import audio_assembly
+        assembler = audio_assembly.AudioAssembler()
         for temp_path in temp_files:
-            audio = AudioSegment.from_mp3(temp_path)
-            combined += audio
+            assembler.add_file(temp_path)
+        combined = assembler.build()
 
         # 최종 파일 저장
         from datetime import datetime
@@ -4173,13 +4064,13 @@ def studio_generate_tts_and_merge(clips_data, output_folder, custom_filename=Non
             output_filename = f'combined_tts_{timestamp}.mp3'
         output_path = os.path.join(output_folder, output_filename)
 
-        combined.export(output_path, format='mp3', bitrate='192k')
+        combined.export_mp3(output_path, bitrate='192k')
 
         # 임시 파일 정리
         import shutil
         shutil.rmtree(temp_dir, ignore_errors=True)
 
-        duration = len(combined) / 1000.0
+        duration = combined.duration
 
         print(f"[RoyStudio] MP3 합치기 완료: {output_path} ({duration:.2f}초)")
 
@@ -4200,7 +4091,6 @@ def studio_generate_tts_and_merge(clips_data, output_folder, custom_filename=Non
 def studio_generate_transparent_eq_only(clips_data, output_folder, eq_settings, script_base_name=None):
     """TTS 생성 후 투명 EQ 영상과 MP3 함께 생성 (병렬 처리)"""
     try:
-        from pydub import AudioSegment
         import tempfile
         import shutil
         from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -4267,13 +4157,14 @@ def studio_generate_transparent_eq_only(clips_data, output_folder, eq_settings,
             shutil.rmtree(temp_dir, ignore_errors=True)
             return {'success': False, 'error': '생성된 TTS가 없습니다.'}
 
-        # 2단계: MP3 합치기
-        combined = AudioSegment.empty()
+        # 2단계: MP3 합치기 (PCM으로 모았다가 한 번에 결합)
+        import audio_assembly
+        assembler = audio_assembly.AudioAssembler()
         for temp_path in temp_files:
-            audio = AudioSegment.from_mp3(temp_path)
-            combined += audio
+            assembler.add_file(temp_path)
+        combined = assembler.build()
 
-        duration = len(combined) / 1000.0
+        duration = combined.duration
 
         # MP3 파일을 출력 폴더에 저장
         from datetime import datetime
@@ -4288,13 +4179,14 @@ def studio_generate_transparent_eq_only(clips_data, output_folder, eq_settings,
             mov_filename = f'transparent_eq_{timestamp}.mov'
 
         mp3_output_path = os.path.join(output_folder, mp3_filename)
-        combined.export(mp3_output_path, format='mp3', bitrate='192k')
+        combined.export_mp3(mp3_output_path, bitrate='192k')
         print(f"[RoyStudio] MP3 저장 완료: {mp3_output_path} ({duration:.2f}초)")
 
-        # 3단계: 투명 EQ 영상 생성
+        # 3단계: 투명 EQ 영상 생성 (결합한 PCM을 그대로 분석 - 저장한 MP3를 다시 디코딩하지 않음)
         mov_output_path = os.path.join(output_folder, mov_filename)
 
-        eq_result = studio_generate_transparent_eq_video(mp3_output_path, mov_output_path, eq_settings)
+        eq_result = studio_generate_transparent_eq_video(mp3_output_path, mov_output_path, eq_settings,
+                                                         audio=combined)
 
         # 임시 폴더 정리
         shutil.rmtree(temp_dir, ignore_errors=True)
@@ -4325,7 +4217,6 @@ def studio_generate_transparent_eq_only(clips_data, output_folder, eq_settings,
 def studio_create_transparent_eq(job_data, output_folder):
     """투명 EQ MOV 파일만 생성 (영상 제작과 별도)"""
     try:
-        from pydub import AudioSegment
         import tempfile
         import shutil
 
@@ -4377,24 +4268,23 @@ def studio_create_transparent_eq(job_data, output_folder):
             shutil.rmtree(temp_dir, ignore_errors=True)
             return {'success': False, 'error': '생성된 TTS가 없습니다.'}
 
-        # 2단계: MP3 합치기 (임시)
-        combined = AudioSegment.empty()
-        for temp_path in temp_files:
-            audio = AudioSegment.from_mp3(temp_path)
-            combined += audio
-
-        duration = len(combined) / 1000.0
+        # 2단계: 오디오 합치기 (클립을 임시 WAV에 바로 이어 씀 - 전체를 메모리에 올리지 않음)
+        import audio_assembly
+        temp_wav_path = os.path.join(temp_dir, 'temp_combined.wav')
+        with audio_assembly.StreamingAudioWriter(temp_wav_path) as writer:
+            for temp_path in temp_files:
+                writer.add_file(temp_path)
+        combined = writer.result
 
-        # 임시 MP3 저장
-        temp_mp3_path = os.path.join(temp_dir, 'temp_combined.mp3')
-        combined.export(temp_mp3_path, format='mp3', bitrate='192k')
-        print(f"[RoyStudio] 임시 MP3 저장 완료: {duration:.2f}초")
+        duration = combined.duration
+        print(f"[RoyStudio] 임시 WAV 저장 완료: {duration:.2f}초")
 
-        # 3단계: 투명 EQ 영상 생성 (MOV)
+        # 3단계: 투명 EQ 영상 생성 (MOV) - 임시 WAV를 구간별로 읽어 분석
         mov_filename = f'{file_name}.mov'
         mov_output_path = os.path.join(output_folder, mov_filename)
 
-        eq_result = studio_generate_transparent_eq_video(temp_mp3_path, mov_output_path, eq_settings)
+        eq_result = studio_generate_transparent_eq_video(temp_wav_path, mov_output_path, eq_settings,
+                                                         audio=combined)
 
         # 임시 폴더 정리
         shutil.rmtree(temp_dir, ignore_errors=True)
@@ -4418,134 +4308,41 @@ def studio_create_transparent_eq(job_data, output_folder):
         return {'success': False, 'error': str(e)}
 
 
-def studio_create_transparent_eq_batch(job_data, output_folder, app):
-    """배치 모드에서 투명 EQ MOV 파일 생성 (대본 파일 파싱 포함)"""
-    try:
-        from pydub import AudioSegment
-        import tempfile
-        import shutil
-        import re
+def studio_create_transparent_eq_batch(job_data, output_folder, app, artifacts=None):
+    """배치 모드에서 투명 EQ MOV 파일 생성 (대본 파일 파싱 포함)
 
-        script_path = job_data.get('scriptPath', '')
-        character_voices = job_data.get('characterVoices', {})
+    artifacts: batch_artifacts.JobArtifacts - 주면 같은 작업의 영상/MP3 출력과 합성 결과·스펙트로그램을 함께 사용
+    """
+    import batch_artifacts
+    owns_artifacts = artifacts is None
+    try:
         eq_settings = job_data.get('eqSettings', {})
         file_name = job_data.get('fileName', 'EQ_output')
 
-        if not script_path or not os.path.exists(script_path):
-            return {'success': False, 'error': '대본 파일이 없습니다.'}
-
-        # 대본 파일 읽기 및 파싱
-        script_text = utils.read_script_file(script_path)
-        if not script_text:
-            return {'success': False, 'error': '대본을 읽을 수 없습니다.'}
-
-        # 대본 파싱 ([캐릭터명] 패턴)
-        clips_data = []
-        current_character = '나레이션'
-        current_lines = []
-
-        for line in script_text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-
-            char_match = re.match(r'^\[([^\]]+)\]\s*(.*)', line)
-            if char_match:
-                # 이전 캐릭터의 대사가 있으면 clips에 추가
-                if current_lines:
-                    text = ' '.join(current_lines)
-                    voice_setting = character_voices.get(current_character, {})
-                    clips_data.append({
-                        'text': text,
-                        'voice': voice_setting.get('voice', 'ko-KR-Wavenet-A'),
-                        'rate': voice_setting.get('rate', 1.0),
-                        'pitch': voice_setting.get('pitch', 0.0)
-                    })
-                    current_lines = []
-
-                # 새 캐릭터 시작
-                current_character = char_match.group(1).strip()
-                remaining_text = char_match.group(2).strip()
-                if remaining_text:
-                    current_lines.append(remaining_text)
-            else:
-                # 캐릭터 지정이 없는 라인은 현재 캐릭터에 추가
-                current_lines.append(line)
-
-        # 마지막 캐릭터의 대사 추가
-        if current_lines:
-            text = ' '.join(current_lines)
-            voice_setting = character_voices.get(current_character, {})
-            clips_data.append({
-                'text': text,
-                'voice': voice_setting.get('voice', 'ko-KR-Wavenet-A'),
-                'rate': voice_setting.get('rate', 1.0),
-                'pitch': voice_setting.get('pitch', 0.0)
+        if owns_artifacts:
+            script_path = job_data.get('scriptPath', '')
+            if not script_path or not os.path.exists(script_path):
+                return {'success': False, 'error': '대본 파일이 없습니다.'}
+            artifacts = batch_artifacts.JobArtifacts(app, {
+                'scriptPath': script_path,
+                'narration_settings': batch_artifacts.narration_settings(job_data.get('characterVoices', {})),
+                'api_key_profile': 'default'
             })
 
-        if not clips_data:
-            return {'success': False, 'error': '파싱된 클립이 없습니다.'}
-
-        app.log_message(f"[배치] 투명 EQ 대본 파싱 완료: {len(clips_data)}개 클립")
-
-        # 임시 폴더 생성
-        temp_dir = tempfile.mkdtemp(prefix='batch_eq_')
-        temp_files = []
-
-        # 1단계: TTS 생성
-        for idx, clip in enumerate(clips_data):
-            text = clip.get('text', '')
-            voice = clip.get('voice', 'ko-KR-Wavenet-A')
-            rate = clip.get('rate', 1.0)
-            pitch = clip.get('pitch', 0)
-
-            if not text.strip():
-                continue
-
-            try:
-                audio_bytes = services.synthesize_tts_bytes(
-                    profile_name='',
-                    text=text,
-                    api_voice=voice,
-                    rate=rate,
-                    pitch=pitch
-                )
-
-                if audio_bytes:
-                    temp_path = os.path.join(temp_dir, f'clip_{idx:04d}.mp3')
-                    with open(temp_path, 'wb') as f:
-                        f.write(audio_bytes)
-                    temp_files.append(temp_path)
-                    app.log_message(f"[배치] 클립 {idx+1}/{len(clips_data)} TTS 생성 완료")
-
-            except Exception as e:
-                app.log_message(f"[배치] 클립 {idx+1} TTS 오류: {e}")
-
-        if not temp_files:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            return {'success': False, 'error': '생성된 TTS가 없습니다.'}
-
-        # 2단계: MP3 합치기
-        combined = AudioSegment.empty()
-        for temp_path in temp_files:
-            audio = AudioSegment.from_mp3(temp_path)
-            combined += audio
-
-        duration = len(combined) / 1000.0
+        # 1~2단계: 대본 파싱 + TTS 합성 (클립을 임시 WAV에 바로 이어 씀 - 공유 산출물이면 이미 만든 것 사용)
+        try:
+            combined, _ = artifacts.audio()
+        except tts_engine.SynthesisCancelled:
+            return {'success': False, 'error': '사용자에 의해 중지되었습니다.', 'cancelled': True}
 
-        # 임시 MP3 저장
-        temp_mp3_path = os.path.join(temp_dir, 'temp_combined.mp3')
-        combined.export(temp_mp3_path, format='mp3', bitrate='192k')
-        app.log_message(f"[배치] 임시 MP3 저장 완료: {duration:.2f}초")
+        duration = combined.duration
 
-        # 3단계: 투명 EQ 영상 생성 (MOV)
+        # 3단계: 투명 EQ 영상 생성 (MOV) - WAV를 구간별로 읽어 분석 (스펙트로그램은 영상 비주얼라이저와 공유)
         mov_filename = f'{file_name}.mov'
         mov_output_path = os.path.join(output_folder, mov_filename)
 
-        eq_result = studio_generate_transparent_eq_video(temp_mp3_path, mov_output_path, eq_settings)
-
-        # 임시 폴더 정리
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        eq_result = studio_generate_transparent_eq_video(combined.path, mov_output_path, eq_settings,
+                                                         audio=combined)
 
         if eq_result.get('success'):
             return {
@@ -4561,19 +4358,22 @@ def studio_create_transparent_eq_batch(job_data, output_folder, app):
         app.log_message(f"[배치] 투명 EQ 생성 중 예외 발생: {e}")
         traceback.print_exc()
         return {'success': False, 'error': str(e)}
+    finally:
+        if owns_artifacts and artifacts is not None:
+            artifacts.cleanup()
 
 
 @eel.expose
 def studio_sync_timecode_with_whisper(clips_data, output_folder, script_base_name=None):
     """
-    클립들의 TTS를 생성하고 Whisper로 분석하여 정확한 타임코드를 반환
+    클립들의 TTS를 생성하고 정확한 타임코드를 반환
+    (함수 이름은 프론트엔드 호환용 - 합성한 음성은 Whisper로 다시 분석하지 않음)
 
-    1. 각 클립의 TTS 생성 → MP3 합치기
-    2. Whisper base 모델로 MP3 분석 → 타임스탬프 추출
-    3. 클립별 정확한 시작/끝 타임코드 계산
+    1. 각 클립의 TTS 생성 (엔진이 알려주는 단어 타이밍 함께 수집) → MP3 합치기
+    2. 클립별 시작 위치 = 앞 클립 길이 합, 말소리 구간 = 첫 단어 시작 ~ 마지막 단어 끝
     """
     try:
-        from pydub import AudioSegment
+        import audio_duration
         import tempfile
         import shutil
 
@@ -4584,6 +4384,7 @@ def studio_sync_timecode_with_whisper(clips_data, output_folder, script_base_nam
         temp_dir = tempfile.mkdtemp(prefix='timecode_sync_')
         temp_files = []
         clip_durations = []  # 각 클립의 실제 오디오 길이
+        clip_words = []  # 각 클립의 단어 타이밍 (클립 시작 기준)
 
         print(f"[RoyStudio] 타임코드 동기화 시작: {len(clips_data)}개 클립")
 
@@ -4596,15 +4397,19 @@ def studio_sync_timecode_with_whisper(clips_data, output_folder, script_base_nam
 
             if not text.strip():
                 clip_durations.append(0)
+                clip_words.append([])
                 continue
 
+            words = []
+            clip_words.append(words)
             try:
                 audio_bytes = services.synthesize_tts_bytes(
                     profile_name='',
                     text=text,
                     api_voice=voice,
                     rate=rate,
-                    pitch=pitch
+                    pitch=pitch,
+                    word_timings=words
                 )
 
                 if audio_bytes:
@@ -4613,9 +4418,8 @@ def studio_sync_timecode_with_whisper(clips_data, output_folder, script_base_nam
                         f.write(audio_bytes)
                     temp_files.append((idx, temp_path))
 
-                    # 클립 길이 측정
-                    audio_segment = AudioSegment.from_mp3(temp_path)
-                    clip_durations.append(len(audio_segment) / 1000.0)
+                    # 클립 길이 측정 (프레임 헤더만 읽음 - 디코딩 없음)
+                    clip_durations.append(audio_duration.probe_duration(audio_bytes) or 0)
 
                     print(f"[RoyStudio] 클립 {idx+1}/{len(clips_data)} TTS 생성 완료 ({clip_durations[-1]:.2f}초)")
                 else:
@@ -4630,13 +4434,14 @@ def studio_sync_timecode_with_whisper(clips_data, output_folder, script_base_nam
             shutil.rmtree(temp_dir, ignore_errors=True)
             return {'success': False, 'error': '생성된 TTS가 없습니다.'}
 
-        # 2단계: MP3 합치기
-        combined = AudioSegment.empty()
+        # 2단계: MP3 합치기 (PCM으로 모았다가 한 번에 결합)
+        import audio_assembly
+        assembler = audio_assembly.AudioAssembler()
         for idx, temp_path in temp_files:
-            audio = AudioSegment.from_mp3(temp_path)
-            combined += audio
+            assembler.add_file(temp_path)
+        combined = assembler.build()
 
-        total_duration = len(combined) / 1000.0
+        total_duration = combined.duration
 
         # MP3 파일 저장
         from datetime import datetime
@@ -4648,62 +4453,35 @@ def studio_sync_timecode_with_whisper(clips_data, output_folder, script_base_nam
             mp3_filename = f'combined_tts_{timestamp}.mp3'
 
         mp3_output_path = os.path.join(output_folder, mp3_filename)
-        combined.export(mp3_output_path, format='mp3', bitrate='192k')
+        combined.export_mp3(mp3_output_path, bitrate='192k')
         print(f"[RoyStudio] MP3 저장 완료: {mp3_output_path} ({total_duration:.2f}초)")
 
-        # 3단계: Whisper로 타임스탬프 추출
-        print("[RoyStudio] Whisper 분석 시작 (tiny 모델)...")
-
-        try:
-            import whisper
-
-            model = whisper.load_model("tiny")  # tiny 모델 (타임코드 추출용)
-            result = model.transcribe(
-                mp3_output_path,
-                language="ko",
-                word_timestamps=True
-            )
-
-            whisper_segments = result.get('segments', [])
-            print(f"[RoyStudio] Whisper 분석 완료: {len(whisper_segments)}개 세그먼트 감지")
-
-        except ImportError:
-            print("[RoyStudio] Whisper 미설치 - 순차 계산 방식으로 대체")
-            whisper_segments = None
-        except Exception as e:
-            print(f"[RoyStudio] Whisper 오류: {e} - 순차 계산 방식으로 대체")
-            whisper_segments = None
-
-        # 4단계: 타임코드 계산
+        # 3단계: 타임코드 계산 (TTS 실제 길이 + 엔진 단어 타이밍)
+        import tts_timing
         synced_clips = []
-
-        # 클립 수와 Whisper 세그먼트 수가 동일하면 1:1 직접 매핑
-        if whisper_segments and len(whisper_segments) == len(clips_data):
-            print(f"[RoyStudio] Whisper 1:1 직접 매핑 (클립 {len(clips_data)}개 = 세그먼트 {len(whisper_segments)}개)")
-            for idx, seg in enumerate(whisper_segments):
-                synced_clips.append({
-                    'index': idx,
-                    'start': round(seg['start'], 2),
-                    'end': round(seg['end'], 2),
-                    'duration': round(seg['end'] - seg['start'], 2),
-                    'text': clips_data[idx].get('text', '')
-                })
-                print(f"[RoyStudio]   클립 {idx}: {seg['start']:.2f} ~ {seg['end']:.2f}초")
-        else:
-            # 순차 계산 방식 (TTS 실제 길이 기반)
-            print(f"[RoyStudio] 순차 계산 방식 (TTS 길이 기반)")
-            current_time = 0
-            for idx, clip in enumerate(clips_data):
-                duration = clip_durations[idx] if idx < len(clip_durations) else 0
-                synced_clips.append({
-                    'index': idx,
-                    'start': round(current_time, 2),
-                    'end': round(current_time + duration, 2),
-                    'duration': round(duration, 2),
-                    'text': clip.get('text', '')
-                })
-                print(f"[RoyStudio]   클립 {idx}: {current_time:.2f} ~ {current_time + duration:.2f}초 (길이: {duration:.2f}초)")
-                current_time += duration
+        current_time = 0
+        timed_count = 0
+        for idx, clip in enumerate(clips_data):
+            duration = clip_durations[idx] if idx < len(clip_durations) else 0
+            words = clip_words[idx] if idx < len(clip_words) else []
+            speech_start, speech_end = tts_timing.speech_span(words, duration)
+            if words:
+                timed_count += 1
+            synced_clips.append({
+                'index': idx,
+                'start': round(current_time + speech_start, 2),
+                'end': round(current_time + speech_end, 2),
+                'duration': round(speech_end - speech_start, 2),
+                'text': clip.get('text', ''),
+                'words': [
+                    {'text': w['text'], 'start': round(current_time + w['start'], 3),
+                     'end': round(current_time + (w['end'] if w.get('end') is not None else duration), 3)}
+                    for w in words
+                ]
+            })
+            print(f"[RoyStudio]   클립 {idx}: {current_time + speech_start:.2f} ~ {current_time + speech_end:.2f}초 (길이: {duration:.2f}초)")
+            current_time += duration
+        print(f"[RoyStudio] 단어 타이밍 사용: {timed_count}/{len(clips_data)}개 클립 (나머지는 TTS 길이 기준)")
 
         # 임시 폴더 정리
         shutil.rmtree(temp_dir, ignore_errors=True)
@@ -5392,7 +5170,7 @@ def generate_quick_tts_eel(text, voice_name):
     try:
         import tempfile
         import requests
-        from pydub import AudioSegment
+        import audio_duration
 
         # API 키 가져오기
         if not TTS_QUOTA_LOADED:
@@ -5426,8 +5204,9 @@ def generate_quick_tts_eel(text, voice_name):
             }
         }
 
-        # API 요청
-        response = requests.post(url, json=data, timeout=30)
+        # API 요청 (키별 keep-alive 세션 재사용)
+        import tts_client_pool
+        response = tts_client_pool.request('post', api_key, url, json=data, timeout=30)
 
         if response.status_code != 200:
             error_msg = response.json().get('error', {}).get('message', 'Unknown error')
@@ -5448,9 +5227,8 @@ def generate_quick_tts_eel(text, voice_name):
         temp_file.write(audio_bytes)
         temp_file.close()
 
-        # 오디오 길이 계산
-        audio = AudioSegment.from_mp3(temp_file.name)
-        duration = len(audio) / 1000.0  # 밀리초를 초로 변환
+        # 오디오 길이 계산 (프레임 헤더만 읽음 - 디코딩 없음)
+        duration = audio_duration.probe_duration(audio_bytes)
 
         print(f"[QuickTTS] TTS 생성 완료: {text[:30]}... ({duration:.2f}초)")
 
@@ -5475,13 +5253,13 @@ def combine_audio_files_only_eel(audio_segments, output_path):
     빠른 변환 - 여러 오디오 파일을 하나의 MP3로 결합
     """
     try:
-        from pydub import AudioSegment
+        import audio_assembly
 
-        combined = AudioSegment.empty()
+        # PCM으로 모았다가 한 번에 결합
+        assembler = audio_assembly.AudioAssembler()
 
         for segment in audio_segments:
-            audio = AudioSegment.from_mp3(segment['file'])
-            combined += audio
+            assembler.add_file(segment['file'])
 
             # 임시 파일 삭제
             try:
@@ -5489,8 +5267,8 @@ def combine_audio_files_only_eel(audio_segments, output_path):
             except:
                 pass
 
-        # MP3로 저장
-        combined.export(output_path, format='mp3', bitrate='192k')
+        # MP3로 저장 (인코딩 1회)
+        assembler.build().export_mp3(output_path, bitrate='192k')
 
         print(f"[QuickTTS] MP3 결합 완료: {output_path}")
 
@@ -5514,14 +5292,13 @@ def combine_audio_and_generate_srt_eel(audio_segments, base_path):
     빠른 변환 - 오디오 파일 결합 + SRT 자막 파일 생성
     """
     try:
-        from pydub import AudioSegment
+        import audio_assembly
 
-        # MP3 결합
-        combined = AudioSegment.empty()
+        # MP3 결합 (PCM으로 모았다가 한 번에 결합)
+        assembler = audio_assembly.AudioAssembler()
 
         for segment in audio_segments:
-            audio = AudioSegment.from_mp3(segment['file'])
-            combined += audio
+            assembler.add_file(segment['file'])
 
             # 임시 파일 삭제
             try:
@@ -5530,7 +5307,7 @@ def combine_audio_and_generate_srt_eel(audio_segments, base_path):
                 pass
 
         mp3_path = base_path + '.mp3'
-        combined.export(mp3_path, format='mp3', bitrate='192k')
+        assembler.build().export_mp3(mp3_path, bitrate='192k')
 
         # SRT 생성
         srt_path = base_path + '.srt'
@@ -11,6 +11,7 @@ import time
 import traceback
 from typing import Dict, List, Optional, Callable
 import eel
+import tracing
 
 
 class PipelineProcessor:
@@ -52,6 +53,9 @@ class PipelineProcessor:
         self.threads = []
         self.all_jobs_added = False
 
+        # 단계별 시간 추적 (워커 스레드의 구간을 이 작업에 연결)
+        self.trace_job = None
+
         # 진행 상황 추적
         self.total_jobs = 0
         self.completed_jobs = 0
@@ -74,6 +78,8 @@ class PipelineProcessor:
         eel.logMessageFromPython("   단계: TTS 생성 → EQ 렌더링 → 영상 결합")
         eel.logMessageFromPython("="*60)
 
+        self.trace_job = tracing.begin_job('pipeline', jobs=self.total_jobs)
+
         # 3개의 워커 스레드 시작
         self.threads = [
             threading.Thread(target=self._tts_worker, name="TTS-Worker", daemon=True),
@@ -104,6 +110,9 @@ class PipelineProcessor:
         for thread in self.threads:
             thread.join(timeout=5)
 
+        if self.trace_job is not None:
+            tracing.end_job(self.trace_job)
+
         eel.logMessageFromPython("\n" + "="*60)
         eel.logMessageFromPython("✅ 파이프라인 처리 완료!")
         eel.logMessageFromPython(f"   성공: {len(self.results)}개")
@@ -144,7 +153,9 @@ class PipelineProcessor:
                 start_time = time.time()
 
                 # TTS 함수 호출
-                result = self.tts_func(job)
+                with tracing.job_scope(self.trace_job), tracing.span('pipeline.tts', 'tts', job=job_name):
+                    result = self.tts_func(job)
+                    tracing.counter('pipeline.audio_queue', self.audio_queue.qsize() + 1)
 
                 if result is None:
                     # TTS 실패
@@ -201,7 +212,9 @@ class PipelineProcessor:
                 start_time = time.time()
 
                 # EQ 렌더링 함수 호출
-                result = self.eq_func(job, audio_path)
+                with tracing.job_scope(self.trace_job), tracing.span('pipeline.eq', 'render', job=job_name):
+                    result = self.eq_func(job, audio_path)
+                    tracing.counter('pipeline.visual_queue', self.visual_queue.qsize() + 1)
 
                 if result is None:
                     # EQ 렌더링 실패
@@ -258,7 +271,8 @@ class PipelineProcessor:
                 start_time = time.time()
 
                 # 영상 결합 함수 호출
-                result = self.combine_func(job, audio_path, vis_path, audio_segments, clips)
+                with tracing.job_scope(self.trace_job), tracing.span('pipeline.combine', 'ffmpeg', job=job_name):
+                    result = self.combine_func(job, audio_path, vis_path, audio_segments, clips)
 
                 elapsed = time.time() - start_time
 
@@ -58,7 +58,6 @@ if ffprobe_path:
 from PIL import Image
 import requests
 from google.cloud import texttospeech
-from google.oauth2 import service_account
 import uuid
 import re
 import warnings
@@ -100,6 +99,14 @@ if os.name == 'nt':
 
 import studio_utils as utils
 import studio_config as config
+import encoder_registry
+import tracing
+import tts_cache
+import tts_engine
+import tts_client_pool
+import tts_timing
+import audio_assembly
+from edge_tts_worker import edge_worker
 # from ui_dialogs import CompletionDialog
 from studio_config import TEMP_DIR
 
@@ -145,7 +152,6 @@ class MoviePyLogger:
 import time
 import random
 import threading
-import asyncio
 
 # TTS API 키 사용량 추적 모듈
 try:
@@ -174,7 +180,7 @@ def _monitor_encoding_progress(output_path, app, stop_event, duration_seconds, t
 
     # Eel을 통해 프론트엔드에 진행률 업데이트
     try:
-        import eel
+        from progress_hub import progress_hub
         has_eel = True
     except:
         has_eel = False
@@ -215,7 +221,7 @@ def _monitor_encoding_progress(output_path, app, stop_event, duration_seconds, t
             # Eel을 통해 프론트엔드 업데이트
             if has_eel:
                 try:
-                    eel.studioUpdateProgressFromPython(bar_progress, f"인코딩 중... {int(progress)}%", detail_text)
+                    progress_hub.publish('studioUpdateProgressFromPython', bar_progress, f"인코딩 중... {int(progress)}%", detail_text)
                 except:
                     pass  # Eel 호출 실패 시 무시
 
@@ -230,7 +236,16 @@ def validate_api_key(secret):
     except Exception as e:
         return False, f"API 키가 유효하지 않거나 네트워크에 문제가 있습니다.\n\n오류: {e}"
 
-def _synthesize_chunk(secret, text, api_voice, rate, pitch, volume_gain_db=0, is_ssml=False, max_retries=5):
+def _is_service_account_file(secret):
+    """프로필 값이 서비스 계정 JSON 파일 경로인지 확인"""
+    return os.path.isabs(secret) and os.path.exists(secret) and secret.lower().endswith(".json")
+
+def _supports_timepoints(api_voice):
+    """SSML mark 시간 정보를 받을 수 있는 음성인지 (Chirp/Studio는 mark 미지원)"""
+    return "Chirp" not in api_voice and "Studio" not in api_voice
+
+@tracing.traced('tts.google_request', cat='tts')
+def _synthesize_chunk(secret, text, api_voice, rate, pitch, volume_gain_db=0, is_ssml=False, max_retries=5, with_timepoints=False, on_rate_limited=None, cancel_event=None):
     """
     안정적인 TTS API 호출 (재시도 로직 포함)
 
@@ -239,15 +254,17 @@ def _synthesize_chunk(secret, text, api_voice, rate, pitch, volume_gain_db=0, is
         pitch: 피치 (-20 ~ 20)
         volume_gain_db: 볼륨 게인 dB (-10 ~ 10, 기본값: 0)
         max_retries: 최대 재시도 횟수 (기본값: 5)
+        with_timepoints: True면 text는 <mark>가 들어간 SSML, (오디오, timepoints) 반환 (REST 전용)
+        on_rate_limited: 429를 받을 때마다 호출 (Retry-After 초 또는 None) - 키 분산 스케줄러에 알림
+        cancel_event: set 되면 요청 슬롯/재시도 대기 중에 tts_engine.SynthesisCancelled 발생
     """
     # Chirp3-HD, Chirp-HD, Studio 모델은 속도/피치 조절 불가
     is_unsupported_voice = "Chirp" in api_voice or "Studio" in api_voice
     language_code = "-".join(api_voice.split('-', 2)[:2])
 
     # 서비스 계정 JSON 파일 사용 (더 안정적)
-    if os.path.isabs(secret) and os.path.exists(secret) and secret.lower().endswith(".json"):
-        creds = service_account.Credentials.from_service_account_file(secret)
-        client = texttospeech.TextToSpeechClient(credentials=creds)
+    if _is_service_account_file(secret):
+        client = tts_client_pool.get_client(secret)  # 파일별로 한 번만 생성
         audio_config_args = {'audio_encoding': texttospeech.AudioEncoding.MP3}
         if not is_unsupported_voice and not is_ssml:
             audio_config_args['speaking_rate'] = rate
@@ -259,25 +276,36 @@ def _synthesize_chunk(secret, text, api_voice, rate, pitch, volume_gain_db=0, is
         synthesis_input = texttospeech.SynthesisInput(ssml=text) if is_ssml else texttospeech.SynthesisInput(text=text)
         
         # SDK 호출도 재시도 로직 적용
+        limiter = tts_engine.get_rate_limiter(secret)
         for attempt in range(max_retries):
             try:
-                resp = client.synthesize_speech(
-                    input=synthesis_input, 
-                    voice=texttospeech.VoiceSelectionParams(language_code=language_code, name=api_voice), 
-                    audio_config=audio_config
-                )
+                with limiter.slot(cancel_event):
+                    resp = client.synthesize_speech(
+                        input=synthesis_input,
+                        voice=texttospeech.VoiceSelectionParams(language_code=language_code, name=api_voice),
+                        audio_config=audio_config
+                    )
                 return resp.audio_content
+            except tts_engine.SynthesisCancelled:
+                raise
             except Exception as e:
+                if type(e).__name__ == 'ResourceExhausted':  # gRPC 429
+                    limiter.on_rate_limited()
+                    if on_rate_limited:
+                        on_rate_limited(None)
                 if attempt < max_retries - 1:
                     wait_time = (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff
-                    time.sleep(wait_time)
+                    tts_engine.sleep_unless_cancelled(wait_time, cancel_event)
                 else:
                     raise
     
     # REST API 사용 (재시도 로직 강화)
-    url = f"https://texttospeech.googleapis.com/v1/text:synthesize?key={secret}"
+    # 시간 정보(timepoints)는 v1beta1에서만 제공
+    api_version = "v1beta1" if with_timepoints else "v1"
+    url = f"https://texttospeech.googleapis.com/{api_version}/text:synthesize?key={secret}"
     audio_config_payload = {"audioEncoding": "MP3"}
-    if not is_unsupported_voice and not is_ssml:
+    # mark만 넣은 SSML은 원래 일반 텍스트이므로 속도/피치 유지
+    if not is_unsupported_voice and (not is_ssml or with_timepoints):
         audio_config_payload["speakingRate"] = rate
         audio_config_payload["pitch"] = pitch
     # 볼륨 게인은 항상 적용 가능
@@ -289,34 +317,46 @@ def _synthesize_chunk(secret, text, api_voice, rate, pitch, volume_gain_db=0, is
         "voice": {"languageCode": language_code, "name": api_voice},
         "audioConfig": audio_config_payload
     }
+    if with_timepoints:
+        payload["enableTimePointing"] = ["SSML_MARK"]
     
+    # 키별 적응형 요청 제한 (고정 대기 없이 동시 요청, 429일 때만 줄임)
+    limiter = tts_engine.get_rate_limiter(secret)
     for attempt in range(max_retries):
         try:
-            r = requests.post(url, json=payload, timeout=90)  # 타임아웃 60→90초로 증가
-            r.raise_for_status()
+            # 키별 keep-alive 세션 재사용 (요청마다 TLS 연결을 새로 맺지 않음)
+            with limiter.slot(cancel_event):
+                r = tts_client_pool.request('post', secret, url, json=payload, timeout=90)  # 타임아웃 60→90초로 증가
+                r.raise_for_status()
             data = r.json()
             
             if "audioContent" not in data:
                 raise RuntimeError(f"TTS REST 응답에 audioContent가 없습니다: {data}")
             
+            if with_timepoints:
+                return base64.b64decode(data["audioContent"]), data.get("timepoints", [])
             return base64.b64decode(data["audioContent"])
             
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if e.response else 0
+            status_code = e.response.status_code if e.response is not None else 0  # Response는 4xx/5xx에서 False로 평가됨
             
             # 재시도 가능한 에러인지 판단
             if status_code in [500, 502, 503, 504]:  # 서버 에러
                 if attempt < max_retries - 1:
                     wait_time = (2 ** attempt) * 2 + random.uniform(0, 2)  # 더 긴 대기
                     print(f"[재시도 {attempt+1}/{max_retries}] 서버 에러 ({status_code}), {wait_time:.1f}초 후 재시도...")
-                    time.sleep(wait_time)
+                    tts_engine.sleep_unless_cancelled(wait_time, cancel_event)
                 else:
                     raise
             elif status_code == 429:  # Rate limit
+                retry_after = e.response.headers.get('Retry-After', '')
+                retry_after = float(retry_after) if retry_after.isdigit() else None
+                limiter.on_rate_limited(retry_after)  # 같은 키의 다른 요청도 함께 줄임
+                if on_rate_limited:
+                    on_rate_limited(retry_after)
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) * 3 + random.uniform(0, 3)  # 훨씬 더 긴 대기
-                    print(f"[재시도 {attempt+1}/{max_retries}] Rate limit 초과, {wait_time:.1f}초 후 재시도...")
-                    time.sleep(wait_time)
+                    # 대기는 요청 제한기가 처리 (다음 slot()이 쉬는 시간이 끝날 때까지 기다림)
+                    print(f"[재시도 {attempt+1}/{max_retries}] Rate limit 초과, {limiter.get_stats()['pausedFor']:.1f}초 후 재시도...")
                 else:
                     raise
             elif status_code == 400:  # Bad Request - 상세 로깅
@@ -339,12 +379,13 @@ def _synthesize_chunk(secret, text, api_voice, rate, pitch, volume_gain_db=0, is
             if attempt < max_retries - 1:
                 wait_time = (2 ** attempt) + random.uniform(0, 1)
                 print(f"[재시도 {attempt+1}/{max_retries}] 네트워크 에러, {wait_time:.1f}초 후 재시도...")
-                time.sleep(wait_time)
+                tts_engine.sleep_unless_cancelled(wait_time, cancel_event)
             else:
                 raise
 
 # --- Edge TTS 합성 함수 (무료) ---
-def synthesize_edge_tts_bytes(text, voice_name, rate=1.0, pitch=0.0, app=None, pause_after_ms=0):
+@tracing.traced('tts.edge', cat='tts')
+def synthesize_edge_tts_bytes(text, voice_name, rate=1.0, pitch=0.0, app=None, pause_after_ms=0, word_timings=None):
     """
     Edge TTS를 사용한 음성 합성 (무료)
 
@@ -355,15 +396,11 @@ def synthesize_edge_tts_bytes(text, voice_name, rate=1.0, pitch=0.0, app=None, p
         pitch: 피치 조절 (-50 ~ +50 Hz, 기본값 0)
         app: 로그 출력용 앱 객체
         pause_after_ms: 문장 후 쉬는 시간 (밀리초, 기본값: 0)
+        word_timings: 리스트를 넘기면 단어 타이밍(WordBoundary)을 채워 줌 (자막용)
 
     Returns:
         bytes: MP3 오디오 데이터
     """
-    try:
-        import edge_tts
-    except ImportError:
-        raise ImportError("edge-tts 패키지가 설치되지 않았습니다. 'pip install edge-tts'를 실행하세요.")
-
     # 텍스트 유효성 검사
     if not text or not text.strip():
         raise ValueError("합성할 텍스트가 비어있습니다.")
@@ -372,44 +409,39 @@ def synthesize_edge_tts_bytes(text, voice_name, rate=1.0, pitch=0.0, app=None, p
     if not voice_name or not voice_name.strip():
         raise ValueError("Edge TTS 음성이 선택되지 않았습니다.")
 
-    async def _synthesize():
-        # rate를 퍼센트 문자열로 변환 (1.0 = +0%, 1.5 = +50%, 0.5 = -50%)
-        rate_percent = int((rate - 1.0) * 100)
-        rate_str = f"+{rate_percent}%" if rate_percent >= 0 else f"{rate_percent}%"
-
-        # pitch를 Hz 문자열로 변환
-        pitch_hz = int(pitch)
-        pitch_str = f"+{pitch_hz}Hz" if pitch_hz >= 0 else f"{pitch_hz}Hz"
-
-        communicate = edge_tts.Communicate(text.strip(), voice_name.strip(), rate=rate_str, pitch=pitch_str)
-
-        audio_data = b""
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_data += chunk["data"]
-
-        if not audio_data:
-            raise RuntimeError(f"Edge TTS에서 오디오를 받지 못했습니다. 음성: {voice_name}")
-
-        return audio_data
+    # 같은 조건으로 합성한 적이 있으면 캐시 사용
+    cache_key = tts_cache.make_key('edge', voice_name.strip(), text.strip(), rate, int(pitch))
+    audio_bytes = tts_cache.get(cache_key, len(text))
+    if audio_bytes is not None:
+        tracing.count('tts.cache_hit')
+        if app:
+            app.log_message(f"  → Edge TTS 캐시 사용 (음성: {voice_name}, 텍스트: {len(text)}자)")
+        if word_timings is not None:
+            word_timings.extend(tts_cache.get_timings(cache_key) or [])
+        return _append_pause(audio_bytes, pause_after_ms)
 
     if app:
         app.log_message(f"  → Edge TTS 합성 중... (음성: {voice_name}, 텍스트: {len(text)}자)")
 
-    # asyncio 이벤트 루프 처리 (새 스레드에서 실행)
-    import concurrent.futures
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future = executor.submit(asyncio.run, _synthesize())
-        audio_bytes = future.result()
+    # 상주 이벤트 루프 스레드에서 처리 (동시 세션 수 제한)
+    audio_bytes, words = edge_worker.synthesize(text, voice_name, rate, pitch)
+
+    tts_cache.put(cache_key, audio_bytes)
+    tts_cache.put_timings(cache_key, words)
+    if word_timings is not None:
+        word_timings.extend(words)
+    return _append_pause(audio_bytes, pause_after_ms)
 
-    # pause_after 적용
+def _append_pause(audio_bytes, pause_after_ms):
+    """
+    MP3 끝에 무음(pause_after)을 붙입니다 (캐시에는 무음 없이 저장).
+    클립을 이어붙이는 경로는 pause_after_ms=0으로 받아 audio_assembly에서 PCM으로 추가합니다.
+    """
     if pause_after_ms > 0:
-        audio_seg = AudioSegment.from_mp3(io.BytesIO(audio_bytes))
-        audio_seg += AudioSegment.silent(duration=pause_after_ms)
+        audio_seg = audio_assembly.with_pause(audio_assembly.decode_mp3(audio_bytes), pause_after_ms)
         byte_io = io.BytesIO()
         audio_seg.export(byte_io, format="mp3")
         return byte_io.getvalue()
-
     return audio_bytes
 
 def is_edge_tts_voice(voice_name):
@@ -422,7 +454,8 @@ def is_edge_tts_voice(voice_name):
         return False
     return voice_name.endswith("Neural")
 
-def synthesize_tts_bytes(profile_name, text, api_voice, rate, pitch, volume_gain_db=0, is_ssml=False, app=None, use_edge_tts=False, pause_after_ms=0):
+@tracing.traced('tts.synthesize', cat='tts')
+def synthesize_tts_bytes(profile_name, text, api_voice, rate, pitch, volume_gain_db=0, is_ssml=False, app=None, use_edge_tts=False, pause_after_ms=0, word_timings=None):
     """
     안정적인 TTS 음성 합성 (긴 텍스트 자동 분할 + 재시도)
 
@@ -432,26 +465,53 @@ def synthesize_tts_bytes(profile_name, text, api_voice, rate, pitch, volume_gain
         volume_gain_db: 볼륨 게인 dB (-10 ~ 10, 기본값: 0)
         use_edge_tts: True이면 Edge TTS 사용 (무료, API 키 불필요)
         pause_after_ms: 문장 후 쉬는 시간 (밀리초, 기본값: 0)
+        word_timings: 리스트를 넘기면 단어 타이밍을 채워 줌 (Edge: WordBoundary, Google: SSML mark)
+                      - 자막 시간 계산용, 엔진이 지원하지 않으면 비어 있음
     """
+    tracing.count('tts.chars', len(text))
+
     # Edge TTS 사용 시 (무료) - Edge TTS는 volume_gain_db 미지원
     if use_edge_tts or is_edge_tts_voice(api_voice):
-        return synthesize_edge_tts_bytes(text, api_voice, rate, pitch, app, pause_after_ms)
+        return synthesize_edge_tts_bytes(text, api_voice, rate, pitch, app, pause_after_ms, word_timings)
+
+    # 단어 타이밍 요청 시 단어마다 <mark>를 넣은 SSML로 합성 (요청 한도 안일 때만)
+    marked_ssml = None
+    if word_timings is not None and not is_ssml and _supports_timepoints(api_voice):
+        marked_ssml, mark_tokens = tts_timing.build_marked_ssml(text)
+        if len(marked_ssml.encode('utf-8')) > TTS_SAFE_LIMIT_BYTES:
+            marked_ssml = None
+
+    # 캐시 확인 (적중 시 API 호출/사용량 기록 없음)
+    # SSML은 속도/피치를 API에 보내지 않으므로 키에서도 제외
+    cache_key = tts_cache.make_key(
+        'google', api_voice, text,
+        1.0 if is_ssml else rate, 0.0 if is_ssml else pitch, volume_gain_db, is_ssml
+    )
+    cached_timings = tts_cache.get_timings(cache_key) if word_timings is not None else None
+    # 타이밍이 필요한데 저장된 것이 없으면 다시 합성
+    cached = None if (marked_ssml and cached_timings is None) else tts_cache.get(cache_key, len(text))
+    if cached is not None:
+        tracing.count('tts.cache_hit')
+        if app:
+            app.log_message(f"  → TTS 캐시 사용 (텍스트: {len(text)}자)")
+        if word_timings is not None:
+            word_timings.extend(cached_timings or [])
+        return _append_pause(cached, pause_after_ms)
 
-    # Google TTS 사용 시 - Quota Manager를 통한 자동 키 선택
+    # Google TTS 사용 시 - Quota Manager가 남은 한도/429 상태를 보고 키를 골라 글자 수를 예약
+    # (동시 합성 요청이 여러 키로 분산되고, 함께 실행돼도 키 한도를 넘지 않음)
     secret = None
-    key_id = None
+    reservation = None
     char_count = len(text)
 
     if TTS_QUOTA_ENABLED:
-        # 사용 가능한 API 키 자동 선택
-        available_key = quota_manager.get_available_api_key(api_voice, char_count)
-        if available_key:
-            secret = available_key['api_key']
-            key_id = available_key['key_id']
-            if app and available_key.get('warning'):
-                app.log_message(f"  ⚠️ {available_key['warning']}")
+        reservation = quota_manager.reserve_api_key(api_voice, char_count)
+        if reservation:
+            secret = reservation['api_key']
+            if app and reservation.get('warning'):
+                app.log_message(f"  ⚠️ {reservation['warning']}")
             if app:
-                app.log_message(f"  🔑 TTS 키 사용: {available_key['name']}")
+                app.log_message(f"  🔑 TTS 키 사용: {reservation['name']}")
         else:
             if app:
                 app.log_message("  ⚠️ 자동 키 선택 불가 - 프로필 키 사용")
@@ -462,103 +522,79 @@ def synthesize_tts_bytes(profile_name, text, api_voice, rate, pitch, volume_gain
         if not secret:
             raise ValueError(f"'{profile_name}' 프로필 값이 비어 있습니다.")
 
+    def _on_rate_limited(retry_after):
+        if reservation:
+            quota_manager.report_rate_limited(reservation['key_id'], retry_after)
+
+    # 서비스 계정 JSON은 SDK 경로라 timepoints 미지원
+    if _is_service_account_file(secret):
+        marked_ssml = None
+
+    used_chars = 0
+    try:
+        audio_bytes, words = _synthesize_google(
+            secret, text, api_voice, rate, pitch, volume_gain_db, is_ssml, app,
+            marked_ssml, mark_tokens if marked_ssml else None, _on_rate_limited
+        )
+        used_chars = char_count
+    finally:
+        # 예약 정산 (실패 시 사용량 기록 없음)
+        if reservation:
+            quota_manager.settle_reservation(reservation['reservation_id'], used_chars)
+
+    tts_cache.put(cache_key, audio_bytes)
+    if words is not None:
+        tts_cache.put_timings(cache_key, words)
+        word_timings.extend(words)
+    return _append_pause(audio_bytes, pause_after_ms)
+
+
+def _synthesize_google(secret, text, api_voice, rate, pitch, volume_gain_db, is_ssml, app,
+                       marked_ssml=None, mark_tokens=None, on_rate_limited=None):
+    """
+    선택된 키로 Google TTS 합성 (SSML / 단어 타이밍 / 짧은 텍스트 / 긴 텍스트 분할)
+
+    Returns:
+        tuple: (MP3 bytes, 단어 타이밍 리스트 또는 None)
+    """
     text_length = len(text)
     text_bytes = len(text.encode('utf-8'))
-
-    # 사용량 추적 헬퍼 함수
-    def _track_usage(char_count):
-        if TTS_QUOTA_ENABLED and key_id:
-            quota_manager.add_usage(key_id, api_voice, char_count)
+    # 중지 요청 시 요청 슬롯/재시도 대기에서 바로 빠져나오도록 전달
+    cancel_event = getattr(app, 'cancel_event', None) if app else None
 
     # SSML 처리
     if is_ssml:
         if app:
             app.log_message(f"  → SSML 음성 합성 중... (텍스트 길이: {text_length}자)")
-        audio_bytes = _synthesize_chunk(secret, text, api_voice, 1.0, 0.0, volume_gain_db, is_ssml=True)
-        _track_usage(text_length)  # 사용량 기록
-        # pause_after 적용
-        if pause_after_ms > 0:
-            audio_seg = AudioSegment.from_mp3(io.BytesIO(audio_bytes))
-            audio_seg += AudioSegment.silent(duration=pause_after_ms)
-            byte_io = io.BytesIO()
-            audio_seg.export(byte_io, format="mp3")
-            return byte_io.getvalue()
-        return audio_bytes
+        audio_bytes = _synthesize_chunk(secret, text, api_voice, 1.0, 0.0, volume_gain_db, is_ssml=True,
+                                        on_rate_limited=on_rate_limited, cancel_event=cancel_event)
+        return audio_bytes, None
+
+    # 단어 타이밍과 함께 합성 (mark 태그는 과금 글자 수에 포함되지 않음)
+    if marked_ssml:
+        if app:
+            app.log_message(f"  → TTS API 호출 중... (텍스트: {text_length}자, 단어 타이밍 포함)")
+        audio_bytes, timepoints = _synthesize_chunk(
+            secret, marked_ssml, api_voice, rate, pitch, volume_gain_db, is_ssml=True, with_timepoints=True,
+            on_rate_limited=on_rate_limited, cancel_event=cancel_event
+        )
+        return audio_bytes, tts_timing.words_from_timepoints(mark_tokens, timepoints)
 
     # 짧은 텍스트는 바로 처리
     if text_bytes <= TTS_SAFE_LIMIT_BYTES:
         if app:
             app.log_message(f"  → TTS API 호출 중... (텍스트: {text_length}자, {text_bytes} bytes)")
-        audio_bytes = _synthesize_chunk(secret, text, api_voice, rate, pitch, volume_gain_db, is_ssml=False)
-        _track_usage(text_length)  # 사용량 기록
-        # pause_after 적용
-        if pause_after_ms > 0:
-            audio_seg = AudioSegment.from_mp3(io.BytesIO(audio_bytes))
-            audio_seg += AudioSegment.silent(duration=pause_after_ms)
-            byte_io = io.BytesIO()
-            audio_seg.export(byte_io, format="mp3")
-            return byte_io.getvalue()
-        return audio_bytes
+        audio_bytes = _synthesize_chunk(secret, text, api_voice, rate, pitch, volume_gain_db, is_ssml=False,
+                                        on_rate_limited=on_rate_limited, cancel_event=cancel_event)
+        return audio_bytes, None
     
     # 긴 텍스트 청크 분할 (다중 구두점 지원)
-    import re
-
-    # 여러 구두점으로 문장 분할 (한국어/영어 지원)
-    # 마침표, 물음표, 느낌표, 쉼표, 세미콜론 등
-    sentence_pattern = r'([^.!?\n]+[.!?\n]+|[^,;]+[,;]+)'
-    raw_sentences = re.findall(sentence_pattern, text)
+    chunks = _split_text_chunks(text, TTS_SAFE_LIMIT_BYTES)
 
-    # 분할되지 않은 나머지 텍스트 처리
-    if raw_sentences:
-        remaining = text
-        for s in raw_sentences:
-            remaining = remaining.replace(s, '', 1)
-        if remaining.strip():
-            raw_sentences.append(remaining.strip())
-    else:
-        # 패턴 매칭 실패 시 전체 텍스트를 문장으로 취급
-        raw_sentences = [text]
-
-    chunks, current_chunk = [], ""
-
-    for sentence in raw_sentences:
-        if not sentence.strip():
-            continue
-
-        # 현재 청크에 문장 추가 시도
-        test_chunk = current_chunk + sentence
-        test_bytes = len(test_chunk.encode('utf-8'))
-
-        if test_bytes > TTS_SAFE_LIMIT_BYTES:
-            # 현재 청크 저장
-            if current_chunk:
-                chunks.append(current_chunk)
-                current_chunk = sentence
-            else:
-                # 단일 문장이 너무 큼 -> 단어 단위로 분할
-                words = sentence.split()
-                word_chunk = ""
-                for word in words:
-                    test_word_chunk = word_chunk + word + " "
-                    if len(test_word_chunk.encode('utf-8')) > TTS_SAFE_LIMIT_BYTES:
-                        if word_chunk:
-                            chunks.append(word_chunk.strip())
-                        word_chunk = word + " "
-                    else:
-                        word_chunk = test_word_chunk
-                if word_chunk:
-                    current_chunk = word_chunk.strip()
-        else:
-            current_chunk = test_chunk
-
-    if current_chunk:
-        chunks.append(current_chunk)
-    
     if app:
         app.log_message(f"  → 긴 텍스트 감지: {text_length}자 ({text_bytes} bytes)")
-        app.log_message(f"  → {len(chunks)}개 청크로 분할하여 처리합니다...")
-        app.log_message(f"  → API 안정성을 위해 각 청크 간 0.5초 대기합니다.")
-    
+        app.log_message(f"  → {len(chunks)}개 청크로 분할하여 동시에 처리합니다...")
+
     # 청크 검증 및 정리
     validated_chunks = []
     for chunk in chunks:
@@ -587,58 +623,109 @@ def synthesize_tts_bytes(profile_name, text, api_voice, rate, pitch, volume_gain
     if app:
         app.log_message(f"  ✓ {len(validated_chunks)}개의 유효한 청크 준비 완료")
 
-    # 청크별 처리 (안정성 최우선)
-    combined_audio = AudioSegment.empty()
+    # 청크 동시 합성 (키별 요청 제한기가 429일 때만 속도 조절, 결과는 원래 순서)
+    total_chunks = len(validated_chunks)
 
-    for idx, chunk in enumerate(validated_chunks):
-        # 중지 요청 확인
-        if app and hasattr(app, 'cancel_event') and app.cancel_event.is_set():
-            if app:
-                app.log_message(f"  ⚠️ TTS 처리 중 중지됨 (청크 {idx+1}/{len(validated_chunks)})")
-            raise RuntimeError("사용자에 의해 중지되었습니다")
-
-        if not chunk.strip():
-            continue
-
-        if app:
-            app.log_message(f"     • 청크 {idx+1}/{len(validated_chunks)} 처리 중...")
-
-        # API 호출 (재시도 로직 내장)
+    def _chunk_worker(idx, chunk):
         try:
-            audio_bytes = _synthesize_chunk(secret, chunk, api_voice, rate, pitch, volume_gain_db, is_ssml=False)
-            combined_audio += AudioSegment.from_mp3(io.BytesIO(audio_bytes))
-
-            if app:
-                app.log_message(f"       ✓ 성공 (크기: {len(audio_bytes)} bytes)")
-
-            # Rate Limit 방지: 청크 간 짧은 대기 (0.5초)
-            if idx < len(validated_chunks) - 1:  # 마지막 청크가 아니면
-                # 대기 중에도 중지 확인 (0.1초 단위로 5번 = 0.5초)
-                for _ in range(5):
-                    if app and hasattr(app, 'cancel_event') and app.cancel_event.is_set():
-                        if app:
-                            app.log_message(f"  ⚠️ 대기 중 중지됨")
-                        raise RuntimeError("사용자에 의해 중지되었습니다")
-                    time.sleep(0.1)
-
+            return _synthesize_chunk(secret, chunk, api_voice, rate, pitch, volume_gain_db, is_ssml=False,
+                                     on_rate_limited=on_rate_limited, cancel_event=cancel_event)
         except Exception as e:
             if app:
                 app.log_message(f"       ✗ 청크 {idx+1} 처리 최종 실패: {e}")
             raise  # 실패 시 전체 작업 중단
 
-    if app:
-        app.log_message(f"  → 모든 청크 결합 완료! (총 {len(validated_chunks)}개)")
+    def _on_chunk_done(idx, audio_bytes, done_count, total):
+        if app:
+            app.log_message(f"     • 청크 {idx+1}/{total} ✓ 성공 (크기: {len(audio_bytes)} bytes, {done_count}/{total} 완료)")
 
-    # 전체 텍스트에 대한 사용량 기록
-    _track_usage(text_length)
+    try:
+        chunk_audio = tts_engine.synthesize_ordered(
+            validated_chunks, _chunk_worker,
+            group_of=lambda i, chunk: ('google-chunk', secret),
+            cancel_event=cancel_event,
+            on_clip_done=_on_chunk_done,
+            span_name='tts.chunk'
+        )
+    except tts_engine.SynthesisCancelled:
+        if app:
+            app.log_message("  ⚠️ TTS 처리 중 중지됨")
+        raise
 
-    # pause_after 적용
-    if pause_after_ms > 0:
-        combined_audio += AudioSegment.silent(duration=pause_after_ms)
+    # 디코딩한 PCM을 한 번에 이어붙임 (반복 += 복사 없음)
+    assembler = audio_assembly.AudioAssembler()
+    for audio_bytes in chunk_audio:
+        assembler.add_mp3(audio_bytes)
+    combined_audio = assembler.build().to_segment()
+
+    if app:
+        app.log_message(f"  → 모든 청크 결합 완료! (총 {total_chunks}개)")
 
     byte_io = io.BytesIO()
     combined_audio.export(byte_io, format="mp3")
-    return byte_io.getvalue()
+    return byte_io.getvalue(), None
+
+
+def _split_text_chunks(text, limit_bytes):
+    """
+    긴 텍스트를 문장 단위로 나눠 limit_bytes 이하 청크로 묶습니다 (한 번 훑기).
+    - 마침표/물음표/느낌표/줄바꿈, 쉼표/세미콜론 기준 (한국어/영어)
+    - 한 문장이 한도를 넘으면 단어 단위로 분할
+    """
+    sentence_pattern = re.compile(r'([^.!?\n]+[.!?\n]+|[^,;]+[,;]+)')
+    raw_sentences = []
+    leftovers = []  # 패턴에 걸리지 않은 나머지 (원래 위치 순서대로)
+    position = 0
+    for match in sentence_pattern.finditer(text):
+        leftovers.append(text[position:match.start()])
+        raw_sentences.append(match.group(0))
+        position = match.end()
+    leftovers.append(text[position:])
+
+    if raw_sentences:
+        remaining = ''.join(leftovers).strip()
+        if remaining:
+            raw_sentences.append(remaining)
+    else:
+        # 패턴 매칭 실패 시 전체 텍스트를 문장으로 취급
+        raw_sentences = [text]
+
+    chunks, current_parts, current_bytes = [], [], 0
+
+    for sentence in raw_sentences:
+        if not sentence.strip():
+            continue
+
+        sentence_bytes = len(sentence.encode('utf-8'))
+        if current_bytes + sentence_bytes <= limit_bytes:
+            current_parts.append(sentence)
+            current_bytes += sentence_bytes
+            continue
+
+        # 현재 청크 저장
+        if current_parts:
+            chunks.append(''.join(current_parts))
+            current_parts, current_bytes = [], 0
+        if sentence_bytes <= limit_bytes:
+            current_parts, current_bytes = [sentence], sentence_bytes
+            continue
+
+        # 단일 문장이 너무 큼 -> 단어 단위로 분할
+        word_parts, word_bytes = [], 0
+        for word in sentence.split():
+            size = len(word.encode('utf-8')) + 1  # 뒤 공백 포함
+            if word_bytes + size > limit_bytes and word_parts:
+                chunks.append(' '.join(word_parts))
+                word_parts, word_bytes = [], 0
+            word_parts.append(word)
+            word_bytes += size
+        if word_parts:
+            current_parts, current_bytes = [' '.join(word_parts)], word_bytes - 1
+
+    if current_parts:
+        chunks.append(''.join(current_parts))
+    return chunks
+
 
 def generate_single_clip_audio(app_tab, cid, api_key_profile_name=None):
     clip = app_tab._get_clip_by_id(cid)
@@ -746,16 +833,18 @@ def generate_srt_from_audio(audio_path, output_srt_path, app=None, model_size="b
             app.log_message(f"{traceback.format_exc()}")
         return False
 
-def generate_srt_from_clips(clips, audio_segments, output_srt_path, app=None, max_chars=35):
+def generate_srt_from_clips(clips, audio_segments, output_srt_path, app=None, max_chars=35, clip_timings=None):
     """
     클립 데이터와 오디오 세그먼트를 사용하여 원본 텍스트 기반 정확한 SRT 자막 생성
 
     Args:
         clips: 클립 데이터 리스트 [{'character': '캐릭터명', 'text': '대사'}]
-        audio_segments: AudioSegment 리스트 (각 클립별 오디오)
+        audio_segments: AudioSegment 리스트 (각 클립별 오디오) 또는 클립별 길이(초) 리스트
         output_srt_path: 출력 SRT 파일 경로
         app: 로그 출력을 위한 앱 객체 (옵션)
         max_chars: 자막 한 줄 최대 글자 수 (기본값: 35, 약 1-2줄)
+        clip_timings: 클립별 단어 타이밍 리스트 (synthesize_tts_bytes의 word_timings)
+                      - 있으면 자막 조각 시간을 단어 위치로, 없으면 글자 수 비율로 계산
 
     Returns:
         True if successful, False otherwise
@@ -857,9 +946,9 @@ def generate_srt_from_clips(clips, audio_segments, output_srt_path, app=None, ma
             current_time = 0.0  # 누적 시간 (초)
             srt_index = 1  # 자막 번호
 
-            for clip, audio_seg in zip(clips, audio_segments):
+            for clip_index, (clip, audio_seg) in enumerate(zip(clips, audio_segments)):
                 # 오디오 길이 (밀리초 → 초)
-                duration = len(audio_seg) / 1000.0
+                duration = audio_seg if isinstance(audio_seg, (int, float)) else len(audio_seg) / 1000.0
 
                 # 텍스트 (SSML 태그 제거)
                 text = clip['text'].strip()
@@ -869,12 +958,13 @@ def generate_srt_from_clips(clips, audio_segments, output_srt_path, app=None, ma
                 # 텍스트를 자연스럽게 분할
                 text_segments = split_text_smartly(text, max_chars)
 
-                # 각 세그먼트에 시간 할당
-                time_per_segment = duration / len(text_segments)
+                # 각 세그먼트에 시간 할당 (엔진 단어 타이밍 우선)
+                words = clip_timings[clip_index] if clip_timings and clip_index < len(clip_timings) else None
+                segment_times = tts_timing.segment_times(text_segments, words, duration)
 
-                for seg_idx, seg_text in enumerate(text_segments):
-                    seg_start = current_time + (seg_idx * time_per_segment)
-                    seg_end = seg_start + time_per_segment
+                for seg_text, (rel_start, rel_end) in zip(text_segments, segment_times):
+                    seg_start = current_time + rel_start
+                    seg_end = current_time + rel_end
 
                     # SRT 형식: 번호, 타임스탬프, 텍스트, 빈 줄
                     srt_file.write(f"{srt_index}\n")
@@ -899,11 +989,19 @@ def generate_srt_from_clips(clips, audio_segments, output_srt_path, app=None, ma
             app.log_message(f"{traceback.format_exc()}")
         return False
 
+@tracing.traced('render_chunk', cat='render')
 def _render_chunk_worker(args):
-    app, audio_chunk_path, job, chunk_index, is_batch = args
+    app, audio_chunk_path, job, chunk_index, is_batch = args[:5]
+    # audio_assembly 결과 (AssembledAudio/StreamedAudio) - 있으면 파일을 다시 디코딩하지 않고
+    # 스펙트로그램도 구간 단위로 계산 (긴 나레이션에서도 메모리 일정)
+    audio = args[5] if len(args) > 5 else None
     try:
-        y, sr = librosa.load(audio_chunk_path, sr=None, mono=True, dtype=np.float32)
-        duration = librosa.get_duration(y=y, sr=sr)
+        if audio is not None:
+            sr, duration = audio.frame_rate, audio.duration
+        else:
+            tracing.stage('librosa.load', cat='audio')
+            y, sr = librosa.load(audio_chunk_path, sr=None, mono=True, dtype=np.float32)
+            duration = librosa.get_duration(y=y, sr=sr)
         tab_ref = app.batch_process_tab if is_batch else app.video_maker_tab
 
         eq_settings = job['eq_settings']
@@ -951,7 +1049,11 @@ def _render_chunk_worker(args):
 
         # n_bars는 이미 위에서 설정됨
         n_segs = 18  # side_bar 스타일용 세그먼트 수
-        S = librosa.feature.melspectrogram(y=y, sr=sr, n_fft=2048, hop_length=512, n_mels=n_bars)
+        tracing.stage('melspectrogram', cat='audio')
+        if audio is not None:
+            S = audio.melspectrogram(n_fft=2048, hop_length=512, n_mels=n_bars)
+        else:
+            S = librosa.feature.melspectrogram(y=y, sr=sr, n_fft=2048, hop_length=512, n_mels=n_bars)
         
         # 안전한 스펙트로그램 처리 (무음 구간 대응)
         max_val = np.max(S)
@@ -1299,18 +1401,28 @@ def _render_chunk_worker(args):
         try:
             # 프레임별로 PNG 저장
             app.log_message(f"  PNG 프레임 폴더: {frames_dir}")
+            tracing.stage('frames', cat='render', frames=total_frames)
+
+            # 프레임 단계별 누적 시간 (프레임마다 구간을 남기면 trace 이벤트 한도를 넘으므로
+            # 청크 단위 'frames' 단계 하나 + 단계별 합계 카운터로 기록)
+            update_time = draw_time = write_time = 0.0
 
             for i in range(total_frames):
                 if app.cancel_event.is_set():
                     return None
 
                 # 업데이트 함수 호출
+                t0 = time.perf_counter()
                 update_func(i)
 
                 # canvas에서 RGBA 버퍼 직접 추출
+                t1 = time.perf_counter()
                 canvas.draw()
                 buf = canvas.buffer_rgba()
                 rgba_array = np.asarray(buf).copy()  # copy()로 버퍼 고정
+                t2 = time.perf_counter()
+                update_time += t1 - t0
+                draw_time += t2 - t1
 
                 # 크로마키 녹색(0,255,0)을 투명으로 변환
                 # 녹색 픽셀 찾기 (R<10, G>240, B<10)
@@ -1323,15 +1435,22 @@ def _render_chunk_worker(args):
                     app.log_message(f"  첫 프레임 RGBA: shape={rgba_array.shape}, 비녹색픽셀수={non_green_count}, A_max={rgba_array[:,:,3].max()}, A_min={rgba_array[:,:,3].min()}")
 
                 # PIL로 RGBA 이미지 저장
+                t0 = time.perf_counter()
                 pil_img = PILImage.fromarray(rgba_array, 'RGBA')
                 frame_path = os.path.join(frames_dir, f"frame_{i:05d}.png")
                 pil_img.save(frame_path, 'PNG')
+                write_time += time.perf_counter() - t0
 
                 # 진행률 업데이트 (20프레임마다)
                 if i % 20 == 0:
                     progress = 40 + ((i + 1) / total_frames * 40)
                     app.update_progress(f"EQ 렌더링 중: {i + 1}/{total_frames}", progress, is_batch=is_batch)
 
+            tracing.count('frame.update_ms', round(update_time * 1000))
+            tracing.count('frame.draw_ms', round(draw_time * 1000))
+            tracing.count('frame.png_write_ms', round(write_time * 1000))
+            tracing.count('frames', total_frames)
+
             plt.close(fig)
 
             # PNG 파일 수 확인
@@ -1341,6 +1460,7 @@ def _render_chunk_worker(args):
 
             # FFmpeg로 PNG 시퀀스를 MOV로 변환 (투명 배경 유지)
             app.log_message(f"  PNG 시퀀스를 MOV로 변환 중...")
+            tracing.stage('ffmpeg.mov', cat='ffmpeg')
             ffmpeg_cmd = [
                 'ffmpeg', '-y',
                 '-framerate', str(fps),
@@ -1377,10 +1497,79 @@ def _render_chunk_worker(args):
         app.log_message(f"오류: 비주얼라이저 청크 {chunk_index} 렌더링 실패 - {e}\n{traceback.format_exc()}")
         return None
 
-def render_visualizer_video(app, audio_path, job, is_batch=False):
-    app.log_message("비주얼라이저 렌더링 시작..."); args = (app, audio_path, job, 0, is_batch); return _render_chunk_worker(args)
+def render_visualizer_video(app, audio_path, job, is_batch=False, audio=None):
+    app.log_message("비주얼라이저 렌더링 시작..."); args = (app, audio_path, job, 0, is_batch, audio); return _render_chunk_worker(args)
+
+def synthesize_clips_to_wav(app, job, clips, audio_path, is_batch=False):
+    """
+    클립들을 동시에 합성해 audio_path WAV에 대본 순서대로 기록합니다.
+    (영상 제작과 배치 공유 산출물(batch_artifacts)이 함께 사용)
+
+    Returns:
+        tuple: (StreamedAudio, 클립별 단어 타이밍 리스트) - 취소되면 tts_engine.SynthesisCancelled
+    """
+    # 클립별 음성 설정 확인 (합성 시작 전에 설정 오류를 먼저 확인)
+    clip_voices = []
+    for clip in clips:
+        char = clip['character']
+
+        # narration_settings에서 캐릭터 설정 가져오기 (없으면 기본값 사용)
+        if char in job['narration_settings']:
+            w = job['narration_settings'][char]
+        else:
+            # 기본 음성 설정 사용
+            app.log_message(f"  경고: '{char}' 음성 설정이 없어 기본값 사용")
+            w = {
+                'voice': 'ko-KR-Wavenet-A',
+                'speed': 1.0,
+                'pitch': 0.0
+            }
+
+        # voice 필드가 이미 API 형식인지 확인 (Eel 버전 호환성)
+        if w['voice'].startswith(('ko-', 'en-', 'ja-', 'es-', 'fr-', 'de-', 'it-', 'pt-', 'ru-', 'zh-', 'hi-', 'ar-')):
+            # 이미 API 형식 (예: ko-KR-Standard-A)
+            api_voice = w['voice']
+        else:
+            # 내부 형식 (예: 여성_A) -> API 형식으로 변환 필요 (Tkinter 버전)
+            api_voice = next((name for name, gender in config.LANG_VOICE_GROUPS.get(w['lang'], {}).get(w['group'], {}).items() if app.video_maker_tab._format_voice_name_internal(name, gender) == w['voice']), None)
+            if not api_voice: raise ValueError(f"API 음성을 찾을 수 없습니다: {w['voice']}")
+        clip_voices.append((w, api_voice))
+
+    # 클립 PCM은 끝나는 대로 디스크 WAV에 순서대로 기록 (전체 오디오를 메모리에 두지 않음)
+    audio_writer = audio_assembly.StreamingAudioWriter(audio_path)
+    clip_sink = audio_assembly.OrderedClipWriter(audio_writer)
+
+    def _synthesize_clip(i, clip):
+        w, api_voice = clip_voices[i]
+        words = []  # 엔진 단어 타이밍 (SRT용)
+        audio_bytes = synthesize_tts_bytes(job['api_key_profile'], clip['text'], api_voice, w['speed'], w['pitch'], w.get('volumeGain', 0), clip.get('is_ssml', False), app=app, word_timings=words)
+        with tracing.span('mp3.decode', 'audio'):
+            segment = audio_assembly.decode_mp3(audio_bytes)
+        # 문장 후 쉬는 시간은 PCM에서 바로 추가 (MP3 재인코딩 없음)
+        clip_sink.put(i, segment, w.get('pauseAfter', 0))
+        return words
+
+    def _on_clip_done(i, result, done, total):
+        clip = clips[i]
+        text_preview = clip['text'][:50] + "..." if len(clip['text']) > 50 else clip['text']
+        app.log_message(f"\n[클립 {i+1}/{total}] '{clip['character']}' ✓ 완료! ({done}/{total})")
+        app.log_message(f"  텍스트: {text_preview}")
+        app.update_progress(f"음성 생성 중 ({done}/{total})...", 5 + (done/total*35), is_batch)
+
+    # 동시 합성, 오디오는 원래 순서대로 기록
+    try:
+        clip_timings = tts_engine.synthesize_ordered(
+            clips, _synthesize_clip,
+            group_of=lambda i, clip: tts_engine.engine_group(is_edge_tts_voice(clip_voices[i][1]), job['api_key_profile']),
+            cancel_event=app.cancel_event,
+            on_clip_done=_on_clip_done
+        )
+    finally:
+        streamed_audio = clip_sink.close()
+    return streamed_audio, clip_timings
 
-def _execute_single_video_job(app, job, is_batch=False):
+@tracing.traced_job('video_job')
+def _execute_single_video_job(app, job, is_batch=False, artifacts=None):
     temp_files = []
     try:
         app.log_message(f"\n[디버그] _execute_single_video_job 시작")
@@ -1394,96 +1583,32 @@ def _execute_single_video_job(app, job, is_batch=False):
             app.log_message(f"  - eq_settings ê°': {job['eq_settings']}")
         
         app.update_progress("오디오 생성 시작...", 5, is_batch)
-        combined_audio = AudioSegment.empty()
-        audio_segments = []  # 각 클립별 오디오 저장 (SRT 생성용)
-        if is_batch:
+        tracing.stage('tts')
+        clip_durations = []  # 각 클립별 오디오 길이 (SRT/자막용)
+        if artifacts is not None:
+            clips = artifacts.clips()
+        elif is_batch:
             # 배치 모드: 대본 파일을 읽어서 [캐릭터명] 패턴으로 파싱
-            script_text = utils.read_script_file(job['scriptPath'])
-            clips = []
-            current_character = '나레이션'
-            current_lines = []
-
-            for line in script_text.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-
-                # [캐릭터명] 패턴 체크
-                import re
-                char_match = re.match(r'^\[([^\]]+)\]\s*(.*)', line)
-                if char_match:
-                    # 이전 캐릭터의 대사가 있으면 clips에 추가
-                    if current_lines:
-                        text = ' '.join(current_lines)
-                        clips.append({
-                            "character": current_character,
-                            "text": text,
-                            "is_ssml": False
-                        })
-                        current_lines = []
-
-                    # 새 캐릭터 시작
-                    current_character = char_match.group(1).strip()
-                    remaining_text = char_match.group(2).strip()
-                    if remaining_text:
-                        current_lines.append(remaining_text)
-                else:
-                    # 캐릭터 지정이 없는 라인은 현재 캐릭터에 추가
-                    current_lines.append(line)
-
-            # 마지막 캐릭터의 대사 추가
-            if current_lines:
-                text = ' '.join(current_lines)
-                clips.append({
-                    "character": current_character,
-                    "text": text,
-                    "is_ssml": False
-                })
-
+            clips = utils.parse_script_clips(utils.read_script_file(job['scriptPath']))
             app.log_message(f"[배치] 대본 파싱 완료: {len(clips)}개 클립")
         else: clips = job['clips']
 
-        for i, clip in enumerate(clips):
-            if app.cancel_event.is_set(): return False
-
-            char = clip['character']
-            text_preview = clip['text'][:50] + "..." if len(clip['text']) > 50 else clip['text']
-            app.log_message(f"\n[클립 {i+1}/{len(clips)}] '{char}' 처리 중...")
-            app.log_message(f"  텍스트: {text_preview}")
-
-            app.update_progress(f"음성 생성 중 ({i+1}/{len(clips)})...", 5 + (i/len(clips)*35), is_batch)
-
-            # narration_settings에서 캐릭터 설정 가져오기 (없으면 기본값 사용)
-            if char in job['narration_settings']:
-                w = job['narration_settings'][char]
-            else:
-                # 기본 음성 설정 사용
-                app.log_message(f"  경고: '{char}' 음성 설정이 없어 기본값 사용")
-                w = {
-                    'voice': 'ko-KR-Wavenet-A',
-                    'speed': 1.0,
-                    'pitch': 0.0
-                }
-
-            # voice 필드가 이미 API 형식인지 확인 (Eel 버전 호환성)
-            if w['voice'].startswith(('ko-', 'en-', 'ja-', 'es-', 'fr-', 'de-', 'it-', 'pt-', 'ru-', 'zh-', 'hi-', 'ar-')):
-                # 이미 API 형식 (예: ko-KR-Standard-A)
-                api_voice = w['voice']
+        try:
+            if artifacts is not None:
+                # 배치 공유 산출물: 같은 작업의 다른 출력(투명 EQ/MP3)과 합성 결과를 함께 사용
+                streamed_audio, clip_timings = artifacts.audio()
+                audio_path = streamed_audio.path
             else:
-                # 내부 형식 (예: 여성_A) -> API 형식으로 변환 필요 (Tkinter 버전)
-                api_voice = next((name for name, gender in config.LANG_VOICE_GROUPS.get(w['lang'], {}).get(w['group'], {}).items() if app.video_maker_tab._format_voice_name_internal(name, gender) == w['voice']), None)
-                if not api_voice: raise ValueError(f"API 음성을 찾을 수 없습니다: {w['voice']}")
-
-            audio_bytes = synthesize_tts_bytes(job['api_key_profile'], clip['text'], api_voice, w['speed'], w['pitch'], w.get('volumeGain', 0), clip.get('is_ssml', False), app=app, pause_after_ms=w.get('pauseAfter', 0))
-            audio_seg = AudioSegment.from_mp3(io.BytesIO(audio_bytes))
-            audio_segments.append(audio_seg)  # SRT 생성용 저장
-            combined_audio += audio_seg
-            app.log_message(f"  ✓ 완료!")
+                audio_path = os.path.join(TEMP_DIR, f"temp_audio_{job.get('id', uuid.uuid4())}.wav")
+                temp_files.append(audio_path)
+                streamed_audio, clip_timings = synthesize_clips_to_wav(app, job, clips, audio_path, is_batch)
+        except tts_engine.SynthesisCancelled:
+            return False
+        clip_durations = streamed_audio.clip_durations
 
         if app.cancel_event.is_set(): return False
-        audio_path = os.path.join(TEMP_DIR, f"temp_audio_{job.get('id', uuid.uuid4())}.mp3")
-        temp_files.append(audio_path); combined_audio.export(audio_path, format="mp3")
-        app.log_message(f"\n[디버그] 오디오 파일 저장 완료: {audio_path}")
+        tracing.stage('audio_export')
+        app.log_message(f"\n[디버그] 오디오 파일 저장 완료: {audio_path} ({streamed_audio.duration:.1f}초)")
 
         # EQ 활성화 여부 확인
         eq_settings = job.get('eq_settings', {})
@@ -1493,8 +1618,9 @@ def _execute_single_video_job(app, job, is_batch=False):
         vis_path = None
         if eq_enabled:
             app.update_progress("비주얼라이저 렌더링...", 40, is_batch)
+            tracing.stage('visualizer')
             app.log_message(f"[디버그] 비주얼라이저 렌더링 시작...")
-            vis_path = render_visualizer_video(app, audio_path, job, is_batch)
+            vis_path = render_visualizer_video(app, audio_path, job, is_batch, audio=streamed_audio)
             if not vis_path:
                 app.log_message(f"[오류] 비주얼라이저 렌더링 실패 - vis_path가 None입니다")
                 raise RuntimeError("비주얼라이저 렌더링 실패")
@@ -1507,6 +1633,7 @@ def _execute_single_video_job(app, job, is_batch=False):
         if app.cancel_event.is_set(): return False
 
         app.update_progress("최종 영상 결합 중...", 85, is_batch)
+        tracing.stage('compose')
         app.log_message(f"[디버그] 영상 결합 시작...")
         app.log_message(f"  - image_path: {job.get('image_path', 'None')}")
 
@@ -1643,8 +1770,7 @@ def _execute_single_video_job(app, job, is_batch=False):
 
                     # 각 클립별 자막 생성
                     current_time = 0
-                    for i, (clip, audio_seg) in enumerate(zip(clips, audio_segments)):
-                        clip_duration = len(audio_seg) / 1000.0  # ms -> 초
+                    for i, (clip, clip_duration) in enumerate(zip(clips, clip_durations)):
                         clip_text = clip['text']
 
                         try:
@@ -1759,18 +1885,14 @@ def _execute_single_video_job(app, job, is_batch=False):
                 gpu_detected = False
                 gpu_type = None
                 try:
-                    result = subprocess.run(
-                        ['ffmpeg', '-hide_banner', '-encoders'],
-                        capture_output=True,
-                        text=True,
-                        timeout=2,
-                        startupinfo=SUBPROCESS_STARTUP_INFO,
-                        creationflags=SUBPROCESS_CREATION_FLAGS
-                    )
+                    # 실제 동작하는 인코더만 (ffmpeg 빌드별 검사 결과 재사용, 작업마다 검사하지 않음)
+                    working_encoders = {
+                        enc['codec'] for enc in encoder_registry.get_encoder_list() if enc['available']
+                    }
 
                     # Intel QSV 우선 확인 (프리미어 프로가 사용하는 방식)
                     # 대부분의 PC에 Intel 내장 GPU가 있으므로 호환성이 높음
-                    if 'h264_qsv' in result.stdout:
+                    if 'h264_qsv' in working_encoders:
                         codec = "h264_qsv"
                         # 프리미어 프로 스타일: VBR, 1패스, 약 19Mbps
                         ffmpeg_params = [
@@ -1785,7 +1907,7 @@ def _execute_single_video_job(app, job, is_batch=False):
                         app.log_message(f"  ✅ Intel Quick Sync 인코더 감지 (프리미어 프로 스타일)")
 
                     # NVIDIA GPU 확인 (h264_nvenc)
-                    elif 'h264_nvenc' in result.stdout:
+                    elif 'h264_nvenc' in working_encoders:
                         codec = "h264_nvenc"
                         # NVIDIA 최적화: VBR, 높은 비트레이트
                         ffmpeg_params = [
@@ -1802,7 +1924,7 @@ def _execute_single_video_job(app, job, is_batch=False):
                         app.log_message(f"  ✅ NVIDIA NVENC 인코더 감지")
 
                     # AMD GPU 확인 (h264_amf)
-                    elif 'h264_amf' in result.stdout:
+                    elif 'h264_amf' in working_encoders:
                         codec = "h264_amf"
                         ffmpeg_params = [
                             '-quality', 'balanced',       # 균형 모드
@@ -1930,6 +2052,7 @@ def _execute_single_video_job(app, job, is_batch=False):
                     if not gpu_detected:
                         write_params['preset'] = preset
 
+                    tracing.stage('encode', cat='ffmpeg')
                     final_clip.write_videofile(job['output_path'], **write_params)
 
                     # 모니터링 중지
@@ -1974,6 +2097,7 @@ def _execute_single_video_job(app, job, is_batch=False):
                         monitor_thread_cpu.start()
 
                         # CPU로 재시도
+                        tracing.stage('encode', cat='ffmpeg')
                         final_clip.write_videofile(
                             job['output_path'],
                             codec=codec,
@@ -2049,21 +2173,17 @@ def _execute_single_video_job(app, job, is_batch=False):
                 gpu_detected = False
 
                 try:
-                    result = subprocess.run(
-                        ['ffmpeg', '-hide_banner', '-encoders'],
-                        capture_output=True,
-                        text=True,
-                        timeout=2,
-                        startupinfo=SUBPROCESS_STARTUP_INFO,
-                        creationflags=SUBPROCESS_CREATION_FLAGS
-                    )
+                    # 실제 동작하는 인코더만 (ffmpeg 빌드별 검사 결과 재사용, 작업마다 검사하지 않음)
+                    working_encoders = {
+                        enc['codec'] for enc in encoder_registry.get_encoder_list() if enc['available']
+                    }
 
-                    if 'h264_qsv' in result.stdout:
+                    if 'h264_qsv' in working_encoders:
                         codec = "h264_qsv"
                         ffmpeg_params = ['-look_ahead', '1', '-global_quality', '23', '-b:v', '15M', '-maxrate', '20M', '-bufsize', '25M']
                         gpu_detected = True
                         app.log_message(f"  ✅ Intel Quick Sync 인코더 감지")
-                    elif 'h264_nvenc' in result.stdout:
+                    elif 'h264_nvenc' in working_encoders:
                         codec = "h264_nvenc"
                         ffmpeg_params = ['-preset', 'p4', '-tune', 'hq', '-rc', 'vbr', '-cq', '23', '-b:v', '15M', '-maxrate', '20M', '-bufsize', '25M']
                         gpu_detected = True
@@ -2087,6 +2207,7 @@ def _execute_single_video_job(app, job, is_batch=False):
                     write_params['preset'] = preset
 
                 app.log_message(f"  📹 영상 인코딩 시작 (EQ 없음, codec: {codec})")
+                tracing.stage('encode', cat='ffmpeg')
                 final_clip.write_videofile(job['output_path'], **write_params)
 
                 file_size = os.path.getsize(job['output_path'])
@@ -2094,11 +2215,15 @@ def _execute_single_video_job(app, job, is_batch=False):
                 app.log_message(f"  ✓ 인코딩 성공 ({file_size_mb:.1f} MB)")
 
         # SRT 자막 파일 생성 (배치 모드 포함)
-        if not app.cancel_event.is_set() and clips and audio_segments:
+        tracing.stage('srt')
+        if not app.cancel_event.is_set() and clips and clip_durations:
             try:
                 srt_path = job['output_path'].replace('.mp4', '.srt')
                 app.log_message(f"\n📝 SRT 자막 파일 생성 중...")
-                generate_srt_from_clips(clips, audio_segments, srt_path, app=app)
+                if artifacts is not None:
+                    artifacts.write_srt(srt_path)
+                else:
+                    generate_srt_from_clips(clips, clip_durations, srt_path, app=app, clip_timings=clip_timings)
             except Exception as e:
                 app.log_message(f"⚠️ SRT 생성 실패 (영상은 정상 생성됨): {e}")
 
@@ -2171,20 +2296,13 @@ def _execute_single_video_job_transparent(job, app, cancel_event):
         app.log_message(f"  - eq_settings: {job.get('eq_settings', {})}")
 
         app.update_progress("오디오 생성 시작...", 5)
-        combined_audio = AudioSegment.empty()
-        audio_segments = []  # 각 클립별 오디오 저장 (SRT 생성용)
+        clip_durations = []  # 각 클립별 오디오 길이 (SRT용)
         clips = job['clips']
 
-        for i, clip in enumerate(clips):
-            if cancel_event.is_set():
-                return {'status': 'cancelled'}
-
+        # 클립별 음성 설정
+        clip_voices = []
+        for clip in clips:
             char = clip['character']
-            text_preview = clip['text'][:50] + "..." if len(clip['text']) > 50 else clip['text']
-            app.log_message(f"\n[클립 {i+1}/{len(clips)}] '{char}' 처리 중...")
-            app.log_message(f"  텍스트: {text_preview}")
-
-            app.update_progress(f"음성 생성 중 ({i+1}/{len(clips)})...", 5 + (i/len(clips)*35))
 
             # 캐릭터별 음성 설정 사용
             if char in job['narration_settings']:
@@ -2201,7 +2319,17 @@ def _execute_single_video_job_transparent(job, app, cancel_event):
                 rate = 1.0
                 pitch = 0.0
                 volume_gain = 0
+            clip_voices.append((api_voice, rate, pitch, volume_gain))
+
+        # 클립 PCM은 끝나는 대로 디스크 WAV에 순서대로 기록 (전체 오디오를 메모리에 두지 않음)
+        audio_path = os.path.join(TEMP_DIR, f"temp_audio_{job.get('id', uuid.uuid4())}.wav")
+        temp_files.append(audio_path)
+        audio_writer = audio_assembly.StreamingAudioWriter(audio_path)
+        clip_sink = audio_assembly.OrderedClipWriter(audio_writer)
 
+        def _synthesize_clip(i, clip):
+            api_voice, rate, pitch, volume_gain = clip_voices[i]
+            words = []  # 엔진 단어 타이밍 (SRT용)
             audio_bytes = synthesize_tts_bytes(
                 job['api_key_profile'],
                 clip['text'],
@@ -2210,24 +2338,41 @@ def _execute_single_video_job_transparent(job, app, cancel_event):
                 pitch,
                 volume_gain,
                 clip.get('is_ssml', False),
-                app=app
+                app=app,
+                word_timings=words
             )
-            audio_seg = AudioSegment.from_mp3(io.BytesIO(audio_bytes))
-            audio_segments.append(audio_seg)  # SRT 생성용 저장
-            combined_audio += audio_seg
-            app.log_message(f"  ✓ 완료!")
+            clip_sink.put(i, audio_assembly.decode_mp3(audio_bytes))
+            return words
+
+        def _on_clip_done(i, result, done, total):
+            clip = clips[i]
+            text_preview = clip['text'][:50] + "..." if len(clip['text']) > 50 else clip['text']
+            app.log_message(f"\n[클립 {i+1}/{total}] '{clip['character']}' ✓ 완료! ({done}/{total})")
+            app.log_message(f"  텍스트: {text_preview}")
+            app.update_progress(f"음성 생성 중 ({done}/{total})...", 5 + (done/total*35))
+
+        # 동시 합성, 오디오는 원래 순서대로 기록
+        try:
+            clip_timings = tts_engine.synthesize_ordered(
+                clips, _synthesize_clip,
+                group_of=lambda i, clip: tts_engine.engine_group(is_edge_tts_voice(clip_voices[i][0]), job['api_key_profile']),
+                cancel_event=cancel_event,
+                on_clip_done=_on_clip_done
+            )
+        except tts_engine.SynthesisCancelled:
+            return {'status': 'cancelled'}
+        finally:
+            streamed_audio = clip_sink.close()
+        clip_durations = streamed_audio.clip_durations
 
         if cancel_event.is_set():
             return {'status': 'cancelled'}
 
-        audio_path = os.path.join(TEMP_DIR, f"temp_audio_{job.get('id', uuid.uuid4())}.mp3")
-        temp_files.append(audio_path)
-        combined_audio.export(audio_path, format="mp3")
         app.log_message(f"\n[디버그] 오디오 파일 저장 완료: {audio_path}")
 
         app.update_progress("비주얼라이저 렌더링...", 40)
         app.log_message(f"[디버그] 비주얼라이저 렌더링 시작...")
-        vis_path = render_visualizer_video(app, audio_path, job, is_batch=False)
+        vis_path = render_visualizer_video(app, audio_path, job, is_batch=False, audio=streamed_audio)
         if not vis_path:
             app.log_message(f"[오류] 비주얼라이저 렌더링 실패")
             return {'status': 'error', 'error': '비주얼라이저 렌더링 실패'}
@@ -2266,11 +2411,11 @@ def _execute_single_video_job_transparent(job, app, cancel_event):
             )
 
         # SRT 자막 파일 생성
-        if not cancel_event.is_set() and clips and audio_segments:
+        if not cancel_event.is_set() and clips and clip_durations:
             try:
                 srt_path = job['output_path'].replace('.mov', '.srt')
                 app.log_message(f"\n📝 SRT 자막 파일 생성 중...")
-                generate_srt_from_clips(clips, audio_segments, srt_path, app=app)
+                generate_srt_from_clips(clips, clip_durations, srt_path, app=app, clip_timings=clip_timings)
             except Exception as e:
                 app.log_message(f"⚠️ SRT 생성 실패 (영상은 정상 생성됨): {e}")
 
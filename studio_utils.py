@@ -130,6 +130,45 @@ def read_script_file(filepath):
         with open(filepath, "r", encoding="utf-8-sig") as f:
             return f.read()
 
+def parse_script_clips(script_text):
+    """
+    대본 텍스트를 [캐릭터명] 패턴으로 나눠 클립 리스트를 만듭니다.
+    캐릭터 지정이 없는 줄은 현재 캐릭터(처음에는 '나레이션')의 대사에 이어 붙입니다.
+
+    Returns:
+        list: [{'character': 캐릭터명, 'text': 대사, 'is_ssml': False}, ...]
+    """
+    import re
+    clips = []
+    current_character = '나레이션'
+    current_lines = []
+
+    for line in script_text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        char_match = re.match(r'^\[([^\]]+)\]\s*(.*)', line)
+        if char_match:
+            # 이전 캐릭터의 대사가 있으면 clips에 추가
+            if current_lines:
+                clips.append({"character": current_character, "text": ' '.join(current_lines), "is_ssml": False})
+                current_lines = []
+
+            # 새 캐릭터 시작
+            current_character = char_match.group(1).strip()
+            remaining_text = char_match.group(2).strip()
+            if remaining_text:
+                current_lines.append(remaining_text)
+        else:
+            # 캐릭터 지정이 없는 라인은 현재 캐릭터에 추가
+            current_lines.append(line)
+
+    # 마지막 캐릭터의 대사 추가
+    if current_lines:
+        clips.append({"character": current_character, "text": ' '.join(current_lines), "is_ssml": False})
+    return clips
+
 def validate_float(new_value):
     """Tkinter entry 위젯 유효성 검사: 실수 또는 빈 문자열만 허용"""
     if not new_value:  # 빈 문자열 허용
@@ -0,0 +1,199 @@
+"""
+썸네일 캐시 모듈
+- 커넥션 풀을 쓰는 세션으로 썸네일 병렬 다운로드
+- URL 기준 디스크 캐시 (용량 초과 시 오래 안 쓴 파일부터 삭제 - disk_lru.DiskLRU)
+- 검색 결과 그리드용 리사이즈 썸네일 (로컬 /thumb 엔드포인트에서 사용)
+"""
+
+import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from data_path import CACHE_DIR
+from disk_lru import DiskLRU
+
+THUMBNAIL_CACHE_DIR = os.path.join(CACHE_DIR, 'thumbnails')
+THUMBNAIL_CACHE_MAX_BYTES = 300 * 1024 * 1024  # 300MB
+THUMBNAIL_CACHE_TRIM_RATIO = 0.8  # 정리 시 최대 용량의 80%까지 줄임
+MAX_DOWNLOAD_WORKERS = 16
+DOWNLOAD_TIMEOUT = 10
+
+# 로컬 프록시로 허용하는 썸네일 호스트 (임의 URL 프록시 방지)
+ALLOWED_THUMBNAIL_HOSTS = ('i.ytimg.com', 'i9.ytimg.com', 'yt3.ggpht.com', 'yt3.googleusercontent.com')
+# 그리드에서 실제로 쓰는 가로 크기 (px)
+THUMBNAIL_VARIANT_WIDTHS = (88, 160, 240, 320)
+
+_session = None
+_session_lock = threading.Lock()
+
+# 용량 제한 저장소
+_store = DiskLRU(THUMBNAIL_CACHE_DIR, THUMBNAIL_CACHE_MAX_BYTES, THUMBNAIL_CACHE_TRIM_RATIO, label='썸네일 캐시')
+
+
+def _get_session():
+    """커넥션을 재사용하는 공용 HTTP 세션을 반환합니다."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_DOWNLOAD_WORKERS, max_retries=1)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+def _ensure_cache_dir():
+    """썸네일 캐시 디렉토리가 없으면 생성합니다."""
+    if not os.path.exists(THUMBNAIL_CACHE_DIR):
+        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+
+
+def get_cache_path(key):
+    """캐시 키(URL 등)에 해당하는 파일 경로를 반환합니다."""
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(THUMBNAIL_CACHE_DIR, digest[:2], digest)
+
+
+def read_cache(key):
+    """캐시된 데이터를 반환합니다 (없으면 None). 읽은 파일은 최근 사용으로 표시합니다."""
+    return _store.read(get_cache_path(key))
+
+
+def write_cache(key, data):
+    """데이터를 캐시에 저장합니다 (임시 파일에 쓴 뒤 교체)."""
+    _store.write(get_cache_path(key), data)
+
+
+def get_thumbnail_bytes(url):
+    """
+    썸네일 이미지를 가져옵니다 (캐시 우선).
+
+    Args:
+        url: 썸네일 URL
+
+    Returns:
+        bytes 또는 None (다운로드 실패)
+    """
+    if not url:
+        return None
+
+    data = read_cache(url)
+    if data is not None:
+        return data
+
+    try:
+        response = _get_session().get(url, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        data = response.content
+    except Exception as e:
+        print(f"[썸네일 캐시] 다운로드 실패 ({url}): {e}")
+        return None
+
+    _ensure_cache_dir()
+    write_cache(url, data)
+    return data
+
+
+def fetch_thumbnails(urls, max_workers=MAX_DOWNLOAD_WORKERS, progress_callback=None):
+    """
+    여러 썸네일을 병렬로 가져옵니다.
+
+    Args:
+        urls: 썸네일 URL 리스트
+        max_workers: 동시 다운로드 수
+        progress_callback: 진행률 콜백 (completed, total)
+
+    Returns:
+        list: URL 순서대로 bytes 또는 None
+    """
+    total = len(urls)
+    results = [None] * total
+    if total == 0:
+        return results
+
+    completed = 0
+    completed_lock = threading.Lock()
+
+    def worker(index, url):
+        nonlocal completed
+        results[index] = get_thumbnail_bytes(url)
+        if progress_callback:
+            with completed_lock:
+                completed += 1
+                current = completed
+            try:
+                progress_callback(current, total)
+            except Exception:
+                pass
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as executor:
+        for i, url in enumerate(urls):
+            executor.submit(worker, i, url)
+
+    return results
+
+
+def is_allowed_thumbnail_url(url):
+    """로컬 프록시로 가져올 수 있는 썸네일 URL인지 확인합니다."""
+    from urllib.parse import urlparse
+
+    try:
+        parsed = urlparse(url)
+    except Exception:
+        return False
+    return parsed.scheme in ('http', 'https') and parsed.hostname in ALLOWED_THUMBNAIL_HOSTS
+
+
+def get_thumbnail_variant(url, width):
+    """
+    지정한 가로 크기로 줄인 썸네일(JPEG)을 가져옵니다.
+    원본과 리사이즈 결과 모두 디스크 캐시에 보관합니다.
+
+    Args:
+        url: 원본 썸네일 URL
+        width: 가로 크기 (THUMBNAIL_VARIANT_WIDTHS 중 가장 가까운 크기 이상으로 맞춤)
+
+    Returns:
+        tuple: (bytes, content_type) 또는 (None, None)
+    """
+    # 허용된 크기로 맞춤 (크기별 캐시 파일이 무한히 늘어나지 않도록)
+    width = next((w for w in THUMBNAIL_VARIANT_WIDTHS if w >= width), THUMBNAIL_VARIANT_WIDTHS[-1])
+    variant_key = f"{url}#w={width}"
+
+    data = read_cache(variant_key)
+    if data is not None:
+        return data, 'image/jpeg'
+
+    original = get_thumbnail_bytes(url)
+    if original is None:
+        return None, None
+
+    try:
+        from io import BytesIO
+        from PIL import Image
+
+        img = Image.open(BytesIO(original))
+        if img.width <= width:
+            # 원본이 더 작으면 그대로 사용
+            return original, Image.MIME.get(img.format, 'image/jpeg')
+
+        height = max(1, round(img.height * width / img.width))
+        img = img.convert('RGB').resize((width, height), Image.LANCZOS)
+        buffer = BytesIO()
+        img.save(buffer, 'JPEG', quality=85, optimize=True)
+        data = buffer.getvalue()
+    except Exception as e:
+        print(f"[썸네일 캐시] 리사이즈 실패 ({url}): {e}")
+        return original, 'image/jpeg'
+
+    write_cache(variant_key, data)
+    return data, 'image/jpeg'
+
+
+def clear_thumbnail_cache():
+    """썸네일 캐시를 모두 삭제합니다."""
+    _store.clear()
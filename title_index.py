@@ -0,0 +1,301 @@
+"""
+영상 제목 역색인 모듈
+- 지금까지 수집한 모든 영상 제목을 글자 n-gram(1~2글자)으로 색인
+- 한글은 띄어쓰기/조사와 무관하게 부분 문자열로 검색되도록 글자 단위로 처리
+- RSS/API로 새 영상이 들어올 때마다 증분 추가, 디스크에 영구 저장
+  (저장은 전용 스레드 하나가 모아서 처리 - 연속 추가 시 한 번만 저장)
+- 여러 키워드 AND/OR 검색
+"""
+
+import os
+import re
+import json
+import time
+import atexit
+import tempfile
+import threading
+import unicodedata
+from data_path import DATA_DIR
+
+TITLE_INDEX_FILE = os.path.join(DATA_DIR, 'title_index.json')
+TITLE_INDEX_VERSION = 1
+
+# 추가 후 저장까지 대기 시간 (초) - 그 사이 추가분은 한 번에 저장
+SAVE_DELAY = 5.0
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_lock = threading.RLock()
+_loaded = False
+_docs = []  # doc_id -> 영상 정보 (videoId, title, channelId, channelTitle, publishedAt, thumbnail)
+_doc_ids = {}  # videoId -> doc_id
+_normalized = []  # doc_id -> 정규화된 제목 (최종 확인용)
+_postings = {}  # n-gram -> set(doc_id)
+_dirty = False
+
+_save_lock = threading.Lock()  # 파일 쓰기 직렬화
+_save_event = threading.Event()
+_save_thread = None
+
+
+def normalize_text(text):
+    """검색용으로 문자열을 정규화합니다 (NFKC, 소문자, 공백 하나로)."""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _ngrams(normalized):
+    """정규화된 문자열의 1글자/2글자 n-gram 집합을 반환합니다 (공백 단독 제외)."""
+    grams = {ch for ch in normalized if ch != ' '}
+    grams.update(normalized[i:i + 2] for i in range(len(normalized) - 1))
+    return grams
+
+
+def _query_grams(normalized):
+    """검색어에서 후보 검색에 쓸 n-gram을 고릅니다 (2글자 우선)."""
+    if len(normalized) >= 2:
+        return {normalized[i:i + 2] for i in range(len(normalized) - 1)}
+    return {normalized} if normalized else set()
+
+
+def _add_doc(video):
+    """영상 하나를 색인에 추가합니다 (이미 있으면 정보만 갱신). 추가 여부 반환."""
+    video_id = video.get('videoId')
+    if not video_id:
+        return False
+
+    doc = {
+        'videoId': video_id,
+        'title': video.get('title', ''),
+        'channelId': video.get('channelId', ''),
+        'channelTitle': video.get('channelTitle', ''),
+        'publishedAt': video.get('publishedAt', ''),
+        'thumbnail': video.get('thumbnail', '')
+    }
+
+    doc_id = _doc_ids.get(video_id)
+    if doc_id is not None:
+        if _docs[doc_id]['title'] == doc['title']:
+            return False
+        # 제목이 바뀐 경우: 예전 n-gram에서 제거 후 다시 색인
+        for gram in _ngrams(_normalized[doc_id]):
+            postings = _postings.get(gram)
+            if postings:
+                postings.discard(doc_id)
+        _docs[doc_id] = doc
+    else:
+        doc_id = len(_docs)
+        _docs.append(doc)
+        _normalized.append('')
+        _doc_ids[video_id] = doc_id
+
+    normalized = normalize_text(doc['title'])
+    _normalized[doc_id] = normalized
+    for gram in _ngrams(normalized):
+        _postings.setdefault(gram, set()).add(doc_id)
+    return True
+
+
+def _ensure_loaded():
+    """디스크에서 색인을 불러옵니다 (최초 1회)."""
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+
+    if not os.path.exists(TITLE_INDEX_FILE):
+        return
+
+    try:
+        with open(TITLE_INDEX_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"[제목 색인] 로드 실패: {e}")
+        return
+
+    if data.get('version') != TITLE_INDEX_VERSION:
+        # 형식이 바뀌었으면 문서만 살려서 다시 색인
+        for doc in data.get('docs', []):
+            _add_doc(doc)
+        return
+
+    _docs.extend(data.get('docs', []))
+    for doc_id, doc in enumerate(_docs):
+        _doc_ids[doc['videoId']] = doc_id
+        _normalized.append(normalize_text(doc['title']))
+    for gram, doc_ids in data.get('postings', {}).items():
+        _postings[gram] = set(doc_ids)
+
+    print(f"[제목 색인] {len(_docs)}개 영상 로드")
+
+
+def save():
+    """변경된 색인을 디스크에 저장합니다 (임시 파일에 쓴 뒤 교체, 프로그램 종료 시 자동 호출)."""
+    global _dirty
+    with _save_lock:
+        # 스냅샷은 락 안에서 복사 (직렬화 중에 색인이 바뀌어도 파일 내용은 일관됨)
+        with _lock:
+            if not _dirty:
+                return
+            data = {
+                'version': TITLE_INDEX_VERSION,
+                'docs': list(_docs),
+                'postings': {gram: sorted(ids) for gram, ids in _postings.items() if ids}
+            }
+            _dirty = False
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix='title_index_', suffix='.tmp', dir=os.path.dirname(TITLE_INDEX_FILE)
+            )
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, TITLE_INDEX_FILE)
+        except Exception as e:
+            print(f"[제목 색인] 저장 실패: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with _lock:
+                _dirty = True  # 다음 저장 때 재시도
+
+
+def _save_loop():
+    while True:
+        _save_event.wait()
+        time.sleep(SAVE_DELAY)  # 잠시 모았다가 한 번에 저장
+        _save_event.clear()
+        save()
+
+
+def schedule_save():
+    """저장 스레드에 저장을 요청합니다 (SAVE_DELAY 안의 요청은 한 번으로 합침)."""
+    global _save_thread
+    with _lock:
+        if _save_thread is None:
+            _save_thread = threading.Thread(target=_save_loop, name='title-index-save', daemon=True)
+            _save_thread.start()
+    _save_event.set()
+
+
+atexit.register(save)
+
+
+def add_videos(videos, persist=True):
+    """
+    수집한 영상을 색인에 증분 추가합니다.
+
+    Args:
+        videos: [{'videoId': ..., 'title': ..., 'channelId': ..., ...}, ...]
+        persist: True면 새로 추가된 영상이 있을 때 저장 스레드에 저장 요청
+
+    Returns:
+        int: 새로 추가(또는 제목 변경)된 영상 수
+    """
+    global _dirty
+    with _lock:
+        _ensure_loaded()
+        added = sum(1 for video in videos if _add_doc(video))
+        if added:
+            _dirty = True
+
+    if added and persist:
+        schedule_save()
+    return added
+
+
+def _match_keyword(keyword):
+    """키워드 하나가 제목에 포함된 doc_id 집합을 반환합니다."""
+    normalized = normalize_text(keyword)
+    if not normalized:
+        return None
+
+    # 후보: 모든 n-gram을 포함하는 문서 (작은 목록부터 교집합)
+    posting_lists = sorted(
+        (_postings.get(gram, set()) for gram in _query_grams(normalized)),
+        key=len
+    )
+    if not posting_lists or not posting_lists[0]:
+        return set()
+
+    candidates = set(posting_lists[0])
+    for postings in posting_lists[1:]:
+        candidates &= postings
+        if not candidates:
+            return candidates
+
+    # 최종 확인: 실제 부분 문자열 포함 여부 (n-gram 순서가 다른 경우 제외)
+    return {doc_id for doc_id in candidates if normalized in _normalized[doc_id]}
+
+
+def parse_query(query):
+    """
+    검색어 문자열을 OR 그룹 리스트로 변환합니다.
+    - '|' 로 구분: OR
+    - ',' 로 구분: AND
+    - 그 외 공백을 포함한 문자열은 하나의 구절로 검색 (기존 부분 문자열 검색과 동일)
+
+    예: '먹방, 브이로그 | 여행' -> [['먹방', '브이로그'], ['여행']]
+    """
+    groups = []
+    for group in (query or '').split('|'):
+        terms = [term.strip() for term in group.split(',') if term.strip()]
+        if terms:
+            groups.append(terms)
+    return groups
+
+
+def search(query=None, all_of=None, any_of=None, channel_ids=None):
+    """
+    색인에서 제목 검색을 수행합니다.
+
+    Args:
+        query: parse_query 형식의 검색어 문자열
+        all_of: 모두 포함해야 하는 키워드 리스트 (AND)
+        any_of: 하나 이상 포함해야 하는 키워드 리스트 (OR)
+        channel_ids: 채널 ID 목록으로 제한 (None이면 전체)
+
+    Returns:
+        set: 조건에 맞는 videoId 집합
+    """
+    groups = parse_query(query) if query else []
+    if all_of:
+        groups.append(list(all_of))
+    if any_of:
+        groups.extend([term] for term in any_of)
+
+    with _lock:
+        _ensure_loaded()
+
+        matched = set()
+        for terms in groups:
+            group_ids = None
+            for term in terms:
+                term_ids = _match_keyword(term)
+                if term_ids is None:
+                    continue
+                group_ids = term_ids if group_ids is None else group_ids & term_ids
+                if not group_ids:
+                    break
+            if group_ids:
+                matched |= group_ids
+
+        if channel_ids is not None:
+            channel_ids = set(channel_ids)
+            matched = {doc_id for doc_id in matched if _docs[doc_id]['channelId'] in channel_ids}
+
+        return {_docs[doc_id]['videoId'] for doc_id in matched}
+
+
+def get_videos(video_ids):
+    """색인에 저장된 영상 정보를 반환합니다 (RSS 수집 결과와 같은 형식)."""
+    with _lock:
+        _ensure_loaded()
+        return [dict(_docs[_doc_ids[vid]]) for vid in video_ids if vid in _doc_ids]
+
+
+def get_index_info():
+    """색인 상태 정보를 반환합니다."""
+    with _lock:
+        _ensure_loaded()
+        return {'videos': len(_docs), 'grams': len(_postings)}
@@ -0,0 +1,403 @@
+"""
+단계별 실행 시간 추적 모듈
+- 중첩 구간(span), 순차 단계(stage), 카운터 기록
+- 작업(job) 단위로 묶어 단계별 소요 시간 요약 표 생성
+- Chrome trace / Perfetto(ui.perfetto.dev)에서 열 수 있는 JSON으로 내보내기
+- 구간 1개당 perf_counter 2회 + 튜플 1개 추가 정도라 상시 켜 두어도 부담이 적음
+
+사용 예:
+    job_id = tracing.begin_job('영상 제작', file='a.mp4')
+    with tracing.span('tts.request', voice='ko-KR-Wavenet-A'):
+        ...
+    tracing.stage('ffmpeg')            # 이전 단계를 닫고 새 단계 시작
+    tracing.count('tts.chars', 120)
+    summary = tracing.end_job(job_id)
+
+    @tracing.traced('render_chunk')
+    def render(...): ...
+"""
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+MAX_EVENTS = 200000  # 메모리에 보관할 최대 이벤트 수 (오래된 것부터 삭제)
+MAX_JOBS = 50  # 요약을 보관할 최대 작업 수
+
+_enabled = True
+_origin_ns = time.perf_counter_ns()
+_pid = os.getpid()
+
+_events = deque(maxlen=MAX_EVENTS)  # (phase, name, cat, ts_us, dur_us, self_us, tid, job_id, args)
+_jobs = {}  # job_id -> {'name', 'args', 'start', 'end', 'counters'}
+_job_order = deque()
+_job_ids = itertools.count(1)
+_jobs_lock = threading.Lock()
+_thread_names = {}
+_local = threading.local()
+
+
+def set_enabled(enabled):
+    """추적을 켜거나 끕니다 (끄면 span/stage/count가 아무 것도 하지 않음)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+def _now_us():
+    return (time.perf_counter_ns() - _origin_ns) // 1000
+
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+        thread = threading.current_thread()
+        _thread_names[thread.ident] = thread.name
+    return stack
+
+
+def current_job():
+    """현재 스레드의 작업 ID (없으면 None)"""
+    return getattr(_local, 'job_id', None)
+
+
+class _Frame:
+    __slots__ = ('name', 'cat', 'start', 'child', 'args', 'is_stage')
+
+    def __init__(self, name, cat, args, is_stage=False):
+        self.name = name
+        self.cat = cat
+        self.start = _now_us()
+        self.child = 0
+        self.args = args
+        self.is_stage = is_stage
+
+
+def _push(name, cat, args, is_stage=False):
+    frame = _Frame(name, cat, args, is_stage)
+    _stack().append(frame)
+    return frame
+
+
+def _pop():
+    stack = _stack()
+    frame = stack.pop()
+    end = _now_us()
+    dur = end - frame.start
+    if stack:
+        stack[-1].child += dur
+    _events.append(('X', frame.name, frame.cat, frame.start, dur, dur - frame.child,
+                    threading.get_ident(), current_job(), frame.args))
+
+
+class span:
+    """
+    중첩 가능한 시간 구간 (with 문)
+
+    Args:
+        name: 구간 이름 (요약 표의 행)
+        cat: 분류 (tts, render, ffmpeg 등)
+        **args: trace에 함께 기록할 값
+    """
+    __slots__ = ('name', 'cat', 'args', '_depth')
+
+    def __init__(self, name, cat='', **args):
+        self.name = name
+        self.cat = cat
+        self.args = args or None
+        self._depth = None
+
+    def __enter__(self):
+        if _enabled:
+            stack = _stack()
+            self._depth = len(stack)
+            _push(self.name, self.cat, self.args)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._depth is not None:
+            # 안쪽에서 닫히지 않은 단계(stage)까지 함께 닫기
+            stack = _stack()
+            while len(stack) > self._depth:
+                _pop()
+            self._depth = None
+        return False
+
+
+def traced(name=None, cat=''):
+    """함수 전체를 하나의 구간으로 기록하는 데코레이터"""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with span(span_name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def stage(name, cat='stage', **args):
+    """
+    순차 단계를 시작합니다. 같은 위치에서 열려 있던 이전 단계는 자동으로 닫힙니다.
+    (긴 함수에서 들여쓰기 변경 없이 단계 구분용) 바깥 span/작업이 끝나면 함께 닫힙니다.
+    """
+    if not _enabled:
+        return
+    stack = _stack()
+    if stack and stack[-1].is_stage:
+        _pop()
+    _push(name, cat, args or None, is_stage=True)
+
+
+def end_stage():
+    """열려 있는 단계를 닫습니다."""
+    if not _enabled:
+        return
+    stack = _stack()
+    if stack and stack[-1].is_stage:
+        _pop()
+
+
+def counter(name, value):
+    """값의 변화를 기록합니다 (trace에 그래프로 표시, 작업 요약에는 최대값)."""
+    if not _enabled:
+        return
+    _events.append(('C', name, 'counter', _now_us(), 0, 0, threading.get_ident(), current_job(), {name: value}))
+    job = _jobs.get(current_job())
+    if job is not None:
+        counters = job['counters']
+        key = f"{name} (최대)"
+        counters[key] = max(counters.get(key, value), value)
+
+
+def count(name, n=1):
+    """작업별 누적 카운터를 증가시킵니다 (예: TTS 글자 수, 캐시 적중 수)."""
+    if not _enabled:
+        return
+    job = _jobs.get(current_job())
+    if job is not None:
+        counters = job['counters']
+        counters[name] = counters.get(name, 0) + n
+
+
+# ========== 작업 단위 ==========
+
+def begin_job(name, **args):
+    """
+    작업 추적을 시작하고 현재 스레드를 작업에 연결합니다.
+
+    Returns:
+        int: 작업 ID (다른 스레드에서는 job_scope로 연결)
+    """
+    if not _enabled:
+        return None
+    job_id = next(_job_ids)
+    with _jobs_lock:
+        _jobs[job_id] = {
+            'name': name, 'args': args, 'start': _now_us(), 'end': None,
+            'counters': {}, 'parent': current_job()
+        }
+        _job_order.append(job_id)
+        while len(_job_order) > MAX_JOBS:
+            _jobs.pop(_job_order.popleft(), None)
+
+    _local.job_id = job_id
+    _local.job_depth = getattr(_local, 'job_depth', None) or {}
+    _local.job_depth[job_id] = len(_stack())
+    _push(name, 'job', args or None)
+    return job_id
+
+
+def end_job(job_id=None, print_summary=True):
+    """
+    작업 추적을 마칩니다 (작업 안에서 열린 구간은 모두 닫힘).
+
+    Returns:
+        list: get_job_summary 결과
+    """
+    job_id = job_id or current_job()
+    job = _jobs.get(job_id)
+    if job is None:
+        return []
+
+    depth = getattr(_local, 'job_depth', {}).pop(job_id, None)
+    if depth is not None:
+        stack = _stack()
+        while len(stack) > depth:
+            _pop()
+    job['end'] = _now_us()
+    if current_job() == job_id:
+        _local.job_id = job['parent']
+
+    if print_summary:
+        print(format_job_summary(job_id))
+    return get_job_summary(job_id)
+
+
+def traced_job(name=None):
+    """함수 실행 전체를 하나의 작업으로 추적하는 데코레이터 (끝나면 요약 표 출력)"""
+    def decorator(func):
+        job_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            job_id = begin_job(job_name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end_job(job_id)
+        return wrapper
+    return decorator
+
+
+class job_scope:
+    """다른 스레드(워커)의 구간을 기존 작업에 연결합니다 (with 문)."""
+    __slots__ = ('job_id', '_previous')
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = current_job()
+        if self.job_id is not None:
+            _local.job_id = self.job_id
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _local.job_id = self._previous
+        return False
+
+
+def get_job_summary(job_id):
+    """
+    작업의 구간 이름별 소요 시간 요약
+
+    Returns:
+        list: [{'name', 'count', 'totalMs', 'selfMs', 'avgMs', 'percent'}, ...] (자기 시간 많은 순)
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        return []
+
+    rows = {}
+    job_total = None
+    for phase, name, _, _, dur, self_us, _, event_job, _ in list(_events):
+        if phase != 'X' or event_job != job_id:
+            continue
+        row = rows.setdefault(name, [0, 0, 0])
+        row[0] += 1
+        row[1] += dur
+        row[2] += self_us
+        if name == job['name']:
+            job_total = dur
+
+    if job_total is None:
+        job_total = (job['end'] or _now_us()) - job['start']
+
+    summary = [
+        {
+            'name': name,
+            'count': cnt,
+            'totalMs': round(total / 1000, 1),
+            'selfMs': round(self_us / 1000, 1),
+            'avgMs': round(total / cnt / 1000, 2),
+            'percent': round(self_us / job_total * 100, 1) if job_total else 0
+        }
+        for name, (cnt, total, self_us) in rows.items()
+    ]
+    summary.sort(key=lambda r: r['selfMs'], reverse=True)
+    return summary
+
+
+def format_job_summary(job_id):
+    """작업 요약을 콘솔용 표 문자열로 반환합니다."""
+    job = _jobs.get(job_id)
+    if job is None:
+        return ''
+
+    elapsed = ((job['end'] or _now_us()) - job['start']) / 1_000_000
+    lines = [
+        f"[추적] {job['name']} - 총 {elapsed:.2f}초",
+        f"  {'구간':<32} {'횟수':>7} {'전체(ms)':>11} {'자기(ms)':>11} {'평균(ms)':>10} {'비율':>7}"
+    ]
+    for row in get_job_summary(job_id):
+        lines.append(
+            f"  {row['name'][:32]:<32} {row['count']:>7} {row['totalMs']:>11.1f} "
+            f"{row['selfMs']:>11.1f} {row['avgMs']:>10.2f} {row['percent']:>6.1f}%"
+        )
+    for name, value in job['counters'].items():
+        lines.append(f"  · {name}: {value}")
+    return '\n'.join(lines)
+
+
+def list_jobs():
+    """보관 중인 작업 목록"""
+    with _jobs_lock:
+        return [
+            {
+                'id': job_id,
+                'name': _jobs[job_id]['name'],
+                'durationMs': round(((_jobs[job_id]['end'] or _now_us()) - _jobs[job_id]['start']) / 1000, 1),
+                'finished': _jobs[job_id]['end'] is not None
+            }
+            for job_id in _job_order if job_id in _jobs
+        ]
+
+
+def export_chrome_trace(path, job_id=None):
+    """
+    Chrome trace 형식(JSON)으로 내보냅니다 (chrome://tracing, ui.perfetto.dev에서 열기).
+
+    Args:
+        path: 저장 경로
+        job_id: 특정 작업만 (None이면 보관 중인 전체)
+
+    Returns:
+        int: 기록한 이벤트 수
+    """
+    trace_events = []
+    tids = set()
+    for phase, name, cat, ts, dur, _, tid, event_job, args in list(_events):
+        if job_id is not None and event_job != job_id:
+            continue
+        event = {'name': name, 'cat': cat or 'default', 'ph': phase, 'ts': ts, 'pid': _pid, 'tid': tid}
+        if phase == 'X':
+            event['dur'] = dur
+        if args:
+            event['args'] = {k: v if isinstance(v, (int, float, bool, type(None))) else str(v)
+                             for k, v in args.items()}
+        trace_events.append(event)
+        tids.add(tid)
+
+    for tid in tids:
+        trace_events.append({
+            'name': 'thread_name', 'ph': 'M', 'pid': _pid, 'tid': tid,
+            'args': {'name': _thread_names.get(tid, str(tid))}
+        })
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+    return len(trace_events)
+
+
+def clear():
+    """기록된 이벤트와 작업을 모두 지웁니다."""
+    with _jobs_lock:
+        _events.clear()
+        _jobs.clear()
+        _job_order.clear()
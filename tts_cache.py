@@ -0,0 +1,160 @@
+"""
+TTS 음성 캐시 모듈
+- 합성 조건(엔진, 음성, 텍스트/SSML, 속도, 피치, 볼륨)의 해시를 키로 MP3를 디스크에 저장
+- 미리듣기/MP3 생성/타임코드/영상 제작 등 모든 합성 경로가 공유 (같은 문장은 한 번만 합성)
+- 용량 초과 시 오래 안 쓴 파일부터 삭제 (disk_lru.DiskLRU), 적중/실패 통계
+- 엔진이 알려준 단어 타이밍은 같은 키의 .json 파일로 함께 저장 (자막용)
+
+사용 예:
+    key = tts_cache.make_key('google', 'ko-KR-Wavenet-A', text, 1.0, 0.0, 0)
+    audio = tts_cache.get(key)
+    if audio is None:
+        audio = ...합성...
+        tts_cache.put(key, audio)
+"""
+
+import os
+import json
+import hashlib
+import threading
+from data_path import CACHE_DIR
+from disk_lru import DiskLRU, write_atomic
+
+TTS_CACHE_DIR = os.path.join(CACHE_DIR, 'tts')
+TTS_CACHE_VERSION = 1  # 저장 형식이 바뀌면 올림 (키가 달라져 이전 파일은 LRU로 정리됨)
+TTS_CACHE_MAX_BYTES = 500 * 1024 * 1024  # 500MB
+TTS_CACHE_TRIM_RATIO = 0.8  # 정리 시 최대 용량의 80%까지 줄임
+
+_enabled = True
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'writes': 0, 'savedChars': 0, 'savedBytes': 0}
+# 용량 제한 저장소 (오디오 .mp3만 용량에 포함, 정리 시 같은 키의 타이밍 .json도 삭제)
+_store = DiskLRU(TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES, TTS_CACHE_TRIM_RATIO,
+                 suffix='.mp3', companion_suffixes=('.json',), label='TTS 캐시')
+
+
+def set_enabled(enabled):
+    """캐시 사용 여부를 설정합니다 (끄면 get은 항상 None, put은 무시)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+def make_key(engine, voice, text, rate=1.0, pitch=0.0, volume_gain_db=0, is_ssml=False):
+    """
+    합성 조건으로 캐시 키를 만듭니다.
+
+    Args:
+        engine: 'google' / 'edge'
+        voice: API 음성 이름
+        text: 합성할 텍스트 또는 SSML
+
+    Returns:
+        str: sha1 16진수 문자열
+    """
+    payload = json.dumps([
+        TTS_CACHE_VERSION, engine, voice or '', text, bool(is_ssml),
+        round(float(rate or 0), 3), round(float(pitch or 0), 3), round(float(volume_gain_db or 0), 3)
+    ], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _cache_path(key):
+    return os.path.join(TTS_CACHE_DIR, key[:2], key + '.mp3')
+
+
+def _timings_path(key):
+    return os.path.join(TTS_CACHE_DIR, key[:2], key + '.json')
+
+
+def get(key, char_count=0):
+    """
+    캐시된 MP3를 반환합니다 (없으면 None). 읽은 파일은 최근 사용으로 표시합니다.
+
+    Args:
+        key: make_key 결과
+        char_count: 통계용 글자 수 (적중 시 절약한 API 글자 수로 기록)
+    """
+    if not _enabled:
+        return None
+    data = _store.read(_cache_path(key))
+    if not data:
+        with _lock:
+            _stats['misses'] += 1
+        return None
+
+    with _lock:
+        _stats['hits'] += 1
+        _stats['savedChars'] += char_count
+        _stats['savedBytes'] += len(data)
+    return data
+
+
+def put(key, data):
+    """MP3를 캐시에 저장합니다 (임시 파일에 쓴 뒤 교체)."""
+    if not _enabled or not data:
+        return
+    if _store.write(_cache_path(key), data):
+        with _lock:
+            _stats['writes'] += 1
+
+
+def get_timings(key):
+    """저장된 단어 타이밍을 반환합니다 (없으면 None, 오디오가 정리된 경우도 None)."""
+    if not _enabled or not os.path.exists(_cache_path(key)):
+        return None
+    try:
+        with open(_timings_path(key), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def put_timings(key, words):
+    """단어 타이밍을 오디오와 같은 키로 저장합니다 (put 이후 호출)."""
+    if not _enabled or words is None:
+        return
+    try:
+        write_atomic(_timings_path(key), json.dumps(words, ensure_ascii=False))
+    except OSError as e:
+        print(f"[TTS 캐시] 타이밍 저장 실패: {e}")
+
+
+def get_stats():
+    """
+    캐시 통계를 반환합니다.
+
+    Returns:
+        dict: {'enabled', 'hits', 'misses', 'hitRate', 'writes', 'evictions',
+               'savedChars', 'savedBytes', 'sizeBytes', 'maxBytes'}
+    """
+    size = _store.size()
+    with _lock:
+        stats = dict(_stats)
+    stats['evictions'] = _store.evictions
+    lookups = stats['hits'] + stats['misses']
+    stats.update({
+        'enabled': _enabled,
+        'hitRate': round(stats['hits'] / lookups * 100, 1) if lookups else 0,
+        'sizeBytes': size,
+        'maxBytes': _store.max_bytes
+    })
+    return stats
+
+
+def clear():
+    """
+    캐시 파일을 모두 삭제합니다.
+
+    Returns:
+        int: 삭제한 파일 수
+    """
+    removed = _store.clear()
+    with _lock:
+        for name in _stats:
+            _stats[name] = 0
+    print(f"[TTS 캐시] 전체 삭제 ({removed}개)")
+    return removed
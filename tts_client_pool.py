@@ -0,0 +1,179 @@
+"""
+TTS 클라이언트 풀 모듈
+- REST API 키마다 keep-alive HTTP 세션을 보관하여 TLS/연결 설정을 재사용
+- 서비스 계정 JSON마다 TextToSpeechClient를 한 번만 생성 (파일이 바뀌면 다시 생성)
+- 모든 TTS 호출 경로(스튜디오 합성, 빠른 TTS, API 키 검증)가 공유
+- 연결 재사용 통계 (요청 수 대비 새로 연 연결 수)
+
+사용 예:
+    r = tts_client_pool.request('post', api_key, url, json=payload, timeout=90)
+    client = tts_client_pool.get_client(service_account_json_path)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+MAX_SESSIONS = 16  # 보관할 최대 세션 수 (오래 안 쓴 것부터 닫음)
+MAX_CLIENTS = 8  # 보관할 최대 SDK 클라이언트 수
+POOL_MAXSIZE = 8  # 세션당 동시 연결 수 (tts_engine 동시 요청 수 이상)
+
+_lock = threading.Lock()
+_sessions = OrderedDict()  # credential -> requests.Session
+_clients = OrderedDict()  # (경로, 수정 시각) -> TextToSpeechClient
+_stats = {'requests': 0, 'sessionsCreated': 0, 'clientHits': 0, 'clientsCreated': 0}
+_closed_connections = 0  # 닫은 세션이 열었던 연결 수 (통계 누적용)
+
+
+def _create_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # 재시도는 호출하는 쪽(_synthesize_chunk)에서 처리
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _session_connections(session):
+    """세션이 지금까지 연 연결 수 (urllib3 연결 풀 기준)"""
+    total = 0
+    try:
+        for adapter in session.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    total += getattr(pool, 'num_connections', 0)
+    except Exception:
+        pass
+    return total
+
+
+def get_session(credential):
+    """
+    인증 정보(API 키)별 keep-alive 세션을 반환합니다.
+
+    Args:
+        credential: API 키 (세션 구분용, None이면 공용 세션)
+    """
+    global _closed_connections
+    key = credential or ''
+    with _lock:
+        session = _sessions.get(key)
+        if session is not None:
+            _sessions.move_to_end(key)
+            return session
+
+        session = _create_session()
+        _sessions[key] = session
+        _stats['sessionsCreated'] += 1
+        while len(_sessions) > MAX_SESSIONS:
+            _, old = _sessions.popitem(last=False)
+            _closed_connections += _session_connections(old)
+            try:
+                old.close()
+            except Exception:
+                pass
+        return session
+
+
+def request(method, credential, url, **kwargs):
+    """
+    풀의 세션으로 HTTP 요청을 보냅니다 (requests.request와 같은 인자).
+
+    Returns:
+        requests.Response
+    """
+    session = get_session(credential)
+    with _lock:
+        _stats['requests'] += 1
+    return session.request(method, url, **kwargs)
+
+
+def get_client(service_account_path=None):
+    """
+    서비스 계정 JSON 파일별 TextToSpeechClient를 반환합니다 (파일이 바뀌면 다시 생성).
+
+    Args:
+        service_account_path: 서비스 계정 JSON 경로 (None이면 기본 인증 정보 사용)
+    """
+    from google.cloud import texttospeech
+
+    if service_account_path:
+        try:
+            mtime = os.path.getmtime(service_account_path)
+        except OSError:
+            mtime = None
+        key = (os.path.normcase(os.path.abspath(service_account_path)), mtime)
+    else:
+        key = ('', None)
+
+    with _lock:
+        client = _clients.get(key)
+        if client is not None:
+            _clients.move_to_end(key)
+            _stats['clientHits'] += 1
+            return client
+
+    # 클라이언트 생성(gRPC 채널)은 잠금 밖에서
+    if service_account_path:
+        from google.oauth2 import service_account
+        creds = service_account.Credentials.from_service_account_file(service_account_path)
+        client = texttospeech.TextToSpeechClient(credentials=creds)
+    else:
+        client = texttospeech.TextToSpeechClient()
+
+    with _lock:
+        existing = _clients.get(key)
+        if existing is not None:
+            return existing
+        # 같은 파일의 이전 버전 클라이언트 제거
+        for old_key in [k for k in _clients if k[0] == key[0]]:
+            _clients.pop(old_key, None)
+        _clients[key] = client
+        _stats['clientsCreated'] += 1
+        while len(_clients) > MAX_CLIENTS:
+            _clients.popitem(last=False)
+    return client
+
+
+def get_stats():
+    """
+    풀 통계를 반환합니다.
+
+    Returns:
+        dict: {'sessions', 'requests', 'connections', 'reusedRequests', 'reuseRate',
+               'sessionsCreated', 'clients', 'clientsCreated', 'clientHits'}
+    """
+    with _lock:
+        sessions = list(_sessions.values())
+        stats = dict(_stats)
+        stats['sessions'] = len(sessions)
+        stats['clients'] = len(_clients)
+        closed = _closed_connections
+
+    connections = closed + sum(_session_connections(s) for s in sessions)
+    reused = max(0, stats['requests'] - connections)
+    stats.update({
+        'connections': connections,
+        'reusedRequests': reused,
+        'reuseRate': round(reused / stats['requests'] * 100, 1) if stats['requests'] else 0
+    })
+    return stats
+
+
+def close_all():
+    """보관 중인 세션과 클라이언트를 모두 닫습니다."""
+    global _closed_connections
+    with _lock:
+        for session in _sessions.values():
+            _closed_connections += _session_connections(session)
+            try:
+                session.close()
+            except Exception:
+                pass
+        _sessions.clear()
+        _clients.clear()
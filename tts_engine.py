@@ -0,0 +1,219 @@
+"""
+동시 TTS 합성 엔진
+- 여러 클립을 동시에 합성하고 결과는 원래 순서대로 반환 (네트워크 대기 시간 겹치기)
+- 엔진/키 그룹별 동시 요청 수 제한 (Google API 키마다, Edge TTS 따로)
+- 기존 취소 이벤트(cancel_event)로 즉시 중지, 클립별 완료 콜백(진행률/로그)
+- 키별 적응형 요청 제한기: 고정 대기 없이 동시 요청, 실제 429를 받을 때만 줄이고 쉼 (AIMD)
+
+사용 예:
+    results = tts_engine.synthesize_ordered(
+        clips,
+        lambda i, clip: synthesize_tts_bytes(...),
+        group_of=lambda i, clip: tts_engine.engine_group(is_edge, profile),
+        cancel_event=app.cancel_event,
+        on_clip_done=lambda i, result, done, total: app.update_progress(...)
+    )
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import tracing
+
+MAX_WORKERS = 8  # 전체 동시 합성 스레드 수
+# 엔진별 그룹당 동시 요청 수 (그룹 = 엔진 또는 (엔진, 키))
+ENGINE_CONCURRENCY = {
+    'google': 4,
+    'google-chunk': 4,  # 긴 텍스트 한 클립 안의 청크 동시 합성
+    'edge': 4,
+}
+DEFAULT_CONCURRENCY = 2
+CANCEL_POLL_INTERVAL = 0.1  # 취소 확인 주기 (초)
+
+# 적응형 요청 제한 (키마다)
+RATE_LIMIT_MAX_CONCURRENCY = 8  # 429가 없을 때 최대 동시 요청 수
+RATE_LIMIT_BACKOFF = 1.0  # 429 후 첫 대기 시간 (초, 연속이면 두 배)
+RATE_LIMIT_BACKOFF_MAX = 30.0
+
+_semaphores = {}
+_semaphores_lock = threading.Lock()
+_rate_limiters = {}
+
+
+class SynthesisCancelled(RuntimeError):
+    """사용자가 중지를 요청해 합성이 취소됨"""
+
+    def __init__(self, message="사용자에 의해 중지되었습니다"):
+        super().__init__(message)
+
+
+class AdaptiveRateLimiter:
+    """
+    동시 요청 수를 스스로 조절하는 제한기 (AIMD)
+    - 성공할 때마다 허용 동시 요청 수를 조금씩 늘림 (최대 max_concurrency)
+    - 429를 받으면 절반으로 줄이고 잠시 새 요청을 멈춤 (Retry-After 우선)
+    """
+
+    def __init__(self, max_concurrency=RATE_LIMIT_MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.inflight = 0
+        self.paused_until = 0.0
+        self.strikes = 0
+        self.rate_limited = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, cancel_event=None):
+        with self._cond:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise SynthesisCancelled()
+                wait_for = self.paused_until - time.monotonic()
+                if wait_for <= 0 and self.inflight < max(1, int(self.limit)):
+                    self.inflight += 1
+                    return
+                self._cond.wait(min(CANCEL_POLL_INTERVAL, wait_for) if wait_for > 0 else CANCEL_POLL_INTERVAL)
+
+    def release(self, success=True):
+        with self._cond:
+            self.inflight = max(0, self.inflight - 1)
+            if success:
+                self.strikes = 0
+                self.limit = min(self.max_concurrency, self.limit + 1.0 / max(1.0, self.limit))
+            self._cond.notify_all()
+
+    def on_rate_limited(self, retry_after=None):
+        """429 응답 - 동시 요청 수를 줄이고 잠시 멈춤"""
+        with self._cond:
+            self.strikes += 1
+            self.rate_limited += 1
+            self.limit = max(1.0, self.limit / 2)
+            if retry_after is None:
+                retry_after = min(RATE_LIMIT_BACKOFF_MAX, RATE_LIMIT_BACKOFF * (2 ** (self.strikes - 1)))
+            self.paused_until = max(self.paused_until, time.monotonic() + float(retry_after))
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, cancel_event=None):
+        """with limiter.slot(): 요청 ... (예외 시 성공으로 세지 않음)"""
+        self.acquire(cancel_event)
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self.release(success)
+
+    def get_stats(self):
+        with self._cond:
+            return {
+                'limit': round(self.limit, 2),
+                'inflight': self.inflight,
+                'rateLimited': self.rate_limited,
+                'pausedFor': round(max(0.0, self.paused_until - time.monotonic()), 1)
+            }
+
+
+def sleep_unless_cancelled(seconds, cancel_event=None):
+    """재시도 대기 - 기다리는 중에 취소되면 바로 SynthesisCancelled 발생"""
+    if cancel_event is None:
+        time.sleep(seconds)
+    elif cancel_event.wait(seconds):
+        raise SynthesisCancelled()
+
+
+def get_rate_limiter(key):
+    """키(API 키/서비스 계정)별 적응형 요청 제한기를 반환합니다."""
+    with _semaphores_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = _rate_limiters[key] = AdaptiveRateLimiter()
+        return limiter
+
+
+def engine_group(is_edge, key=None):
+    """
+    동시 요청 제한 그룹을 정합니다 (Edge TTS는 하나, Google은 키/프로필별).
+
+    Returns:
+        tuple: ('edge',) 또는 ('google', key)
+    """
+    return ('edge',) if is_edge else ('google', key)
+
+
+def _get_semaphore(group):
+    engine = group[0] if isinstance(group, tuple) else group
+    with _semaphores_lock:
+        semaphore = _semaphores.get(group)
+        if semaphore is None:
+            semaphore = _semaphores[group] = threading.BoundedSemaphore(
+                ENGINE_CONCURRENCY.get(engine, DEFAULT_CONCURRENCY)
+            )
+        return semaphore
+
+
+def synthesize_ordered(items, worker, group_of=None, cancel_event=None, on_clip_done=None, max_workers=MAX_WORKERS,
+                       span_name='tts.clip'):
+    """
+    items를 동시에 처리하고 결과를 입력 순서대로 반환합니다.
+
+    Args:
+        items: 클립 목록
+        worker: worker(index, item) -> 결과 (예외 발생 시 전체 중단 후 그대로 전달)
+        group_of: group_of(index, item) -> 동시 요청 제한 그룹 (None이면 'default')
+        cancel_event: set 되면 대기 중인 클립을 취소하고 SynthesisCancelled 발생
+                      (진행 중인 클립이 끝날 때까지 기다린 뒤 반환 - worker도 같은 이벤트로 중지해야 빨리 끝남)
+        on_clip_done: on_clip_done(index, result, done_count, total) - 호출한 스레드에서 완료 순서대로 실행
+        max_workers: 전체 동시 스레드 수
+        span_name: 항목별 tracing span 이름
+
+    Returns:
+        list: items와 같은 순서의 결과
+    """
+    items = list(items)
+    total = len(items)
+    results = [None] * total
+    if not total:
+        return results
+
+    job_id = tracing.current_job()
+
+    def _run(index, item):
+        group = group_of(index, item) if group_of else 'default'
+        semaphore = _get_semaphore(group)
+        # 슬롯을 기다리는 동안에도 취소 확인
+        while not semaphore.acquire(timeout=CANCEL_POLL_INTERVAL):
+            if cancel_event is not None and cancel_event.is_set():
+                raise SynthesisCancelled()
+        try:
+            if cancel_event is not None and cancel_event.is_set():
+                raise SynthesisCancelled()
+            with tracing.job_scope(job_id), tracing.span(span_name, 'tts', index=index):
+                return worker(index, item)
+        finally:
+            semaphore.release()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, total)), thread_name_prefix='tts')
+    futures = {executor.submit(_run, index, item): index for index, item in enumerate(items)}
+    pending = set(futures)
+    done_count = 0
+    try:
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                raise SynthesisCancelled()
+            done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=futures.get):
+                index = futures[future]
+                results[index] = future.result()  # 클립 오류는 그대로 전달 (전체 중단)
+                done_count += 1
+                if on_clip_done:
+                    on_clip_done(index, results[index], done_count, total)
+        return results
+    finally:
+        # 중단/오류 시 시작 전 클립은 취소하고, 진행 중인 클립은 끝날 때까지 기다림
+        # (반환 후에 worker가 결과를 기록하거나 요청을 계속 보내지 않도록)
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -4,10 +4,17 @@ TTS API 키 관리 및 사용량 추적 시스템
 - 모델별 사용량 추적
 - 무료 한도 80% 도달 시 자동 키 전환
 - 매월 1일 자동 리셋
+- 사용량은 메모리 장부에서 바로 갱신, 파일 저장은 주기적/종료 시 한 번에 (write-behind)
+- 저장 전 사용량은 추가 전용 저널에 한 줄씩 기록 → 비정상 종료 후 시작 시 재생
+- 동시 합성 요청을 남은 한도/요청 제한(429) 상태에 따라 여러 키에 분산 (글자 수 예약 후 정산)
 """
 
 import os
 import json
+import copy
+import time
+import atexit
+import itertools
 import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
@@ -16,6 +23,7 @@ from typing import Dict, List, Optional, Tuple
 DATA_DIR = os.path.join(os.path.expanduser('~'), '.audiovis_tts_app_data')
 TTS_KEYS_FILE = os.path.join(DATA_DIR, 'tts_api_keys.json')
 TTS_USAGE_FILE = os.path.join(DATA_DIR, 'tts_usage.json')
+TTS_USAGE_JOURNAL = os.path.join(DATA_DIR, 'tts_usage.journal')
 
 # 디렉토리 생성
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -33,6 +41,13 @@ TTS_FREE_LIMITS = {
 # 사용량 한도 비율 (80%)
 USAGE_LIMIT_RATIO = 0.8
 
+# 사용량 파일 저장 주기 (초) - 그 사이 기록은 저널에 남음
+FLUSH_INTERVAL = 5.0
+
+# 429(요청 제한) 응답을 받은 키를 잠시 쉬게 하는 시간 (초, 연속으로 받으면 두 배씩)
+RATE_LIMIT_COOLDOWN = 2.0
+RATE_LIMIT_COOLDOWN_MAX = 60.0
+
 # 스레드 안전을 위한 락 (RLock으로 재진입 허용)
 _lock = threading.RLock()
 
@@ -67,30 +82,167 @@ def _load_json(filepath: str) -> dict:
 
 
 def _save_json(filepath: str, data: dict) -> bool:
-    """JSON 파일 저장"""
+    """JSON 파일 저장 (임시 파일에 쓴 뒤 교체 - 저장 중 종료되어도 이전 파일 유지)"""
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, filepath)
         return True
     except Exception as e:
         print(f"[TTS Quota] JSON 저장 오류: {e}")
         return False
 
 
+# ========== 메모리 장부 ==========
+
+_keys = None  # 등록된 키 목록 (None이면 아직 로드 전)
+_usage = None  # key_id(str) -> {'month', 'usage', 'last_updated', ...}
+_usage_month = None  # 장부 기준 월 ('YYYY-MM')
+_journal_seq = 0  # 마지막으로 저널에 기록한 번호 (사용량 파일에 함께 저장)
+_journal_file = None
+_dirty = False
+_flush_thread = None
+_flush_event = threading.Event()
+_cursors = {}  # (모델, 단계) -> 활성 키 목록에서 처음 확인할 위치
+_JOURNAL_SEQ_FIELD = '_journal_seq'
+
+
+def _empty_usage() -> dict:
+    return {model: 0 for model in TTS_FREE_LIMITS}
+
+
+def _load_keys() -> list:
+    """키 목록을 한 번만 로드합니다 (변경은 _save_keys로 파일과 함께 갱신)."""
+    global _keys
+    if _keys is None:
+        _keys = _load_json(TTS_KEYS_FILE).get('keys', [])
+    return _keys
+
+
+def _save_keys(keys: list):
+    global _keys
+    _keys = keys
+    _cursors.clear()
+    data = _load_json(TTS_KEYS_FILE)
+    data['keys'] = keys
+    _save_json(TTS_KEYS_FILE, data)
+
+
+def _replay_journal(usage_data: dict, saved_seq: int) -> int:
+    """저장 후 남은 저널 기록을 장부에 반영합니다. 반영한 마지막 번호를 반환합니다."""
+    last_seq = saved_seq
+    try:
+        if not os.path.exists(TTS_USAGE_JOURNAL):
+            return last_seq
+        with open(TTS_USAGE_JOURNAL, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # 기록 중 종료된 마지막 줄
+                seq = entry.get('seq', 0)
+                if seq <= saved_seq:
+                    continue  # 이미 사용량 파일에 반영됨
+                key_usage = usage_data.get(entry['key'])
+                if key_usage is None or key_usage.get('month') != entry.get('month'):
+                    continue
+                usage = key_usage.setdefault('usage', _empty_usage())
+                usage[entry['model']] = usage.get(entry['model'], 0) + entry['chars']
+                key_usage['last_updated'] = entry.get('at', key_usage.get('last_updated', ''))
+                last_seq = max(last_seq, seq)
+    except Exception as e:
+        print(f"[TTS Quota] 저널 복구 오류: {e}")
+    return last_seq
+
+
+def _ensure_loaded() -> dict:
+    """사용량 장부를 처음 한 번 로드하고 (저널 재생 포함) 월이 바뀌었으면 리셋합니다."""
+    global _usage, _usage_month, _journal_seq, _dirty
+    if _usage is None:
+        usage_data = _load_json(TTS_USAGE_FILE)
+        saved_seq = usage_data.pop(_JOURNAL_SEQ_FIELD, 0)
+        _journal_seq = _replay_journal(usage_data, saved_seq)
+        _usage = usage_data
+        _usage_month = None
+        if _journal_seq != saved_seq:
+            print(f"[TTS Quota] 저장되지 않은 사용량 {_journal_seq - saved_seq}건 복구")
+            _dirty = True
+            _flush_locked()
+    _check_and_reset_monthly()
+    return _usage
+
+
+def _flush_locked():
+    """장부를 사용량 파일에 저장하고 저널을 비웁니다 (_lock 안에서 호출)."""
+    global _journal_file, _dirty
+    if _usage is None or not _dirty:
+        return
+    data = dict(_usage)
+    data[_JOURNAL_SEQ_FIELD] = _journal_seq
+    if not _save_json(TTS_USAGE_FILE, data):
+        return  # 저장 실패 시 저널 유지 (다음 주기에 재시도)
+    _dirty = False
+    try:
+        if _journal_file is not None:
+            _journal_file.close()
+            _journal_file = None
+        open(TTS_USAGE_JOURNAL, 'w', encoding='utf-8').close()
+    except Exception as e:
+        print(f"[TTS Quota] 저널 정리 오류: {e}")
+
+
+def flush():
+    """저장 대기 중인 사용량을 즉시 파일에 씁니다 (프로그램 종료 시 자동 호출)."""
+    with _lock:
+        _flush_locked()
+
+
+def _flush_loop():
+    while True:
+        _flush_event.wait(FLUSH_INTERVAL)
+        _flush_event.clear()
+        flush()
+
+
+def _ensure_flush_thread():
+    global _flush_thread
+    if _flush_thread is None:
+        _flush_thread = threading.Thread(target=_flush_loop, name='tts-quota-flush', daemon=True)
+        _flush_thread.start()
+
+
+def _append_journal(key_str: str, model: str, char_count: int, now: str):
+    """사용량 1건을 저널에 추가합니다 (_lock 안에서 호출)."""
+    global _journal_file, _journal_seq
+    _journal_seq += 1
+    try:
+        if _journal_file is None:
+            _journal_file = open(TTS_USAGE_JOURNAL, 'a', encoding='utf-8')
+        _journal_file.write(json.dumps({
+            'seq': _journal_seq, 'key': key_str, 'month': _usage_month,
+            'model': model, 'chars': char_count, 'at': now
+        }) + '\n')
+        _journal_file.flush()
+    except Exception as e:
+        print(f"[TTS Quota] 저널 기록 오류: {e}")
+
+
+atexit.register(flush)
+
+
 # ========== API 키 관리 ==========
 
 def get_tts_api_keys() -> List[dict]:
     """등록된 TTS API 키 목록 반환"""
     with _lock:
-        data = _load_json(TTS_KEYS_FILE)
-        return data.get('keys', [])
+        return [dict(k) for k in _load_keys()]
 
 
 def add_tts_api_key(api_key: str, name: str = '') -> dict:
     """새 TTS API 키 추가"""
     with _lock:
-        data = _load_json(TTS_KEYS_FILE)
-        keys = data.get('keys', [])
+        keys = list(_load_keys())
 
         # 중복 체크
         for key_info in keys:
@@ -106,9 +258,7 @@ def add_tts_api_key(api_key: str, name: str = '') -> dict:
             'active': True
         }
         keys.append(new_key)
-        data['keys'] = keys
-
-        _save_json(TTS_KEYS_FILE, data)
+        _save_keys(keys)
 
         # 사용량 초기화
         _init_usage_for_key(new_key['id'])
@@ -118,20 +268,17 @@ def add_tts_api_key(api_key: str, name: str = '') -> dict:
 
 def remove_tts_api_key(key_id: int) -> dict:
     """TTS API 키 삭제"""
+    global _dirty
     with _lock:
-        data = _load_json(TTS_KEYS_FILE)
-        keys = data.get('keys', [])
-
-        keys = [k for k in keys if k.get('id') != key_id]
-        data['keys'] = keys
-
-        _save_json(TTS_KEYS_FILE, data)
+        keys = [k for k in _load_keys() if k.get('id') != key_id]
+        _save_keys(keys)
 
         # 사용량 데이터도 삭제
-        usage_data = _load_json(TTS_USAGE_FILE)
+        usage_data = _ensure_loaded()
         if str(key_id) in usage_data:
             del usage_data[str(key_id)]
-            _save_json(TTS_USAGE_FILE, usage_data)
+            _dirty = True
+            _flush_locked()
 
         return {'success': True}
 
@@ -139,8 +286,7 @@ def remove_tts_api_key(key_id: int) -> dict:
 def update_tts_api_key(key_id: int, name: str = None, active: bool = None) -> dict:
     """TTS API 키 정보 업데이트"""
     with _lock:
-        data = _load_json(TTS_KEYS_FILE)
-        keys = data.get('keys', [])
+        keys = [dict(k) for k in _load_keys()]
 
         for key_info in keys:
             if key_info.get('id') == key_id:
@@ -150,16 +296,14 @@ def update_tts_api_key(key_id: int, name: str = None, active: bool = None) -> di
                     key_info['active'] = active
                 break
 
-        data['keys'] = keys
-        _save_json(TTS_KEYS_FILE, data)
+        _save_keys(keys)
         return {'success': True}
 
 
 def reorder_tts_api_keys(key_ids: List[int]) -> dict:
     """TTS API 키 순서 변경"""
     with _lock:
-        data = _load_json(TTS_KEYS_FILE)
-        keys = data.get('keys', [])
+        keys = [dict(k) for k in _load_keys()]
 
         # ID로 키 정보 매핑
         key_map = {k['id']: k for k in keys}
@@ -172,8 +316,7 @@ def reorder_tts_api_keys(key_ids: List[int]) -> dict:
                 key_info['id'] = i  # 순서 번호 업데이트
                 new_keys.append(key_info)
 
-        data['keys'] = new_keys
-        _save_json(TTS_KEYS_FILE, data)
+        _save_keys(new_keys)
         return {'success': True}
 
 
@@ -181,49 +324,43 @@ def reorder_tts_api_keys(key_ids: List[int]) -> dict:
 
 def _init_usage_for_key(key_id: int):
     """새 API 키의 사용량 초기화"""
-    usage_data = _load_json(TTS_USAGE_FILE)
+    global _dirty
+    usage_data = _ensure_loaded()
 
     now = datetime.now()
     usage_data[str(key_id)] = {
         'month': now.strftime('%Y-%m'),
-        'usage': {
-            'standard': 0,
-            'wavenet': 0,
-            'neural2': 0,
-            'chirp3': 0,
-            'studio': 0,
-            'polyglot': 0
-        },
+        'usage': _empty_usage(),
         'last_updated': now.isoformat()
     }
-
-    _save_json(TTS_USAGE_FILE, usage_data)
+    _cursors.clear()
+    _dirty = True
+    _flush_locked()
 
 
 def _check_and_reset_monthly():
-    """매월 1일 자동 리셋 체크"""
-    usage_data = _load_json(TTS_USAGE_FILE)
+    """매월 1일 자동 리셋 체크 (장부 기준 월과 같으면 바로 반환)"""
+    global _usage_month, _dirty
     current_month = datetime.now().strftime('%Y-%m')
-    reset_occurred = False
+    if _usage_month == current_month:
+        return False
 
-    for key_id, key_usage in usage_data.items():
+    reset_occurred = False
+    now = datetime.now().isoformat()
+    for key_id, key_usage in _usage.items():
         if key_usage.get('month') != current_month:
             # 새 달이므로 리셋
             key_usage['month'] = current_month
-            key_usage['usage'] = {
-                'standard': 0,
-                'wavenet': 0,
-                'neural2': 0,
-                'chirp3': 0,
-                'studio': 0,
-                'polyglot': 0
-            }
-            key_usage['last_updated'] = datetime.now().isoformat()
-            key_usage['last_reset'] = datetime.now().isoformat()
+            key_usage['usage'] = _empty_usage()
+            key_usage['last_updated'] = now
+            key_usage['last_reset'] = now
             reset_occurred = True
 
+    _usage_month = current_month
+    _cursors.clear()
     if reset_occurred:
-        _save_json(TTS_USAGE_FILE, usage_data)
+        _dirty = True
+        _flush_locked()
         print(f"[TTS Quota] 월간 사용량 리셋 완료: {current_month}")
 
     return reset_occurred
@@ -232,39 +369,44 @@ def _check_and_reset_monthly():
 def get_usage_for_key(key_id: int) -> dict:
     """특정 API 키의 사용량 조회"""
     with _lock:
-        _check_and_reset_monthly()
-        usage_data = _load_json(TTS_USAGE_FILE)
-        return usage_data.get(str(key_id), {})
+        return copy.deepcopy(_ensure_loaded().get(str(key_id), {}))
 
 
 def get_all_usage() -> dict:
     """모든 API 키의 사용량 조회"""
     with _lock:
-        _check_and_reset_monthly()
-        return _load_json(TTS_USAGE_FILE)
+        return copy.deepcopy(_ensure_loaded())
 
 
 def add_usage(key_id: int, voice_name: str, char_count: int) -> dict:
-    """사용량 추가"""
+    """사용량 추가 (메모리 장부 갱신 + 저널 기록, 파일 저장은 주기적으로)"""
+    global _dirty
     with _lock:
-        _check_and_reset_monthly()
-
-        usage_data = _load_json(TTS_USAGE_FILE)
+        usage_data = _ensure_loaded()
         key_str = str(key_id)
 
         if key_str not in usage_data:
             _init_usage_for_key(key_id)
-            usage_data = _load_json(TTS_USAGE_FILE)
 
         model = _get_model_category(voice_name)
-        usage_data[key_str]['usage'][model] += char_count
-        usage_data[key_str]['last_updated'] = datetime.now().isoformat()
+        now = datetime.now().isoformat()
+        usage = usage_data[key_str]['usage']
+        usage[model] = usage.get(model, 0) + char_count
+        usage_data[key_str]['last_updated'] = now
 
-        _save_json(TTS_USAGE_FILE, usage_data)
+        _append_journal(key_str, model, char_count, now)
+        _dirty = True
+        _ensure_flush_thread()
 
         return {'success': True, 'model': model, 'added': char_count}
 
 
+def _used_chars(key_id, model: str) -> int:
+    """장부의 모델별 사용량 (_lock 안에서 호출)"""
+    key_usage = _usage.get(str(key_id))
+    return key_usage['usage'].get(model, 0) if key_usage else 0
+
+
 def get_remaining_quota(key_id: int, voice_name: str) -> Tuple[int, int, float]:
     """
     특정 API 키의 특정 모델 잔여 한도 조회
@@ -273,18 +415,10 @@ def get_remaining_quota(key_id: int, voice_name: str) -> Tuple[int, int, float]:
         (사용량, 한도, 사용비율)
     """
     with _lock:
-        _check_and_reset_monthly()
-
-        usage_data = _load_json(TTS_USAGE_FILE)
-        key_str = str(key_id)
-
-        if key_str not in usage_data:
-            model = _get_model_category(voice_name)
-            limit = TTS_FREE_LIMITS.get(model, 1_000_000)
-            return (0, limit, 0.0)
+        _ensure_loaded()
 
         model = _get_model_category(voice_name)
-        used = usage_data[key_str]['usage'].get(model, 0)
+        used = _used_chars(key_id, model)
         limit = TTS_FREE_LIMITS.get(model, 1_000_000)
         ratio = used / limit if limit > 0 else 1.0
 
@@ -310,6 +444,29 @@ def is_quota_available(key_id: int, voice_name: str, char_count: int = 0) -> boo
 
 # ========== 자동 키 선택 ==========
 
+def _skip_exhausted(active_keys: list, model: str, stage: str, limit_chars: float) -> int:
+    """
+    사용량이 limit_chars에 닿은 앞쪽 키를 건너뛴 위치를 반환합니다 (_lock 안에서 호출).
+    한 달 안에서 사용량은 늘기만 하므로 한도에 닿은 키는 커서를 넘겨 다시 보지 않습니다.
+    """
+    cursor_key = (model, stage)
+    index = _cursors.get(cursor_key, 0)
+    while index < len(active_keys) and _used_chars(active_keys[index]['id'], model) >= limit_chars:
+        index += 1
+    _cursors[cursor_key] = index
+    return index
+
+
+def _first_key_below(active_keys: list, model: str, stage: str, limit_chars: float, char_count: int) -> Optional[dict]:
+    """사용량이 limit_chars 미만이고 이번 요청도 들어가는 첫 번째 키 (_lock 안에서 호출)"""
+    index = _skip_exhausted(active_keys, model, stage, limit_chars)
+    for key_info in active_keys[index:]:
+        used = _used_chars(key_info['id'], model)
+        if used < limit_chars and used + char_count <= limit_chars:
+            return key_info
+    return None
+
+
 def get_available_api_key(voice_name: str, char_count: int = 0) -> Optional[dict]:
     """
     사용 가능한 API 키 자동 선택
@@ -317,48 +474,182 @@ def get_available_api_key(voice_name: str, char_count: int = 0) -> Optional[dict
     - 모든 키가 80% 이상이면 None 반환
     """
     with _lock:
-        _check_and_reset_monthly()
+        _ensure_loaded()
 
-        keys = get_tts_api_keys()
-
-        for key_info in keys:
-            if not key_info.get('active', True):
-                continue
+        active_keys = [k for k in _load_keys() if k.get('active', True)]
+        model = _get_model_category(voice_name)
+        limit = TTS_FREE_LIMITS.get(model, 1_000_000)
 
-            key_id = key_info['id']
-            if is_quota_available(key_id, voice_name, char_count):
-                return {
-                    'key_id': key_id,
-                    'api_key': key_info['key'],
-                    'name': key_info['name']
-                }
+        key_info = _first_key_below(active_keys, model, 'threshold', limit * USAGE_LIMIT_RATIO, char_count)
+        if key_info:
+            return {
+                'key_id': key_info['id'],
+                'api_key': key_info['key'],
+                'name': key_info['name']
+            }
 
         # 80% 이상이지만 100% 미만인 키 찾기 (fallback)
-        for key_info in keys:
-            if not key_info.get('active', True):
-                continue
+        key_info = _first_key_below(active_keys, model, 'limit', limit, 0)
+        if key_info:
+            ratio = _used_chars(key_info['id'], model) / limit if limit > 0 else 1.0
+            return {
+                'key_id': key_info['id'],
+                'api_key': key_info['key'],
+                'name': key_info['name'],
+                'warning': f'80% 초과 사용 중 ({ratio*100:.1f}%)'
+            }
 
-            key_id = key_info['id']
-            used, limit, ratio = get_remaining_quota(key_id, voice_name)
+        return None
 
-            if ratio < 1.0:  # 100% 미만
-                return {
-                    'key_id': key_id,
-                    'api_key': key_info['key'],
-                    'name': key_info['name'],
-                    'warning': f'80% 초과 사용 중 ({ratio*100:.1f}%)'
-                }
 
-        return None
+# ========== 키 분산 스케줄러 ==========
+
+_reservations = {}  # reservation_id -> (key_id, model, 글자 수)
+_reserved = {}  # (key_id, model) -> 예약 중인 글자 수
+_key_health = {}  # key_id -> {'inflight', 'cooldown_until', 'strikes', 'rate_limited'}
+_reservation_ids = itertools.count(1)
+
+
+def _health(key_id) -> dict:
+    state = _key_health.get(key_id)
+    if state is None:
+        state = _key_health[key_id] = {'inflight': 0, 'cooldown_until': 0.0, 'strikes': 0, 'rate_limited': 0}
+    return state
+
+
+def _pick_key(active_keys: list, model: str, stage: str, limit_chars: float, char_count: int, now: float):
+    """
+    예약분까지 더해도 limit_chars 안에 들어가는 키 중 하나를 고릅니다 (_lock 안에서 호출).
+    - 쉬는 중(429)이 아닌 키 중 (남은 글자 수 / (진행 중 요청 + 1))이 가장 큰 키
+    - 모두 쉬는 중이면 가장 먼저 풀리는 키
+    """
+    best, best_score = None, None
+    cooling, cooling_until = None, None
+    for key_info in active_keys[_skip_exhausted(active_keys, model, stage, limit_chars):]:
+        key_id = key_info['id']
+        committed = _used_chars(key_id, model) + _reserved.get((key_id, model), 0)
+        if committed >= limit_chars or committed + char_count > limit_chars:
+            continue
+        state = _health(key_id)
+        if state['cooldown_until'] > now:
+            if cooling_until is None or state['cooldown_until'] < cooling_until:
+                cooling, cooling_until = key_info, state['cooldown_until']
+            continue
+        score = (limit_chars - committed) / (state['inflight'] + 1)
+        if best_score is None or score > best_score:
+            best, best_score = key_info, score
+    return best or cooling
+
+
+def reserve_api_key(voice_name: str, char_count: int = 0) -> Optional[dict]:
+    """
+    동시 요청용 키 선택 - 고른 키에 글자 수를 미리 예약합니다.
+    합성이 끝나면 반드시 settle_reservation으로 정산해야 합니다.
+
+    Returns:
+        {'key_id', 'api_key', 'name', 'reservation_id', ('warning')} 또는 None (모든 키 한도 초과)
+    """
+    with _lock:
+        _ensure_loaded()
+
+        active_keys = [k for k in _load_keys() if k.get('active', True)]
+        model = _get_model_category(voice_name)
+        limit = TTS_FREE_LIMITS.get(model, 1_000_000)
+        now = time.monotonic()
+
+        warning = None
+        key_info = _pick_key(active_keys, model, 'threshold', limit * USAGE_LIMIT_RATIO, char_count, now)
+        if key_info is None:
+            # 80% 이상이지만 100% 미만인 키 (fallback)
+            key_info = _pick_key(active_keys, model, 'limit', limit, char_count, now)
+            if key_info is None:
+                return None
+            committed = _used_chars(key_info['id'], model) + _reserved.get((key_info['id'], model), 0)
+            warning = f'80% 초과 사용 중 ({committed / limit * 100:.1f}%)'
+
+        key_id = key_info['id']
+        reservation_id = next(_reservation_ids)
+        _reservations[reservation_id] = (key_id, model, char_count)
+        _reserved[(key_id, model)] = _reserved.get((key_id, model), 0) + char_count
+        _health(key_id)['inflight'] += 1
+
+        result = {
+            'key_id': key_id,
+            'api_key': key_info['key'],
+            'name': key_info['name'],
+            'reservation_id': reservation_id
+        }
+        if warning:
+            result['warning'] = warning
+        return result
+
+
+def settle_reservation(reservation_id: int, used_chars: int = 0) -> dict:
+    """
+    예약을 정산합니다 - 예약을 풀고 실제 사용한 글자 수만 사용량에 기록합니다.
+
+    Args:
+        reservation_id: reserve_api_key 결과의 reservation_id
+        used_chars: 실제 과금된 글자 수 (실패 시 0)
+    """
+    with _lock:
+        reservation = _reservations.pop(reservation_id, None)
+        if reservation is None:
+            return {'success': False, 'error': '예약을 찾을 수 없습니다.'}
+
+        key_id, model, char_count = reservation
+        remaining = _reserved.get((key_id, model), 0) - char_count
+        if remaining > 0:
+            _reserved[(key_id, model)] = remaining
+        else:
+            _reserved.pop((key_id, model), None)
+
+        state = _health(key_id)
+        state['inflight'] = max(0, state['inflight'] - 1)
+        if used_chars > 0:
+            state['strikes'] = 0  # 정상 응답 → 요청 제한 단계 초기화
+            add_usage(key_id, model, used_chars)  # 카테고리 이름은 그대로 같은 카테고리로 분류됨
+
+        return {'success': True, 'key_id': key_id, 'used': used_chars}
+
+
+def report_rate_limited(key_id: int, retry_after: float = None):
+    """
+    키가 429(요청 제한)를 받았음을 알립니다.
+    쉬는 동안 새 요청은 다른 키로 분산됩니다 (연속 429는 쉬는 시간 두 배, 최대 60초).
+    """
+    with _lock:
+        state = _health(key_id)
+        state['strikes'] += 1
+        state['rate_limited'] += 1
+        if retry_after is None:
+            retry_after = min(RATE_LIMIT_COOLDOWN_MAX, RATE_LIMIT_COOLDOWN * (2 ** (state['strikes'] - 1)))
+        state['cooldown_until'] = max(state['cooldown_until'], time.monotonic() + float(retry_after))
+
+
+def get_scheduler_stats() -> List[dict]:
+    """키별 진행 중 요청 수, 예약 글자 수, 429 횟수, 남은 쉬는 시간"""
+    with _lock:
+        now = time.monotonic()
+        stats = []
+        for key_info in _load_keys():
+            state = _health(key_info['id'])
+            stats.append({
+                'key_id': key_info['id'],
+                'name': key_info['name'],
+                'inflight': state['inflight'],
+                'reserved': sum(n for (k, _), n in _reserved.items() if k == key_info['id']),
+                'rate_limited': state['rate_limited'],
+                'cooldown': round(max(0.0, state['cooldown_until'] - now), 1)
+            })
+        return stats
 
 
 def get_usage_summary() -> List[dict]:
     """모든 API 키의 사용량 요약"""
     with _lock:
-        _check_and_reset_monthly()
-
-        keys = get_tts_api_keys()
-        usage_data = _load_json(TTS_USAGE_FILE)
+        usage_data = _ensure_loaded()
+        keys = _load_keys()
 
         summary = []
         for key_info in keys:
@@ -0,0 +1,126 @@
+"""
+TTS 단어 타이밍 모듈
+- 합성 엔진이 알려주는 단어 위치(Edge TTS WordBoundary, Google TTS SSML mark)로 자막 시간 계산
+- 합성한 음성을 Whisper로 다시 인식할 필요 없음 (Whisper는 외부 오디오에만 사용)
+
+단어 타이밍 형식 (클립 오디오 시작 기준, 초):
+    [{'text': '안녕하세요', 'start': 0.05, 'end': 0.61}, ...]
+"""
+
+from xml.sax.saxutils import escape
+
+_MARK_PREFIX = 'w'
+
+
+def build_marked_ssml(text):
+    """
+    일반 텍스트의 단어마다 <mark>를 넣은 SSML을 만듭니다 (Google TTS 시간 정보 요청용).
+
+    Returns:
+        tuple: (ssml 문자열, 단어 리스트)
+    """
+    tokens = text.split()
+    parts = [f'<mark name="{_MARK_PREFIX}{i}"/>{escape(token)}' for i, token in enumerate(tokens)]
+    return '<speak>' + ' '.join(parts) + '</speak>', tokens
+
+
+def words_from_timepoints(tokens, timepoints):
+    """
+    Google TTS timepoints 응답을 단어 타이밍으로 변환합니다 (끝 시간은 다음 단어 시작).
+
+    Args:
+        tokens: build_marked_ssml이 반환한 단어 리스트
+        timepoints: [{'markName': 'w0', 'timeSeconds': 0.0}, ...]
+    """
+    starts = {}
+    for tp in timepoints or []:
+        name = tp.get('markName', '')
+        if name.startswith(_MARK_PREFIX) and name[len(_MARK_PREFIX):].isdigit():
+            starts[int(name[len(_MARK_PREFIX):])] = float(tp.get('timeSeconds', 0.0))
+
+    words = [{'text': token, 'start': starts[i], 'end': None} for i, token in enumerate(tokens) if i in starts]
+    for current, following in zip(words, words[1:]):
+        current['end'] = following['start']
+    return words
+
+
+def complete_word_timings(words, duration):
+    """끝 시간이 비어 있는 단어(마지막 단어 등)를 클립 길이로 채웁니다."""
+    for word in words:
+        if word.get('end') is None:
+            word['end'] = max(word['start'], duration)
+    return words
+
+
+def _char_count(text):
+    """타이밍 맞춤용 글자 수 (문장 부호/공백 제외 - 엔진마다 부호 처리가 다름)"""
+    return sum(1 for ch in text if ch.isalnum())
+
+
+def segment_times(segments, words, duration):
+    """
+    클립 안에서 나눈 자막 조각마다 (시작, 끝) 시간을 구합니다.
+    조각의 첫 글자가 속한 단어의 시작 시간을 조각 시작으로 사용합니다.
+
+    Args:
+        segments: 자막 조각 텍스트 리스트 (클립 텍스트를 순서대로 나눈 것)
+        words: 단어 타이밍 (없으면 글자 수 비율로 배분)
+        duration: 클립 오디오 길이 (초)
+
+    Returns:
+        list: [(start, end), ...] (클립 시작 기준, 초)
+    """
+    counts = [_char_count(seg) for seg in segments]
+    total = sum(counts)
+
+    if not words or not total:
+        # 타이밍 정보가 없으면 글자 수 비율로 배분
+        times = []
+        current = 0.0
+        for count in counts:
+            length = duration * (count / total) if total else duration / max(1, len(segments))
+            times.append((current, current + length))
+            current += length
+        return times
+
+    # 단어별 누적 글자 위치 (이 위치 이전에 시작하는 글자는 해당 단어 이전)
+    word_offsets = []
+    offset = 0
+    for word in words:
+        word_offsets.append(offset)
+        offset += _char_count(word['text'])
+    scale = offset / total if offset else 1.0  # 엔진이 숫자 등을 다르게 읽어 글자 수가 다를 때 보정
+
+    starts = []
+    position = 0
+    word_index = 0
+    for count in counts:
+        target = position * scale
+        while word_index + 1 < len(words) and word_offsets[word_index + 1] <= target:
+            word_index += 1
+        starts.append(words[word_index]['start'] if position else 0.0)
+        position += count
+
+    times = []
+    for i, start in enumerate(starts):
+        if i + 1 < len(starts):
+            end = starts[i + 1]
+        else:
+            last = words[-1].get('end')
+            end = duration if last is None else min(duration, max(last, start))
+        times.append((start, max(start, end)))
+    return times
+
+
+def speech_span(words, duration):
+    """
+    클립 안에서 실제 말소리가 있는 구간 (첫 단어 시작 ~ 마지막 단어 끝)
+
+    Returns:
+        tuple: (start, end) - 단어 정보가 없으면 (0, duration)
+    """
+    if not words:
+        return 0.0, duration
+    last_end = words[-1].get('end')
+    return words[0]['start'], duration if last_end is None else min(duration, last_end)
+
@@ -816,6 +816,9 @@ let allSearchResults = [];
 let filteredResults = [];
 let displayedCount = 0;
 
+// YouTube 전체 검색 조건 (더 보기용)
+let youtubeGlobalSearchState = null;
+
 // 탭별 검색결과 저장
 const tabSearchResults = {
     'all-channel-monitor': [],
@@ -825,6 +828,14 @@ const tabSearchResults = {
     'mutation': []
 };
 
+// 백엔드에 보관된 검색 결과 (search_videos windowSize 모드)
+// 전체 목록은 백엔드가 갖고, 화면에는 정렬/필터된 구간만 받아 옴
+const RESULT_WINDOW_SIZE = ITEMS_PER_PAGE;
+const tabResultIds = {};    // 탭 → 결과 ID
+let windowedResult = null;  // 현재 탭 결과가 백엔드 보관 중일 때 {resultId, count}
+let windowRequestSeq = 0;   // 정렬/필터 변경 전에 보낸 요청의 늦은 응답 무시용
+let windowLoading = false;
+
 // 초기화
 document.addEventListener('DOMContentLoaded', async () => {
     // 카테고리 설정 불러오기
@@ -1607,7 +1618,7 @@ function setupEventListeners() {
         const { scrollTop, scrollHeight, clientHeight } = resultsList;
         // 스크롤이 하단 200px 이내에 도달하면 더 로드
         if (scrollTop + clientHeight >= scrollHeight - 200) {
-            if (displayedCount < filteredResults.length) {
+            if (displayedCount < getFilteredCount()) {
                 loadMoreResults();
             }
         }
@@ -1620,6 +1631,13 @@ function setupEventListeners() {
         }
     });
 
+    // 창을 닫을 때 백엔드에 보관된 검색 결과 삭제
+    window.addEventListener('beforeunload', () => {
+        for (const tab of Object.keys(tabResultIds)) {
+            releaseTabResult(tab);
+        }
+    });
+
     // 결과 내 검색
     const resultsFilter = document.getElementById('results-filter');
     if (resultsFilter) resultsFilter.addEventListener('input', (e) => {
@@ -1976,8 +1994,9 @@ function doSwitchTab(tab) {
 function loadTabResults(tab) {
     const results = tabSearchResults[tab] || [];
     allSearchResults = results;
+    windowedResult = tabResultIds[tab] ? { resultId: tabResultIds[tab], count: 0 } : null;
 
-    if (results.length > 0) {
+    if (results.length > 0 || windowedResult) {
         resultsSection.style.display = 'flex';
         showExportButtons(true);
 
@@ -2346,6 +2365,7 @@ async function searchYouTubeGlobal(keyword, videoType) {
         progressSection.style.display = 'none';
 
         if (result.success) {
+            youtubeGlobalSearchState = { keyword, daysWithin, videoType };
             displayYouTubeGlobalResults(result.videos, result.stats);
         } else {
             alert('검색 실패: ' + result.error);
@@ -2360,10 +2380,51 @@ async function searchYouTubeGlobal(keyword, videoType) {
     btnSearchKeyword.textContent = '검색';
 }
 
+// YouTube 전체 검색 - 다음 페이지 추가 조회 (nextPageToken)
+async function loadMoreYouTubeGlobal() {
+    if (!youtubeGlobalSearchState) return;
+    const { keyword, daysWithin, videoType } = youtubeGlobalSearchState;
+    const btn = document.getElementById('btn-load-more-global');
+    btn.disabled = true;
+    btn.textContent = '불러오는 중...';
+
+    try {
+        const result = await eel.search_youtube_global(keyword, daysWithin, videoType, true)();
+        progressSection.style.display = 'none';
+
+        if (result.success) {
+            displayYouTubeGlobalResults(result.videos, result.stats);
+        } else {
+            alert('검색 실패: ' + result.error);
+        }
+    } catch (e) {
+        console.error('검색 오류:', e);
+        alert('검색 중 오류가 발생했습니다.');
+    }
+
+    btn.disabled = false;
+    btn.textContent = '더 보기';
+}
+
+// YouTube 전체 검색 "더 보기" 버튼 표시/숨김
+function updateLoadMoreGlobalButton(hasMore) {
+    let btn = document.getElementById('btn-load-more-global');
+    if (!btn) {
+        if (!hasMore) return;
+        resultsList.insertAdjacentHTML('afterend',
+            '<button id="btn-load-more-global" class="btn btn-outline" style="margin:12px auto;">더 보기</button>');
+        btn = document.getElementById('btn-load-more-global');
+        btn.addEventListener('click', loadMoreYouTubeGlobal);
+    }
+    btn.style.display = hasMore ? 'block' : 'none';
+}
+
 // YouTube 전체 검색 결과 표시
 function displayYouTubeGlobalResults(videos, stats) {
+    releaseTabResult('keyword-search');
     resultsSection.style.display = 'flex';
     showExportButtons(true);
+    updateLoadMoreGlobalButton(!!stats.hasMore);
 
     if (videos.length === 0) {
         resultsCount.textContent = `(0개)`;
@@ -2376,7 +2437,7 @@ function displayYouTubeGlobalResults(videos, stats) {
     }
 
     resultsCount.textContent = `(${videos.length}개)`;
-    resultsStats.textContent = `YouTube 전체 "${stats.keyword}" 검색 결과 ${videos.length}개`;
+    resultsStats.textContent = `YouTube 전체 "${stats.keyword}" 검색 결과 ${videos.length}개${stats.fromCache ? ' (캐시)' : ''}`;
 
     // 전체 결과 저장
     allSearchResults = videos;
@@ -2391,8 +2452,10 @@ function displayYouTubeGlobalResults(videos, stats) {
 
 // 인기 동영상 결과 표시
 function displayPopularResults(videos, stats) {
+    releaseTabResult('hot-trend');
     resultsSection.style.display = 'flex';
     showExportButtons(true);
+    updateLoadMoreGlobalButton(false);
 
     // 국가 이름 매핑
     const regionNames = {
@@ -2553,11 +2616,13 @@ async function searchVideos() {
     progressText.textContent = '검색 준비 중...';
 
     try {
-        const result = await eel.search_videos(filterConfig)();
+        const result = await eel.search_videos({ ...filterConfig, windowSize: RESULT_WINDOW_SIZE })();
 
         progressSection.style.display = 'none';
 
-        if (result.success) {
+        if (result.success && result.windowed) {
+            displayWindowedResults(result);
+        } else if (result.success) {
             displayResults(result.videos, result.stats);
         } else if (result.cancelled) {
             // 취소된 경우 알림 없이 조용히 처리
@@ -2589,8 +2654,10 @@ function update_progress(text, percent) {
 }
 
 function displayResults(videos, stats) {
+    releaseTabResult(currentTab);
     resultsSection.style.display = 'flex';
     showExportButtons(true);
+    updateLoadMoreGlobalButton(false);
 
     if (videos.length === 0) {
         resultsCount.textContent = `(0개)`;
@@ -2620,6 +2687,147 @@ function displayResults(videos, stats) {
     updateScrollTopButton();
 }
 
+// 백엔드에 보관된 검색 결과 표시 (첫 구간만 받은 상태)
+function displayWindowedResults(result) {
+    const stats = result.stats;
+    if (stats.filtered === 0) {
+        eel.release_search_results(result.resultId)();
+        displayResults([], stats);
+        return;
+    }
+
+    releaseTabResult(currentTab);
+    resultsSection.style.display = 'flex';
+    showExportButtons(true);
+    updateLoadMoreGlobalButton(false);
+
+    allSearchResults = [];
+    tabSearchResults[currentTab] = [];
+    tabResultIds[currentTab] = result.resultId;
+    windowedResult = { resultId: result.resultId, count: stats.filtered };
+
+    // 모든채널모니터, 채널모니터는 기본 채널별 그룹화
+    const groupByChannel = currentTab === 'all-channel-monitor' || currentTab === 'channel-monitor';
+    if (groupByChannel) {
+        document.getElementById('group-by-channel').checked = true;
+    }
+
+    const query = getResultWindowQuery();
+    if (!groupByChannel && !document.getElementById('group-by-channel').checked &&
+        query.sortKey === result.sortKey && !query.filterText && !query.excludeIds) {
+        // 받은 첫 구간이 현재 정렬/필터와 같으면 그대로 표시
+        windowRequestSeq++;
+        filteredResults = result.videos;
+        displayedCount = 0;
+        resultsList.innerHTML = '';
+        loadMoreResults();
+    } else {
+        applyFiltersAndRender();
+    }
+
+    // 맨 위로 버튼 표시
+    updateScrollTopButton();
+}
+
+// 탭의 백엔드 보관 결과 삭제 (새 결과로 바뀔 때)
+function releaseTabResult(tab) {
+    if (tab === currentTab) {
+        windowedResult = null;
+    }
+    const resultId = tabResultIds[tab];
+    if (!resultId) return;
+    delete tabResultIds[tab];
+    eel.release_search_results(resultId)();
+}
+
+// 화면 정렬/필터 조건 (백엔드 구간 조회용)
+function getResultWindowQuery() {
+    const hideDone = document.getElementById('hide-done').checked;
+    const doneIds = hideDone ? Object.keys(getDoneVideos()) : [];
+    return {
+        sortKey: document.getElementById('sort-option').value,
+        filterText: document.getElementById('results-filter').value.trim(),
+        excludeIds: doneIds.length > 0 ? doneIds : null
+    };
+}
+
+// 백엔드에서 정렬/필터된 구간 조회 (limit이 null이면 끝까지)
+async function fetchResultWindow(offset, limit) {
+    const query = getResultWindowQuery();
+    return await eel.get_search_results_window(
+        windowedResult.resultId, offset, limit, query.sortKey, null, query.filterText, query.excludeIds
+    )();
+}
+
+// 필터 적용 후 전체 개수 (백엔드 보관 중이면 아직 받지 않은 영상 포함)
+function getFilteredCount() {
+    return windowedResult ? windowedResult.count : filteredResults.length;
+}
+
+// 백엔드 보관 결과를 처음 구간부터 다시 표시 (정렬/필터/그룹화 변경 시)
+async function renderResultWindow() {
+    const seq = ++windowRequestSeq;
+    // 채널별 그룹화는 전체 목록이 필요하므로 끝까지 조회
+    const groupByChannel = document.getElementById('group-by-channel').checked;
+    const result = await fetchResultWindow(0, groupByChannel ? null : RESULT_WINDOW_SIZE);
+    if (seq !== windowRequestSeq || !windowedResult) return;
+
+    resultsList.innerHTML = '';
+    displayedCount = 0;
+    if (!result.success) {
+        filteredResults = [];
+        windowedResult.count = 0;
+        resultsList.innerHTML = `<p style="text-align:center;color:#666;padding:40px;">${escapeHtml(result.error)}</p>`;
+        updateResultsHeader();
+        return;
+    }
+
+    filteredResults = result.videos;
+    windowedResult.count = result.count;
+
+    if (result.count === 0) {
+        resultsList.innerHTML = '<p style="text-align:center;color:#666;padding:40px;">조건에 맞는 영상이 없습니다.</p>';
+        updateResultsHeader();
+        return;
+    }
+
+    if (groupByChannel) {
+        renderGroupedResults();
+    } else {
+        loadMoreResults();
+    }
+    updateResultsHeader();
+    updateScrollTopButton();
+}
+
+// 다음 구간을 받아 이어서 표시 (무한 스크롤)
+async function loadMoreResultWindow() {
+    if (windowLoading) return;
+    windowLoading = true;
+    const seq = windowRequestSeq;
+    try {
+        const result = await fetchResultWindow(filteredResults.length, RESULT_WINDOW_SIZE);
+        if (seq !== windowRequestSeq || !windowedResult || !result.success) return;
+        filteredResults = filteredResults.concat(result.videos);
+        windowedResult.count = result.count;
+        if (result.videos.length > 0) {
+            loadMoreResults();
+        }
+    } finally {
+        windowLoading = false;
+    }
+}
+
+// 내보내기용 전체 목록 (백엔드 보관 중이면 아직 받지 않은 구간까지 조회)
+async function loadAllFilteredResults() {
+    if (!windowedResult || filteredResults.length >= windowedResult.count) return;
+    const seq = windowRequestSeq;
+    const result = await fetchResultWindow(0, null);
+    if (seq !== windowRequestSeq || !windowedResult || !result.success) return;
+    filteredResults = result.videos;
+    windowedResult.count = result.count;
+}
+
 // 정렬 함수
 function sortVideos(videos) {
     const sortOption = document.getElementById('sort-option').value;
@@ -2639,12 +2847,16 @@ function sortVideos(videos) {
 
 // 정렬만 다시 적용
 function sortAndRenderResults() {
-    if (allSearchResults.length === 0) return;
+    if (allSearchResults.length === 0 && !windowedResult) return;
     applyFiltersAndRender();
 }
 
 // 필터 및 정렬 적용 후 렌더링
 function applyFiltersAndRender() {
+    if (windowedResult) {
+        renderResultWindow();
+        return;
+    }
     if (allSearchResults.length === 0) return;
 
     let videos = [...allSearchResults];
@@ -2728,7 +2940,7 @@ function renderGroupedResults() {
 
     let html = '';
     for (const group of sortedGroups) {
-        const thumbnail = channelThumbnails[group.channelId] || 'data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><rect fill="%23333" width="100" height="100"/></svg>';
+        const thumbnail = thumbnailProxyUrl(channelThumbnails[group.channelId], 88) || 'data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><rect fill="%23333" width="100" height="100"/></svg>';
 
         html += `
             <div class="channel-group-header" onclick="toggleChannelGroup('${group.channelId}')">
@@ -2765,14 +2977,15 @@ function toggleChannelGroup(channelId) {
 }
 
 function updateResultsHeader() {
-    const showing = Math.min(displayedCount, filteredResults.length);
-    resultsCount.textContent = `(${filteredResults.length}개)`;
+    const total = getFilteredCount();
+    const showing = Math.min(displayedCount, total);
+    resultsCount.textContent = `(${total}개)`;
 
     const filterText = document.getElementById('results-filter').value;
     if (filterText) {
-        resultsStats.textContent = `검색: "${filterText}" (${filteredResults.length}개)`;
+        resultsStats.textContent = `검색: "${filterText}" (${total}개)`;
     } else {
-        resultsStats.textContent = `${showing}/${filteredResults.length}개 표시 중`;
+        resultsStats.textContent = `${showing}/${total}개 표시 중`;
     }
 }
 
@@ -2782,7 +2995,7 @@ function renderVideoItem(video) {
     return `
         <div class="video-item" onclick="window.open('https://www.youtube.com/watch?v=${video.videoId}', '_blank')">
             <div class="video-thumbnail">
-                <img src="${video.thumbnail}" alt="${escapeHtml(video.title)}">
+                <img src="${thumbnailProxyUrl(video.thumbnail, 240)}" alt="${escapeHtml(video.title)}" loading="lazy">
                 <span class="video-duration">${formatDuration(video.duration)}</span>
             </div>
             <div class="video-info">
@@ -2809,6 +3022,13 @@ function renderVideoItem(video) {
 }
 
 function loadMoreResults() {
+    if (windowedResult && displayedCount >= filteredResults.length) {
+        // 받아 둔 구간을 다 표시함 - 백엔드에서 다음 구간 조회
+        if (displayedCount < windowedResult.count) {
+            loadMoreResultWindow();
+        }
+        return;
+    }
     const videosToLoad = filteredResults.slice(displayedCount, displayedCount + ITEMS_PER_PAGE);
     const html = videosToLoad.map(video => renderVideoItem(video)).join('');
 
@@ -2828,7 +3048,8 @@ function scrollToTop() {
 
 function updateScrollTopButton() {
     const btn = document.getElementById('btn-scroll-top');
-    if (allSearchResults.length > ITEMS_PER_PAGE) {
+    const total = windowedResult ? windowedResult.count : allSearchResults.length;
+    if (total > ITEMS_PER_PAGE) {
         btn.style.display = 'block';
     } else {
         btn.style.display = 'none';
@@ -2836,6 +3057,15 @@ function updateScrollTopButton() {
 }
 
 // 유틸리티 함수
+
+// 썸네일을 로컬 캐시 엔드포인트(/thumb)를 거쳐 표시 크기로 받기
+function thumbnailProxyUrl(url, width) {
+    if (!url || !/^https?:\/\/(i9?\.ytimg\.com|yt3\.ggpht\.com|yt3\.googleusercontent\.com)\//.test(url)) {
+        return url;
+    }
+    return `/thumb?w=${width}&url=${encodeURIComponent(url)}`;
+}
+
 function formatNumber(num) {
     if (num >= 10000) {
         return (num / 10000).toFixed(1) + '만';
@@ -3140,7 +3370,8 @@ function formatTimeAgo(timestamp) {
 let exportInProgress = false;
 
 // 내보내기 옵션 모달 열기
-function openExportOptionsModal() {
+async function openExportOptionsModal() {
+    await loadAllFilteredResults();
     if (filteredResults.length === 0) {
         alert('내보낼 결과가 없습니다.');
         return;
@@ -6914,6 +7145,7 @@ async function exportThumbnailsToPDF() {
         const thumbnailUrls = [];
 
         // filteredResults에서 썸네일 URL 추출
+        await loadAllFilteredResults();
         if (!filteredResults || filteredResults.length === 0) {
             alert('출력할 영상이 없습니다.');
             return;
@@ -2410,6 +2410,11 @@ function studioLogFromPython(message) {
     studioLog(message);
 }
 
+eel.expose(studioLogBatchFromPython);
+function studioLogBatchFromPython(messages) {
+    messages.forEach(message => studioLog(message));
+}
+
 eel.expose(studioBlackscreenProgressFromPython);
 function studioBlackscreenProgressFromPython(percent, label) {
     const progressBar = document.getElementById('studio-blackscreen-progress-bar');
@@ -2498,9 +2503,12 @@ function studioBatchComplete(result) {
 async function studioCheckModulesLoaded() {
     try {
         const result = await eel.studio_is_modules_loaded()();
-        if (!result.loaded) {
-            console.warn('[RoyStudio] 핵심 모듈이 로드되지 않았습니다.');
+        if (result.failed && result.failed.length > 0) {
+            console.warn('[RoyStudio] 핵심 모듈 로드 실패:', result.failed.join(', '));
             studioLog('⚠️ 일부 기능이 제한될 수 있습니다.');
+        } else if (!result.loaded) {
+            // 백그라운드 워밍업 중 (첫 스튜디오 작업 시에도 자동 로드됨)
+            console.log('[RoyStudio] 핵심 모듈 백그라운드 로드 중');
         } else {
             console.log('[RoyStudio] 핵심 모듈 로드 확인');
         }
@@ -2190,9 +2190,28 @@ function receiveBackendLog(message, type = 'info') {
     addLog(message, type);
 }
 
+// 백엔드 로그 배치 수신 (entries: [[message, type], ...])
+function receiveBackendLogBatch(entries) {
+    const logContainer = document.getElementById('studio-log');
+    if (!logContainer) return;
+
+    // 한 번에 추가하고 스크롤도 한 번만 (줄마다 레이아웃 계산 방지)
+    const timestamp = new Date().toLocaleTimeString('ko-KR');
+    const fragment = document.createDocumentFragment();
+    for (const [message, type] of entries) {
+        const logEntry = document.createElement('div');
+        logEntry.className = `log-entry ${type}`;
+        logEntry.textContent = `[${timestamp}] ${message}`;
+        fragment.appendChild(logEntry);
+    }
+    logContainer.appendChild(fragment);
+    logContainer.scrollTop = logContainer.scrollHeight;
+}
+
 // eel에 함수 노출
 if (typeof eel !== 'undefined') {
     eel.expose(receiveBackendLog, 'receiveBackendLog');
+    eel.expose(receiveBackendLogBatch, 'receiveBackendLogBatch');
 }
 
 document.addEventListener('DOMContentLoaded', async function() {
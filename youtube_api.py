@@ -5,11 +5,13 @@ YouTube API 호출 모듈
 - 영상 정보 배치 조회
 - 채널 업로드 영상 조회 (playlistItems API)
 - 국가별 인기 동영상 조회
+- 키워드 검색 (페이지 단위)
 - 채널 구독 추가/삭제
 - URL/핸들에서 채널 ID 추출
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, unquote
 
@@ -271,13 +273,14 @@ def get_subscriptions(youtube):
     return subscriptions
 
 
-def get_channels_batch(youtube, channel_ids):
+def get_channels_batch(youtube, channel_ids, http=None):
     """
     채널 정보를 배치로 가져옵니다 (50개씩).
 
     Args:
         youtube: YouTube API 서비스
         channel_ids: 채널 ID 리스트
+        http: 요청에 사용할 HTTP 객체 (병렬 실행 시 스레드별 객체, None이면 서비스 기본값)
 
     Returns:
         dict: {채널ID: {'subscriberCount': 구독자수, 'title': 채널명}, ...}
@@ -296,7 +299,7 @@ def get_channels_batch(youtube, channel_ids):
                 part='snippet,statistics',
                 id=','.join(batch)
             )
-            response = request.execute()
+            response = request.execute(http=http)
 
             for item in response.get('items', []):
                 channel_id = item['id']
@@ -330,13 +333,14 @@ def get_channels_batch(youtube, channel_ids):
     return result
 
 
-def get_videos_batch(youtube, video_ids):
+def get_videos_batch(youtube, video_ids, http=None):
     """
     영상 정보를 배치로 가져옵니다 (50개씩).
 
     Args:
         youtube: YouTube API 서비스
         video_ids: 영상 ID 리스트
+        http: 요청에 사용할 HTTP 객체 (병렬 실행 시 스레드별 객체, None이면 서비스 기본값)
 
     Returns:
         dict: {영상ID: {'viewCount': 조회수, 'duration': 길이(초)}, ...}
@@ -355,7 +359,7 @@ def get_videos_batch(youtube, video_ids):
                 part='statistics,contentDetails',
                 id=','.join(batch)
             )
-            response = request.execute()
+            response = request.execute(http=http)
 
             for item in response.get('items', []):
                 video_id = item['id']
@@ -691,26 +695,49 @@ def get_popular_videos(youtube, region_code='KR', video_category_id=None, max_re
     return videos
 
 
-def search_youtube_videos(youtube, query, days_within=7, video_type='long', max_results=50):
+def _new_thread_http(youtube):
+    """
+    병렬 요청용 독립 HTTP 객체를 생성합니다.
+    httplib2.Http는 스레드 안전하지 않으므로 동시에 실행할 요청마다 새로 만들어야 합니다.
+
+    Returns:
+        AuthorizedHttp 또는 None (생성 불가 시 - 호출자는 순차 실행으로 폴백)
     """
-    YouTube에서 키워드로 영상을 검색합니다.
+    try:
+        import httplib2
+        import google_auth_httplib2
+
+        credentials = getattr(getattr(youtube, '_http', None), 'credentials', None)
+        if credentials is None:
+            return None
+        return google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+    except Exception:
+        return None
+
+
+def search_youtube_videos_page(youtube, query, days_within=7, video_type='long', max_results=50,
+                               page_token=None, published_after=None):
+    """
+    YouTube에서 키워드로 영상을 검색합니다 (한 페이지).
+    search.list 1회(100 유닛) 후 영상/채널 정보 보강은 동시에 실행합니다.
 
     Args:
         youtube: YouTube API 서비스
         query: 검색 키워드
         days_within: 최근 N일 이내 영상만
         video_type: 'long' 또는 'shorts'
-        max_results: 최대 결과 수 (최대 50)
+        max_results: 페이지당 최대 결과 수 (최대 50)
+        page_token: 이전 페이지의 nextPageToken (None이면 첫 페이지)
+        published_after: 기준 시각 (RFC 3339). 다음 페이지 조회 시 첫 페이지와 같은 값을 넘겨야 합니다.
 
     Returns:
-        list: [{'videoId': ..., 'title': ..., 'channelId': ..., 'channelTitle': ...,
-                'thumbnail': ..., 'publishedAt': ..., 'viewCount': ..., 'likeCount': ...,
-                'duration': ..., 'subscriberCount': ...}, ...]
+        dict: {'videos': [...], 'nextPageToken': str 또는 None, 'publishedAfter': str}
     """
     videos = []
 
-    # 기간 계산
-    published_after = (datetime.now() - timedelta(days=days_within)).isoformat() + 'Z'
+    # 기간 계산 (페이지 토큰은 첫 요청의 조건에 묶여 있으므로 기준 시각을 재사용)
+    if not published_after:
+        published_after = (datetime.now() - timedelta(days=days_within)).isoformat() + 'Z'
 
     # 쇼츠/롱폼 구분을 위한 duration 필터
     # short: 4분 이하, medium: 4~20분, long: 20분 이상
@@ -729,9 +756,12 @@ def search_youtube_videos(youtube, query, days_within=7, video_type='long', max_
             'maxResults': min(max_results, 50),
             'regionCode': 'KR'
         }
+        if page_token:
+            search_params['pageToken'] = page_token
 
         request = youtube.search().list(**search_params)
         response = request.execute()
+        next_page_token = response.get('nextPageToken')
 
         # 영상 ID 목록 수집
         video_ids = []
@@ -742,18 +772,23 @@ def search_youtube_videos(youtube, query, days_within=7, video_type='long', max_
             video_snippets[video_id] = item['snippet']
 
         if not video_ids:
-            return videos
-
-        # 영상 상세 정보 조회 (조회수, 좋아요, 길이)
-        video_info = get_videos_batch(youtube, video_ids)
+            return {'videos': videos, 'nextPageToken': next_page_token, 'publishedAfter': published_after}
 
         # 채널 ID 목록 수집
-        channel_ids = set()
-        for snippet in video_snippets.values():
-            channel_ids.add(snippet['channelId'])
-
-        # 채널 구독자 수 조회
-        channel_info = get_channels_batch(youtube, list(channel_ids))
+        channel_ids = list({snippet['channelId'] for snippet in video_snippets.values()})
+
+        # 영상 상세 정보(조회수, 좋아요, 길이)와 채널 구독자 수를 동시에 조회
+        video_http = _new_thread_http(youtube)
+        channel_http = _new_thread_http(youtube)
+        if video_http and channel_http:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                video_future = executor.submit(get_videos_batch, youtube, video_ids, video_http)
+                channel_future = executor.submit(get_channels_batch, youtube, channel_ids, channel_http)
+                video_info = video_future.result()
+                channel_info = channel_future.result()
+        else:
+            video_info = get_videos_batch(youtube, video_ids)
+            channel_info = get_channels_batch(youtube, channel_ids)
 
         # 결과 조합
         for video_id in video_ids:
@@ -801,7 +836,32 @@ def search_youtube_videos(youtube, query, days_within=7, video_type='long', max_
         print(f"YouTube 검색 실패 ({query}): {e}")
         raise e
 
-    return videos
+    return {'videos': videos, 'nextPageToken': next_page_token, 'publishedAfter': published_after}
+
+
+def search_youtube_videos(youtube, query, days_within=7, video_type='long', max_results=50):
+    """
+    YouTube에서 키워드로 영상을 검색합니다 (첫 페이지만).
+
+    Args:
+        youtube: YouTube API 서비스
+        query: 검색 키워드
+        days_within: 최근 N일 이내 영상만
+        video_type: 'long' 또는 'shorts'
+        max_results: 최대 결과 수 (최대 50)
+
+    Returns:
+        list: [{'videoId': ..., 'title': ..., 'channelId': ..., 'channelTitle': ...,
+                'thumbnail': ..., 'publishedAt': ..., 'viewCount': ..., 'likeCount': ...,
+                'duration': ..., 'subscriberCount': ...}, ...]
+    """
+    page = search_youtube_videos_page(
+        youtube, query,
+        days_within=days_within,
+        video_type=video_type,
+        max_results=max_results
+    )
+    return page['videos']
 
 
 def get_video_comments(youtube, video_id, max_results=100):
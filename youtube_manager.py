@@ -17,10 +17,11 @@ from typing import Optional, Dict, List
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 from googleapiclient.errors import HttpError
 
+from youtube_service_pool import service_pool, build_youtube_service
+
 # YouTube API 스코프
 # 모든 YouTube 계정 및 브랜드 계정 관리 권한 포함
 SCOPES = [
@@ -124,7 +125,7 @@ class YouTubeAccountManager:
             creds = flow.run_local_server(port=8080, open_browser=True)
 
             # YouTube API로 채널 정보 가져오기
-            youtube = build('youtube', 'v3', credentials=creds)
+            youtube = build_youtube_service(creds)
             channel_response = youtube.channels().list(
                 part='snippet,statistics',
                 mine=True
@@ -185,6 +186,8 @@ class YouTubeAccountManager:
         if account_name not in self.accounts:
             return False
 
+        service_pool.discard(f'manager:{account_name}')
+
         # 토큰 파일 삭제
         token_file = Path(self.accounts[account_name]['token_file'])
         if token_file.exists():
@@ -196,6 +199,42 @@ class YouTubeAccountManager:
 
         return True
 
+    def _save_credentials(self, account_name: str, creds: Credentials):
+        """갱신된 인증 정보를 토큰 파일에 저장"""
+        if account_name not in self.accounts:
+            return
+        token_file = Path(self.accounts[account_name]['token_file'])
+        with open(token_file, 'wb') as f:
+            pickle.dump(creds, f)
+
+    def _load_credentials(self, account_name: str) -> Optional[Credentials]:
+        """토큰 파일에서 인증 정보 로드 (갱신하지 않음)"""
+        if account_name not in self.accounts:
+            return None
+
+        token_file = Path(self.accounts[account_name]['token_file'])
+        if not token_file.exists():
+            return None
+
+        with open(token_file, 'rb') as f:
+            return pickle.load(f)
+
+    def get_service(self, account_name: str):
+        """
+        계정의 YouTube API 서비스 가져오기 (서비스 풀에서 재사용, 토큰은 백그라운드 선갱신)
+
+        Args:
+            account_name: 계정 이름
+
+        Returns:
+            YouTube API 서비스 객체 또는 None
+        """
+        return service_pool.get(
+            f'manager:{account_name}',
+            lambda: self._load_credentials(account_name),
+            on_refresh=lambda creds: self._save_credentials(account_name, creds)
+        )
+
     def get_credentials(self, account_name: str) -> Optional[Credentials]:
         """
         계정의 인증 정보 가져오기 (자동 갱신)
@@ -206,24 +245,17 @@ class YouTubeAccountManager:
         Returns:
             Credentials 객체 또는 None
         """
-        if account_name not in self.accounts:
-            return None
-
-        token_file = Path(self.accounts[account_name]['token_file'])
-        if not token_file.exists():
-            return None
-
         # 토큰 로드
-        with open(token_file, 'rb') as f:
-            creds = pickle.load(f)
+        creds = self._load_credentials(account_name)
+        if not creds:
+            return None
 
         # 토큰 만료 확인 및 갱신
         if creds.expired and creds.refresh_token:
             try:
                 creds.refresh(Request())
                 # 갱신된 토큰 저장
-                with open(token_file, 'wb') as f:
-                    pickle.dump(creds, f)
+                self._save_credentials(account_name, creds)
             except Exception as e:
                 print(f"토큰 갱신 실패: {e}")
                 return None
@@ -264,12 +296,11 @@ class YouTubeAccountManager:
         Returns:
             {'success': bool, 'channels': List[Dict], 'error': str}
         """
-        creds = self.get_credentials(account_name)
-        if not creds:
+        youtube = self.get_service(account_name)
+        if not youtube:
             return {'success': False, 'error': f'계정 "{account_name}"의 인증 정보를 찾을 수 없습니다.', 'channels': []}
 
         try:
-            youtube = build('youtube', 'v3', credentials=creds)
             channels = []
             channel_ids_seen = set()  # 중복 방지
 
@@ -457,12 +488,11 @@ class YouTubeAccountManager:
         Returns:
             {'success': bool, 'video_id': str, 'video_url': str, 'error': str}
         """
-        creds = self.get_credentials(account_name)
-        if not creds:
+        youtube = self.get_service(account_name)
+        if not youtube:
             return {'success': False, 'error': f'계정 "{account_name}"의 인증 정보를 찾을 수 없습니다.'}
 
         try:
-            youtube = build('youtube', 'v3', credentials=creds)
 
             # 영상 메타데이터
             body = {
@@ -0,0 +1,226 @@
+"""
+YouTube API 서비스 풀 모듈
+- 번들된 디스커버리 문서를 한 번만 읽어 서비스 생성 비용 절감
+- 계정별로 생성된 서비스 객체를 보관하여 계정 전환 시 재사용
+- 만료 전에 백그라운드에서 토큰을 미리 갱신
+- 서비스 하나를 여러 스레드가 함께 써도 안전하도록 HTTP 연결은 스레드마다 따로 사용
+  (httplib2.Http는 스레드 안전하지 않음), 토큰 적용/갱신은 계정별 락으로 직렬화
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+REFRESH_CHECK_INTERVAL = 60  # 백그라운드 갱신 확인 주기 (초)
+REFRESH_AHEAD_MINUTES = 5  # 만료 N분 전에 미리 갱신
+
+_discovery_document = None
+_discovery_lock = threading.Lock()
+
+
+def _get_discovery_document():
+    """googleapiclient에 번들된 YouTube v3 디스커버리 문서를 (한 번만) 파싱해 반환합니다."""
+    global _discovery_document
+    with _discovery_lock:
+        if _discovery_document is None:
+            try:
+                from googleapiclient import discovery_cache
+                content = discovery_cache.get_static_doc('youtube', 'v3')
+                if content:
+                    _discovery_document = json.loads(content)
+            except Exception as e:
+                print(f"[YouTube 서비스] 디스커버리 문서 로드 실패: {e}")
+        return _discovery_document
+
+
+class _LockedCredentials:
+    """
+    요청의 토큰 적용(before_request)과 토큰 갱신(refresh)을 같은 락으로 직렬화하는 인증 정보 래퍼
+    (백그라운드 갱신 중인 토큰을 다른 스레드의 요청이 반쯤 바뀐 상태로 읽지 않도록)
+    """
+
+    def __init__(self, credentials, lock):
+        self._credentials = credentials
+        self._lock = lock
+
+    def before_request(self, request, method, url, headers):
+        with self._lock:
+            self._credentials.before_request(request, method, url, headers)
+
+    def refresh(self, request):
+        with self._lock:
+            self._credentials.refresh(request)
+
+    def __getattr__(self, name):
+        return getattr(self._credentials, name)
+
+
+class _ThreadLocalHttp:
+    """스레드마다 독립 AuthorizedHttp를 쓰는 HTTP 객체 (같은 스레드 안에서는 연결 재사용)"""
+
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self._local = threading.local()
+
+    def _get_http(self):
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import google_auth_httplib2
+            from googleapiclient.http import build_http
+            http = self._local.http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=build_http())
+        return http
+
+    def request(self, *args, **kwargs):
+        return self._get_http().request(*args, **kwargs)
+
+    def close(self):
+        """현재 스레드의 연결을 닫습니다."""
+        http = getattr(self._local, 'http', None)
+        if http is not None:
+            http.close()
+            self._local.http = None
+
+
+def build_youtube_service(credentials, lock=None):
+    """
+    YouTube API 서비스를 생성합니다 (디스커버리 문서 재사용, 네트워크 요청 없음).
+    반환된 서비스는 여러 스레드에서 동시에 요청해도 됩니다.
+
+    Args:
+        credentials: google.oauth2.credentials.Credentials
+        lock: 토큰 갱신과 공유할 락 (None이면 새로 생성)
+
+    Returns:
+        YouTube API 서비스 객체
+    """
+    http = _ThreadLocalHttp(_LockedCredentials(credentials, lock or threading.RLock()))
+
+    document = _get_discovery_document()
+    if document is not None:
+        from googleapiclient.discovery import build_from_document
+        return build_from_document(document, http=http)
+
+    from googleapiclient.discovery import build
+    return build('youtube', 'v3', http=http, cache_discovery=False)
+
+
+def _expires_soon(credentials):
+    """토큰이 곧 만료되는지 확인합니다."""
+    expiry = getattr(credentials, 'expiry', None)
+    if expiry is None:
+        return False
+    # google-auth의 expiry는 naive UTC
+    return expiry - timedelta(minutes=REFRESH_AHEAD_MINUTES) <= datetime.utcnow()
+
+
+class YouTubeServicePool:
+    """계정별 YouTube 서비스 보관 및 토큰 선갱신"""
+
+    def __init__(self):
+        self._entries = {}  # key -> {'service', 'credentials', 'on_refresh', 'lock'}
+        self._lock = threading.RLock()
+        self._refresher = None
+
+    def get(self, key, credentials_loader, on_refresh=None):
+        """
+        계정의 서비스를 반환합니다. 없으면 credentials_loader로 인증 정보를 받아 생성합니다.
+
+        Args:
+            key: 계정 식별 키 (토큰 파일 경로 등)
+            credentials_loader: 인증 정보를 반환하는 함수 (없으면 None 반환)
+            on_refresh: 토큰이 갱신됐을 때 호출할 함수 (credentials) - 저장용
+
+        Returns:
+            YouTube API 서비스 객체 또는 None (여러 스레드가 함께 사용 가능)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry['credentials'].valid:
+                return entry['service']
+
+        credentials = credentials_loader()
+        if not credentials:
+            self.discard(key)
+            return None
+
+        # 만료된 토큰은 이 시점에만 동기 갱신 (이후는 백그라운드에서 미리 갱신)
+        if not credentials.valid:
+            if not (credentials.expired and credentials.refresh_token):
+                return None
+            if not self._refresh(credentials, on_refresh):
+                return None
+
+        return self.put(key, credentials, on_refresh)
+
+    def put(self, key, credentials, on_refresh=None):
+        """인증 정보로 서비스를 생성해 풀에 등록하고 반환합니다."""
+        # 요청의 토큰 적용과 백그라운드 갱신이 함께 쓰는 계정별 락
+        credentials_lock = threading.RLock()
+        service = build_youtube_service(credentials, credentials_lock)
+        with self._lock:
+            self._entries[key] = {
+                'service': service,
+                'credentials': credentials,
+                'on_refresh': on_refresh,
+                'lock': credentials_lock
+            }
+        self._ensure_refresher()
+        return service
+
+    def discard(self, key):
+        """풀에서 계정을 제거합니다 (로그아웃, 계정 삭제 시)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """풀을 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def _refresh(self, credentials, on_refresh, lock=None):
+        """토큰을 갱신하고 저장 콜백을 호출합니다 (lock: 요청 실행과 공유하는 계정별 락)."""
+        try:
+            from google.auth.transport.requests import Request
+            if lock is None:
+                credentials.refresh(Request())
+            else:
+                with lock:
+                    credentials.refresh(Request())
+        except Exception as e:
+            print(f"[YouTube 서비스] 토큰 갱신 실패: {e}")
+            return False
+
+        if on_refresh:
+            try:
+                on_refresh(credentials)
+            except Exception as e:
+                print(f"[YouTube 서비스] 갱신 토큰 저장 실패: {e}")
+        return True
+
+    def _ensure_refresher(self):
+        """백그라운드 갱신 스레드를 시작합니다 (한 번만)."""
+        with self._lock:
+            if self._refresher and self._refresher.is_alive():
+                return
+            self._refresher = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._refresher.start()
+
+    def _refresh_loop(self):
+        """만료가 임박한 토큰을 미리 갱신합니다."""
+        while True:
+            time.sleep(REFRESH_CHECK_INTERVAL)
+            with self._lock:
+                entries = list(self._entries.items())
+
+            for key, entry in entries:
+                credentials = entry['credentials']
+                if not credentials.refresh_token or not _expires_soon(credentials):
+                    continue
+                if not self._refresh(credentials, entry['on_refresh'], entry['lock']):
+                    # 갱신 불가 (토큰 폐기 등) - 다음 요청 시 다시 로드하도록 제거
+                    self.discard(key)
+
+
+# 전역 인스턴스
+service_pool = YouTubeServicePool()
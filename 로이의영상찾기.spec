@@ -9,7 +9,7 @@ a = Analysis(
         ('web', 'web'),
         ('D:\\RoyYoutubeSearch\\venv\\Lib\\site-packages\\whisper\\assets', 'whisper\\assets'),
     ],
-    hiddenimports=[],
+    hiddenimports=['studio_utils', 'studio_services'],  # 지연 로딩 모듈 (lazy_loader)
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],